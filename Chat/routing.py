@@ -4,12 +4,15 @@ from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.security.websocket import AllowedHostsOriginValidator
 
+from chat.buffer import BufferLifespan
 from public_chat.consumers import PublicChatConsumer
 from chat.consumers import ChatConsumer
 from notification.consumers import NotificationConsumer
 
 
 application = ProtocolTypeRouter({
+    # 服务器关闭时写入聊天消息写缓冲（支持 lifespan 的服务器，例如 uvicorn）
+    'lifespan': BufferLifespan,
     'websocket': AllowedHostsOriginValidator(
         AuthMiddlewareStack(
             URLRouter([
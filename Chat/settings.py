@@ -19,6 +19,9 @@ if DEBUG:
 
 ALLOWED_HOSTS = []
 
+# 可以访问 /metrics/ 的地址
+INTERNAL_IPS = ['127.0.0.1']
+
 AUTH_USER_MODEL = "account.Account"
 AUTHENTICATION_BACKENDS = (
     'django.contrib.auth.backends.AllowAllUsersModelBackend',
@@ -35,6 +38,7 @@ INSTALLED_APPS = [
     'public_chat',
     'chat',
     'notification',
+    'metrics',
 
     # 自带app
     'django.contrib.admin',
@@ -42,7 +46,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'Chat.staticfiles.StaticFilesConfig',  # django.contrib.staticfiles，收集时跳过 STATICFILES_IGNORE_PATTERNS
     'django.contrib.humanize',
 
     # 3rd apps
@@ -106,6 +110,77 @@ CHANNEL_LAYERS = {
     }
 }
 
+# 公共聊天室在线状态（public_chat/presence.py），测试时可用 InMemoryPresenceBackend
+PRESENCE = {
+    'BACKEND': 'public_chat.presence.RedisPresenceBackend',
+    'CONFIG': {
+        "hosts": [('127.0.0.1', 6379)],
+        "ttl": 60,  # 秒，worker崩溃后连接多久过期
+    }
+}
+# 每个公共聊天室在线人数最多多久广播一次（秒）
+CONNECTED_USER_COUNT_INTERVAL = 1.0
+# 进程内公共聊天室缓存（public_chat/consumers.py）：最多缓存的房间数，以及后台修改/删除房间后多久生效（秒）
+PUBLIC_ROOM_CACHE_SIZE = 1000
+PUBLIC_ROOM_CACHE_TIMEOUT = 60
+
+# 聊天消息写缓冲（chat/buffer.py）：达到数量或时间阈值时批量写入数据库。
+# 正常关闭（SIGTERM、lifespan.shutdown）时会写入剩余消息；进程被 SIGKILL 时最多丢失这么多条/这么久的消息
+CHAT_MESSAGE_BUFFER_SIZE = 100
+CHAT_MESSAGE_FLUSH_INTERVAL = 0.5  # 秒
+
+# 聊天室最近消息缓存（chat/cache.py）：打开房间时的第一页聊天记录
+# 多个worker部署时 'chat' 应改为共享缓存（例如 memcached），否则每个进程各有一份
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'chat': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'chat-recent-messages',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+CHAT_RECENT_CACHE_ALIAS = 'chat'
+CHAT_RECENT_CACHE_TIMEOUT = 60 * 60  # 秒，冷门房间过期
+CHAT_RECENT_CACHE_LOCAL_ROOMS = 1000  # 进程内LRU的房间数
+CHAT_RECENT_CACHE_LOCAL_TTL = 1.0  # 秒，进程内缓存的有效期
+CHAT_PRIVATE_ROOM_CACHE_SIZE = 10000  # 进程内 用户对 -> 私聊id 缓存的条数
+
+# 可能认识的人：每个用户保留的推荐数（friend.recommendations）
+FRIEND_SUGGESTION_COUNT = 10
+
+# 搜索框自动补全的进程内用户名索引，超过这么久（秒）后台重新加载，其他进程的修改在此之后可见
+ACCOUNT_SEARCH_INDEX_TTL = 600
+
+# 通知保留策略（prune_notifications 管理命令）：删除早于这么多天的已读通知，每个用户只保留最新的这么多条已读通知
+NOTIFICATION_RETENTION_DAYS = 90
+NOTIFICATION_KEEP_LAST = 200
+NOTIFICATION_RETENTION_BATCH_SIZE = 1000
+
+
+# 日志：consumer中每条消息的日志是DEBUG级别，默认关闭
+LOG_LEVEL = os.environ.get('CHAT_LOG_LEVEL', 'INFO')
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '%(asctime)s %(levelname)s %(name)s: %(message)s',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        app: {'handlers': ['console'], 'level': LOG_LEVEL, 'propagate': False}
+        for app in ('account', 'chat', 'friend', 'notification', 'public_chat', 'metrics')
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -144,11 +219,28 @@ USE_TZ = True
 
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
-    os.path.join(BASE_DIR, 'media'),
 ]
 STATIC_URL = '/static/'
 MEDIA_URL = '/media/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'static_cdn')
+# collectstatic 生成带内容哈希的文件名、staticfiles.json 清单和 .gz/.br 预压缩文件（见 Chat/staticfiles.py）
+STATICFILES_STORAGE = 'Chat.staticfiles.CompressedManifestStaticFilesStorage'
+# 不收集第三方库的源码、测试、文档和构建配置，页面只使用 dist / min 文件
+STATICFILES_IGNORE_PATTERNS = [
+    'cropperjs/src/*',
+    'cropperjs/test/*',
+    'cropperjs/docs/*',
+    'cropperjs/types/*',
+    'collections/test/*',
+    'collections/demo/*',
+    'collections/bench/*',
+    'karma.conf.js',
+    'rollup.config.js',
+    'postcss.config.js',
+    'package.json',
+    'package-lock.json',
+    'bower.json',
+]
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media_cdn')
 
 TEMP = os.path.join(BASE_DIR, 'media_cdn/temp')
@@ -156,6 +248,15 @@ TEMP = os.path.join(BASE_DIR, 'media_cdn/temp')
 BASE_URL = "http://127.0.0.1:8000"
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
+# 上传的头像解码后的最大像素数（宽*高），解码后每个像素3字节
+PROFILE_IMAGE_MAX_PIXELS = 25000000
+# 头像处理进程池（account.images）：process 在子进程中执行，local 在请求线程中同步执行（测试用）
+IMAGE_POOL_MODE = "process"
+IMAGE_POOL_WORKERS = 2
+# 排队和正在执行的任务数上限，超过时拒绝上传
+IMAGE_POOL_QUEUE_LIMIT = 20
+# 单个任务的最长等待时间（秒）
+IMAGE_POOL_TIMEOUT = 30
 
 if DEBUG:
     import mimetypes
@@ -0,0 +1,74 @@
+"""
+静态资源构建：python manage.py collectstatic --clear
+
+- StaticFilesConfig: 收集时跳过 STATICFILES_IGNORE_PATTERNS（第三方库的源码、测试、文档等，页面只引用 dist 中的文件）
+- CompressedManifestStaticFilesStorage: 文件名包含内容哈希（模板中的 {% static %} 通过 staticfiles.json 清单解析），
+  并为哈希后的文本文件生成 .gz / .br 预压缩文件，由web服务器直接发送（nginx gzip_static / brotli_static），
+  哈希后的文件内容不会改变，可以永久缓存
+
+DEBUG 时 {% static %} 返回原文件名，不需要先执行 collectstatic；
+DEBUG=False 时必须先执行 collectstatic 生成清单，否则模板中引用的静态文件会报错。
+"""
+import gzip
+import logging
+
+from django.conf import settings
+from django.contrib.staticfiles.apps import StaticFilesConfig as BaseStaticFilesConfig
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # 没有安装 Brotli 时只生成 .gz
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 预压缩这些类型的文件（图片、字体等已经压缩过）
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".map", ".json", ".svg", ".txt", ".html", ".xml", ".ico", ".eot", ".ttf")
+# 小于这个大小（字节）的文件不压缩
+MIN_COMPRESS_SIZE = 256
+
+
+class StaticFilesConfig(BaseStaticFilesConfig):
+
+    @property
+    def ignore_patterns(self):
+        return BaseStaticFilesConfig.ignore_patterns + list(getattr(settings, "STATICFILES_IGNORE_PATTERNS", []))
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        compressed = 0
+        for name in sorted(set(self.hashed_files.values())):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                compressed += self._compress(name)
+        logger.info("CompressedManifestStaticFilesStorage: %s precompressed files written", compressed)
+
+    def _compress(self, name):
+        """
+        写入 name.gz 和 name.br，返回写入的文件数。
+        文件名包含内容哈希，已经存在的压缩文件不需要重新生成；压缩后没有变小时不写入
+        """
+        with self.open(name) as f:
+            content = f.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return 0
+        encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+        written = 0
+        for suffix, encode in encoders:
+            target = name + suffix
+            if self.exists(target):
+                continue
+            data = encode(content)
+            if len(data) >= len(content):
+                continue
+            self.save(target, ContentFile(data))
+            written += 1
+        return written
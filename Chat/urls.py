@@ -13,6 +13,7 @@ from apps.account.views import (
     login_view,
     logout_view,
     account_search_view,
+    account_autocomplete_view,
 )
 
 
@@ -26,7 +27,9 @@ urlpatterns = [
     path('login/', login_view, name='login'),
     path('logout/', logout_view, name='logout'),
     path('search/', account_search_view, name="search"),
+    path('search/autocomplete/', account_autocomplete_view, name="search-autocomplete"),  # 搜索框自动补全
     path('chat/', include('chat.urls', namespace='chat')),  # 私聊
+    path('metrics/', include('metrics.urls', namespace='metrics')),  # Prometheus指标
 
     # Password reset links (ref: https://github.com/django/django/blob/master/django/contrib/auth/views.py)
     path('password_change/done/',
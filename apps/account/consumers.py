@@ -0,0 +1,60 @@
+"""
+已连接的socket中 scope["user"] 是连接时加载的用户实例，用户修改头像之后不会自动更新：
+聊天消息（build_chat_message_frame）和最近消息缓存（history_row）会继续使用旧的 avatar_hash。
+
+AccountEventsConsumerMixin 让已登录用户的socket加入 account_group_name(user.id) 组，
+push_avatar_hash 推送新的 avatar_hash，更新所有已连接socket中的用户实例。
+"""
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+
+def account_group_name(user_id):
+    """
+    用户所有已连接的 ChatConsumer / PublicChatConsumer 加入的组
+    """
+    return f"Account-{user_id}"
+
+
+def push_avatar_hash(user_id, avatar_hash):
+    """
+    推送失败不影响调用方（重新连接后使用数据库中的 avatar_hash）
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(account_group_name(user_id), {
+            "type": "account.avatar",  # AccountEventsConsumerMixin.account_avatar()
+            "avatar_hash": avatar_hash,
+        })
+    except Exception:
+        logger.exception("push_avatar_hash: group_send failed")
+
+
+class AccountEventsConsumerMixin:
+    """
+    放在 AsyncJsonWebsocketConsumer 之前，已登录用户连接时加入 account_group_name 组，断开时离开
+    """
+
+    async def websocket_connect(self, message):
+        user = self.scope["user"]
+        if user.is_authenticated:
+            await self.channel_layer.group_add(account_group_name(user.id), self.channel_name)
+        await super().websocket_connect(message)
+
+    async def websocket_disconnect(self, message):
+        user = self.scope["user"]
+        if user.is_authenticated:
+            await self.channel_layer.group_discard(account_group_name(user.id), self.channel_name)
+        await super().websocket_disconnect(message)
+
+    async def account_avatar(self, event):
+        """
+        用户修改了头像（Account.save_avatar_variants）
+        """
+        self.scope["user"].avatar_hash = event["avatar_hash"]
@@ -0,0 +1,170 @@
+"""
+头像图片处理的进程池，web worker 中不解码、裁剪、编码图片。
+
+crop_image_view 检查参数后把任务提交给 image_pool 就返回，结果通过用户的通知socket推送
+（NotificationConsumer.notification_profile_image）：
+
+- process 模式：account.utils.process_profile_image 在 IMAGE_POOL_WORKERS 个进程中执行，
+  同样数量的调度线程等待结果（最多 IMAGE_POOL_TIMEOUT 秒），保存文件后推送
+- local 模式：在调用线程中同步执行，view 返回之前已经推送（测试用）
+
+Account.save 保存了新上传的头像原图之后，缩略图也在这里生成（submit_avatar_variants，事务提交之后提交）。
+
+排队和正在执行的任务达到 IMAGE_POOL_QUEUE_LIMIT 个时拒绝新任务（ImagePoolFull）。
+"""
+import logging
+import multiprocessing
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import connection
+
+from notification.utils import push_to_user
+from .utils import make_avatar_variants, process_profile_image
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePoolFull(Exception):
+    pass
+
+
+class ImagePool:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._processes = None
+        self._dispatchers = None
+
+    @property
+    def mode(self):
+        return getattr(settings, "IMAGE_POOL_MODE", "process")
+
+    @property
+    def workers(self):
+        return getattr(settings, "IMAGE_POOL_WORKERS", 2)
+
+    @property
+    def queue_limit(self):
+        return getattr(settings, "IMAGE_POOL_QUEUE_LIMIT", 20)
+
+    @property
+    def timeout(self):
+        return getattr(settings, "IMAGE_POOL_TIMEOUT", 30)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def submit_crop(self, user_id, image_bytes, x, y, width, height):
+        """
+        提交裁剪头像的任务，返回任务id（推送的结果中带有这个id）。
+        队列已满时抛出 ImagePoolFull
+        """
+        job_id = uuid.uuid4().hex
+        args = (image_bytes, x, y, width, height)
+        if self.mode == "local":
+            self._run(job_id, user_id, args, local=True)
+            return job_id
+        self._dispatch(self._run, job_id, user_id, args)
+        return job_id
+
+    def submit_avatar_variants(self, user_id):
+        """
+        用户上传了新的头像原图（Account.save）：在进程池中生成缩略图并保存，不推送结果。
+        不受 IMAGE_POOL_QUEUE_LIMIT 限制（原图已经保存，不能因为队列已满而不生成缩略图）
+        """
+        if self.mode == "local":
+            self._run_avatar_variants(user_id, local=True)
+            return
+        self._dispatch(self._run_avatar_variants, user_id, limited=False)
+
+    def _dispatch(self, func, *args, limited=True):
+        """
+        在调度线程中执行 func(*args)，limited 时队列已满抛出 ImagePoolFull
+        """
+        with self._lock:
+            if limited and self._pending >= self.queue_limit:
+                raise ImagePoolFull("The server is busy processing images, please try again later.")
+            self._pending += 1
+            if self._dispatchers is None:
+                self._dispatchers = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image-pool")
+            dispatchers = self._dispatchers
+        try:
+            dispatchers.submit(func, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def _run(self, job_id, user_id, args, local=False):
+        """
+        执行一个任务并推送结果，在调度线程（local 模式为调用线程）中执行
+        """
+        try:
+            result = process_profile_image(*args) if local else self._process(process_profile_image, args)
+            payload = {"result": "success", "cropped_profile_image": _store_cropped_image(user_id, result)}
+        except Exception as e:
+            logger.exception("ImagePool: job %s of user %s failed", job_id, user_id)
+            payload = {"result": "error", "exception": str(e)}
+        finally:
+            self._finish(local)
+        push_to_user(user_id, {"type": "notification.profile_image", "job_id": job_id, **payload})
+
+    def _run_avatar_variants(self, user_id, local=False):
+        from account.models import Account
+
+        try:
+            user = Account.objects.get(pk=user_id)
+            with user.profile_image.open("rb") as f:
+                image_bytes = f.read()
+            args = (image_bytes,)
+            user.save_avatar_variants(*(make_avatar_variants(*args) if local
+                                        else self._process(make_avatar_variants, args)))
+        except Exception:
+            logger.exception("ImagePool: avatar variants of user %s failed", user_id)
+        finally:
+            self._finish(local)
+
+    def _finish(self, local):
+        if not local:
+            with self._lock:
+                self._pending -= 1
+            # 调度线程自己的数据库连接
+            connection.close()
+
+    def _process(self, func, args):
+        with self._lock:
+            if self._processes is None:
+                # spawn：不fork已经运行了事件循环和各种线程的服务器进程
+                self._processes = ProcessPoolExecutor(max_workers=self.workers,
+                                                      mp_context=multiprocessing.get_context("spawn"))
+            processes = self._processes
+        future = processes.submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 已经开始执行的任务无法取消，结果会被丢弃
+            future.cancel()
+            raise ValueError(f"Image processing timed out after {self.timeout} seconds.")
+        except BrokenProcessPool:
+            # 工作进程异常退出（例如内存不足被杀死），下一个任务重新创建进程池
+            with self._lock:
+                if self._processes is processes:
+                    self._processes = None
+            raise ValueError("Image processing failed.")
+
+
+def _store_cropped_image(user_id, result):
+    from account.models import Account
+
+    user = Account.objects.get(pk=user_id)
+    user.set_cropped_profile_image(*result)
+    return user.profile_image.url
+
+
+image_pool = ImagePool()
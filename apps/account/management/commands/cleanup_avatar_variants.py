@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from account.models import Account
+
+
+class Command(BaseCommand):
+    help = "删除用户修改头像之前的旧缩略图（定期执行，例如每小时一次）"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age", type=int, default=getattr(settings, "CHAT_RECENT_CACHE_TIMEOUT", 60 * 60),
+            help="当前的缩略图保存超过这么多秒之后才删除旧的缩略图（默认为最近消息缓存的过期时间）")
+
+    def handle(self, *args, **options):
+        deleted = failed = 0
+        for account in Account.objects.exclude(avatar_hash="").only("id", "profile_image", "avatar_hash").iterator():
+            try:
+                deleted += account.delete_old_avatar_variants(options["min_age"])
+            except OSError as e:
+                self.stderr.write(f"user {account.pk}: {e}")
+                failed += 1
+        self.stdout.write(f"deleted {deleted} old avatar files, {failed} failed")
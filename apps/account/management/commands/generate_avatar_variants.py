@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from account.models import Account
+from account.utils import get_default_profile_image
+
+
+class Command(BaseCommand):
+    help = "为已经上传了头像、还没有缩略图的用户生成头像缩略图（部署头像缩略图之后执行一次）"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="重新生成所有用户的缩略图（内容没有变化时不会重写）")
+
+    def handle(self, *args, **options):
+        accounts = Account.objects.exclude(profile_image="").exclude(profile_image=get_default_profile_image())
+        if not options["all"]:
+            accounts = accounts.filter(avatar_hash="")
+        generated = failed = 0
+        for account in accounts.only("id", "profile_image", "avatar_hash").iterator():
+            try:
+                account.update_avatar_variants()
+            except OSError as e:
+                # 原图文件已经不存在等
+                self.stderr.write(f"user {account.pk}: {e}")
+                failed += 1
+                continue
+            generated += bool(account.avatar_hash)
+        self.stdout.write(f"generated avatars for {generated} users, {failed} failed")
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# 与 Django 在 PostgreSQL 上生成的 icontains / istartswith 条件 UPPER("列"::text) LIKE UPPER(...) 一致
+SEARCH_INDEXES = [
+    ("account_username_upper_trgm", "USING gin (UPPER(username::text) gin_trgm_ops)"),
+    ("account_email_upper_trgm", "USING gin (UPPER(email::text) gin_trgm_ops)"),
+    ("account_username_upper_prefix", "(UPPER(username::text) text_pattern_ops)"),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    用户搜索使用的索引，只在 PostgreSQL 上创建（pg_trgm 三元组索引和前缀匹配索引）
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, definition in SEARCH_INDEXES:
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON account_account {definition}")
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _ in SEARCH_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_account_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='avatar_hash',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+    ]
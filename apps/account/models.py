@@ -1,10 +1,24 @@
-from django.db import models
+import logging
+import posixpath
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from friend.models import FriendList
-from .utils import get_default_profile_image, get_profile_image_filepath
+from .consumers import push_avatar_hash
+from .images import image_pool
+from .search import username_index
+from .utils import (
+    AVATAR_SIZES, AVATAR_SMALL, get_avatar_filepath, get_avatar_url, get_default_profile_image,
+    get_profile_image_filepath, make_avatar_variants,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class MyAccountManager(BaseUserManager):
@@ -61,6 +75,8 @@ class Account(AbstractBaseUser):
     profile_image = models.ImageField(max_length=255, upload_to=get_profile_image_filepath, null=True, blank=True,
                                       default=get_default_profile_image)
     hide_email = models.BooleanField(default=True)
+    # 当前头像缩略图文件名中的内容哈希，为空时还没有生成缩略图（使用原图）
+    avatar_hash = models.CharField(max_length=16, blank=True, default="")
 
     objects = MyAccountManager()
 
@@ -72,10 +88,98 @@ class Account(AbstractBaseUser):
     def __str__(self):
         return self.username
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 保存时与数据库中的 username 比较，没有变化时不更新用户名索引
+        instance._loaded_username = instance.__dict__.get("username")
+        return instance
+
     # 截取文件名
     def get_profile_image_filename(self):
         return str(self.profile_image)[str(self.profile_image).index(f'profile_images/{str(self.pk)}/'):]
 
+    def avatar_url_for(self, size=AVATAR_SMALL):
+        return get_avatar_url(self.pk, self.avatar_hash, self.profile_image.name, size)
+
+    # 聊天消息、通知等使用的最小的缩略图
+    @property
+    def avatar_url(self):
+        return self.avatar_url_for(AVATAR_SMALL)
+
+    def save(self, *args, **kwargs):
+        # 新上传（还没有写入存储）的头像，事务提交之后在 image_pool 中生成缩略图，不在请求中解码图片
+        new_image = bool(self.profile_image) and not self.profile_image._committed
+        super().save(*args, **kwargs)
+        if new_image:
+            user_id = self.pk
+            transaction.on_commit(lambda: image_pool.submit_avatar_variants(user_id))
+
+    def update_avatar_variants(self, image_bytes=None):
+        """
+        从头像原图生成 AVATAR_SIZES 缩略图，保存到包含内容哈希的文件名。
+        image_bytes 为空时从存储中读取 profile_image
+        """
+        if image_bytes is None:
+            with self.profile_image.open("rb") as f:
+                image_bytes = f.read()
+        try:
+            avatar_hash, variants = make_avatar_variants(image_bytes)
+        except ValueError:
+            logger.exception("update_avatar_variants: user %s", self.pk)
+            return
+        self.save_avatar_variants(avatar_hash, variants)
+
+    def save_avatar_variants(self, avatar_hash, variants):
+        """
+        保存已经生成的缩略图（make_avatar_variants 的返回值），并通知已连接的socket使用新的 avatar_hash。
+        旧的缩略图不在这里删除：最近消息缓存、已连接的socket和已经打开的页面还会引用旧的地址，
+        由 cleanup_avatar_variants 命令在 CHAT_RECENT_CACHE_TIMEOUT 之后删除
+        """
+        if avatar_hash == self.avatar_hash:
+            return
+        storage = self.profile_image.storage
+        for size, content in variants.items():
+            path = get_avatar_filepath(self.pk, avatar_hash, size)
+            if not storage.exists(path):
+                storage.save(path, ContentFile(content))
+        self.avatar_hash = avatar_hash
+        Account.objects.filter(pk=self.pk).update(avatar_hash=avatar_hash)
+        transaction.on_commit(lambda: push_avatar_hash(self.pk, avatar_hash))
+
+    def delete_old_avatar_variants(self, min_age):
+        """
+        当前的缩略图已经保存了 min_age 秒以上时，删除其他（旧的头像的）缩略图，返回删除的文件数
+        """
+        if not self.avatar_hash:
+            return 0
+        storage = self.profile_image.storage
+        current = get_avatar_filepath(self.pk, self.avatar_hash, AVATAR_SMALL)
+        try:
+            saved_at = storage.get_modified_time(current)
+        except (OSError, NotImplementedError):
+            return 0
+        if timezone.now() - saved_at < timedelta(seconds=min_age):
+            return 0
+        directory = posixpath.dirname(current)
+        keep = {posixpath.basename(get_avatar_filepath(self.pk, self.avatar_hash, size)) for size in AVATAR_SIZES}
+        deleted = 0
+        for name in storage.listdir(directory)[1]:
+            if name.startswith("avatar_") and name not in keep:
+                storage.delete(posixpath.join(directory, name))
+                deleted += 1
+        return deleted
+
+    def set_cropped_profile_image(self, cropped, avatar_hash, variants):
+        """
+        替换头像原图并保存缩略图（account.utils.process_profile_image 的返回值）
+        """
+        # 默认头像是所有用户共用的文件，不能删除
+        if self.profile_image.name != get_default_profile_image():
+            self.profile_image.delete(save=False)
+        self.profile_image.save("profile_image.png", ContentFile(cropped))
+        self.save_avatar_variants(avatar_hash, variants)
+
     # 是否是admin
     def has_perm(self, perm, obj=None):
         return self.is_admin
@@ -89,4 +193,23 @@ def user_save(sender, instance, **kwargs):
     """
     对Account进行save时，确保创建一个FriendList
     """
-    FriendList.objects.get_or_create(user=instance)
\ No newline at end of file
+    FriendList.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=Account)
+def update_username_index(sender, instance, created, update_fields=None, **kwargs):
+    """
+    增量更新本进程的用户名自动补全索引。
+    登录（update_fields=["last_login"]）等没有修改用户名的保存不更新
+    """
+    if update_fields is not None and "username" not in update_fields:
+        return
+    if not created and getattr(instance, "_loaded_username", None) == instance.username:
+        return
+    username_index.update(instance.id, instance.username)
+    instance._loaded_username = instance.username
+
+
+@receiver(post_delete, sender=Account)
+def remove_from_username_index(sender, instance, **kwargs):
+    username_index.remove(instance.id)
@@ -0,0 +1,155 @@
+"""
+用户搜索
+
+- search_accounts: 搜索结果页，按用户名游标分页。
+  PostgreSQL 上 icontains 使用 UPPER(username/email) 的 pg_trgm GIN 索引，
+  少于 MIN_CONTAINS_LENGTH 个字符时三元组索引无效，只按用户名前缀匹配（UPPER(username) text_pattern_ops 索引）
+- username_index: 搜索框自动补全，进程内按用户名排序的索引，不查询数据库
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PAGE_SIZE = 20
+AUTOCOMPLETE_LIMIT = 10
+# 三元组索引至少需要3个字符
+MIN_CONTAINS_LENGTH = 3
+# 从数据库加载用户名时每次读取的行数
+LOAD_CHUNK_SIZE = 10000
+
+
+def search_accounts(query, after=None, limit=SEARCH_PAGE_SIZE, queryset=None):
+    """
+    返回 (一页用户, 下一页的游标)，按用户名排序，after 为上一页最后一个用户名。
+    queryset: 在这个查询集（例如已经标注了好友关系的）中搜索，默认所有用户
+    """
+    from account.models import Account
+
+    if len(query) < MIN_CONTAINS_LENGTH:
+        match = Q(username__istartswith=query)
+    else:
+        match = Q(username__icontains=query) | Q(email__icontains=query)
+    qs = (Account.objects.all() if queryset is None else queryset).filter(match).order_by("username")
+    if after:
+        qs = qs.filter(username__gt=after)
+    accounts = list(qs[:limit + 1])
+    next_cursor = accounts[limit - 1].username if len(accounts) > limit else None
+    return accounts[:limit], next_cursor
+
+
+class UsernameIndex:
+    """
+    进程内按用户名（不区分大小写）排序的索引，前缀查询用二分查找。
+
+    第一次查询时从数据库加载（只读取 id 和 username），
+    本进程中 Account 保存/删除时增量更新（account.models 中的信号），
+    其他进程的修改在加载超过 ACCOUNT_SEARCH_INDEX_TTL 秒后由后台线程重新加载，期间继续使用旧索引。
+    """
+
+    def __init__(self):
+        self._keys = []  # "小写用户名\0id"，升序
+        self._entries = []  # 与 _keys 对应的 (id, username)
+        self._by_id = {}  # id -> key
+        self._lock = threading.Lock()
+        self._loaded_at = None
+        self._reloading = False
+
+    @property
+    def ttl(self):
+        return getattr(settings, "ACCOUNT_SEARCH_INDEX_TTL", 600)
+
+    @property
+    def loaded(self):
+        return self._loaded_at is not None
+
+    def search(self, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """
+        用户名以 prefix 开头（不区分大小写）的用户，返回 [(id, username), ...]
+        """
+        self._ensure_loaded()
+        prefix = prefix.lower()
+        with self._lock:
+            results = []
+            for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+                if len(results) >= limit or not self._keys[i].startswith(prefix):
+                    break
+                results.append(self._entries[i])
+            return results
+
+    def update(self, account_id, username):
+        if not self.loaded:
+            return
+        key = self._key(account_id, username)
+        with self._lock:
+            self._remove(account_id)
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._entries.insert(i, (account_id, username))
+            self._by_id[account_id] = key
+
+    def remove(self, account_id):
+        if not self.loaded:
+            return
+        with self._lock:
+            self._remove(account_id)
+
+    def _remove(self, account_id):
+        key = self._by_id.pop(account_id, None)
+        if key is not None:
+            i = bisect_left(self._keys, key)
+            del self._keys[i]
+            del self._entries[i]
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None:
+            with self._lock:
+                if self._loaded_at is None:
+                    self._swap(self._load())
+        elif time.monotonic() - self._loaded_at > self.ttl and not self._reloading:
+            self._reloading = True
+            threading.Thread(target=self._reload, daemon=True).start()
+
+    def _reload(self):
+        from django.db import connection
+
+        try:
+            entries = self._load()
+            with self._lock:
+                self._swap(entries)
+        except Exception:
+            logger.exception("UsernameIndex: reload failed")
+        finally:
+            self._reloading = False
+            # 后台线程自己的数据库连接
+            connection.close()
+
+    def _load(self):
+        from account.models import Account
+
+        started = time.perf_counter()
+        entries = sorted(
+            (self._key(account_id, username), account_id, username)
+            for account_id, username in Account.objects.order_by().values_list("id", "username")
+            .iterator(chunk_size=LOAD_CHUNK_SIZE)
+        )
+        logger.info("UsernameIndex: loaded %s usernames in %.2fs", len(entries), time.perf_counter() - started)
+        return entries
+
+    def _swap(self, entries):
+        self._keys = [key for key, _, _ in entries]
+        self._entries = [(account_id, username) for _, account_id, username in entries]
+        self._by_id = {account_id: key for key, account_id, _ in entries}
+        self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _key(account_id, username):
+        return f"{username.lower()}\0{account_id}"
+
+
+username_index = UsernameIndex()
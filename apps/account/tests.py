@@ -1,3 +1,169 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from account.consumers import account_group_name
+from account.images import ImagePool, ImagePoolFull
+from account.models import Account
+from account.search import username_index
+from account.utils import AVATAR_SIZES, get_avatar_filepath, make_avatar_variants, process_profile_image
+from chat.consumers import ChatConsumer
+
+
+def png_bytes(color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (200, 200), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class AvatarVariantTests(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings.enable()
+        self.user = Account.objects.create_user("a@test.local", "a", "password")
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def avatar_files(self):
+        return sorted(os.listdir(os.path.join(self.media_root, "profile_images", str(self.user.pk))))
+
+    def save(self, color):
+        avatar_hash, variants = make_avatar_variants(png_bytes(color))
+        self.user.save_avatar_variants(avatar_hash, variants)
+        return avatar_hash
+
+    def test_old_variants_are_kept_until_cleanup(self):
+        old_hash = self.save("red")
+        new_hash = self.save("blue")
+        self.assertEqual(Account.objects.get(pk=self.user.pk).avatar_hash, new_hash)
+        # 缓存和已打开的页面中的旧地址仍然可用
+        self.assertEqual(len(self.avatar_files()), 2 * len(AVATAR_SIZES))
+
+        # 新的缩略图还没有保存足够长的时间
+        self.assertEqual(self.user.delete_old_avatar_variants(3600), 0)
+        self.assertEqual(self.user.delete_old_avatar_variants(0), len(AVATAR_SIZES))
+        expected = sorted(os.path.basename(get_avatar_filepath(self.user.pk, new_hash, size)) for size in AVATAR_SIZES)
+        self.assertEqual(self.avatar_files(), expected)
+        self.assertNotEqual(old_hash, new_hash)
+
+    @override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+    def test_socket_user_is_refreshed(self):
+        async def run():
+            communicator = WebsocketCommunicator(ChatConsumer, "/chat/")
+            communicator.scope["user"] = user
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            await get_channel_layer().group_send(account_group_name(user.pk), {
+                "type": "account.avatar", "avatar_hash": "0123456789abcdef"})
+            await communicator.receive_nothing()
+            await communicator.disconnect()
+
+        user = Account.objects.get(pk=self.user.pk)
+        async_to_sync(run)()
+        self.assertEqual(user.avatar_hash, "0123456789abcdef")
+
+
+class UsernameIndexTests(TestCase):
+
+    def setUp(self):
+        self.user = Account.objects.create_user("a@test.local", "alice", "password")
+        username_index._swap(username_index._load())
+
+    def test_rename_updates_index(self):
+        user = Account.objects.get(pk=self.user.pk)
+        user.username = "carol"
+        user.save()
+        self.assertEqual(username_index.search("car"), [(user.pk, "carol")])
+        self.assertEqual(username_index.search("ali"), [])
+
+    def test_save_without_rename_skips_index(self):
+        user = Account.objects.get(pk=self.user.pk)
+        with mock.patch.object(username_index, "update") as update:
+            user.last_login = timezone.now()
+            user.save(update_fields=["last_login"])
+            user.hide_email = False
+            user.save()
+        update.assert_not_called()
+
+
+class ImagePoolTests(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings = override_settings(MEDIA_ROOT=self.media_root, IMAGE_POOL_MODE="local")
+        self.settings.enable()
+        self.user = Account.objects.create_user("a@test.local", "a", "password")
+        self.pool = ImagePool()
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.media_root)
+
+    def submit(self, image_bytes):
+        with mock.patch("account.images.push_to_user") as push:
+            job_id = self.pool.submit_crop(self.user.pk, image_bytes, 10, 10, 100, 100)
+        push.assert_called_once()
+        user_id, event = push.call_args[0]
+        self.assertEqual((user_id, event["type"], event["job_id"]), (self.user.pk, "notification.profile_image", job_id))
+        return event
+
+    def test_local_crop_pushes_result_and_sets_avatar_hash(self):
+        event = self.submit(png_bytes("green"))
+
+        self.assertEqual(event["result"], "success")
+        user = Account.objects.get(pk=self.user.pk)
+        self.assertEqual(event["cropped_profile_image"], user.profile_image.url)
+        self.assertEqual(len(user.avatar_hash), 16)
+        with user.profile_image.open("rb") as f:
+            self.assertEqual(Image.open(f).size, (100, 100))
+        for size in AVATAR_SIZES:
+            self.assertTrue(os.path.exists(os.path.join(
+                self.media_root, get_avatar_filepath(user.pk, user.avatar_hash, size))))
+
+    def test_invalid_image_pushes_error(self):
+        with self.assertLogs("account.images", "ERROR"):
+            event = self.submit(b"not an image")
+
+        self.assertEqual(event["result"], "error")
+        self.assertEqual(Account.objects.get(pk=self.user.pk).avatar_hash, "")
+
+    def test_variants_match_decoded_crop(self):
+        # 缩略图直接从裁剪后的数组生成，结果与解码裁剪后的PNG再生成相同
+        noise = Image.effect_noise((200, 150), 64).convert("RGB")
+        buffer = io.BytesIO()
+        noise.save(buffer, format="PNG")
+        cropped, avatar_hash, variants = process_profile_image(buffer.getvalue(), 10, 10, 120, 100)
+        self.assertEqual(make_avatar_variants(cropped), (avatar_hash, variants))
+
+    def test_uploaded_image_variants_are_generated_after_commit(self):
+        # 编辑资料时上传的头像：请求中只注册 on_commit，缩略图在 image_pool 中生成
+        callbacks = []
+        with mock.patch("account.models.transaction.on_commit", callbacks.append):
+            self.user.profile_image = SimpleUploadedFile("upload.png", png_bytes("blue"), "image/png")
+            self.user.save()
+        self.assertEqual(Account.objects.get(pk=self.user.pk).avatar_hash, "")
+        self.assertEqual(len(callbacks), 1)
+
+        with mock.patch("account.images.make_avatar_variants", wraps=make_avatar_variants) as make:
+            callbacks[0]()
+        make.assert_called_once()
+        self.assertEqual(len(Account.objects.get(pk=self.user.pk).avatar_hash), 16)
+
+    @override_settings(IMAGE_POOL_MODE="process", IMAGE_POOL_QUEUE_LIMIT=0)
+    def test_full_queue_rejects_jobs(self):
+        with self.assertRaises(ImagePoolFull):
+            self.pool.submit_crop(self.user.pk, png_bytes("green"), 0, 0, 100, 100)
@@ -1,13 +1,21 @@
 import base64
-import os
+import hashlib
+import io
+import logging
 
+import cv2
+import numpy as np
 from django.conf import settings
-from django.core.files.storage import FileSystemStorage
 from django.core.serializers.python import Serializer
+from PIL import Image
 
+logger = logging.getLogger(__name__)
 
-# temporary image path
-TEMP_PROFILE_IMAGE_NAME = "temp_profile_image.png"
+# 头像缩略图的边长（像素），聊天消息、通知等处使用最小的一种
+AVATAR_SIZES = (32, 64, 128)
+AVATAR_SMALL = AVATAR_SIZES[0]
+# 缩略图文件名中内容哈希的长度（十六进制字符）
+AVATAR_HASH_LENGTH = 16
 
 
 # 头像存放地址
@@ -20,38 +28,125 @@ def get_default_profile_image():
     return "profile/profile_image.png"
 
 
+# 头像缩略图存放地址，文件名包含原图的内容哈希，内容改变时地址也改变，可以永久缓存
+def get_avatar_filepath(user_id, avatar_hash, size):
+    return f'profile_images/{user_id}/avatar_{avatar_hash}_{size}.png'
+
+
+def get_avatar_url(user_id, avatar_hash, profile_image, size=AVATAR_SMALL):
+    """
+    头像缩略图的url。还没有生成缩略图（avatar_hash为空，例如默认头像）时返回原图的url。
+    profile_image 为 profile_image 字段保存的文件名，不需要加载用户实例（聊天记录中使用）
+    """
+    from account.models import Account
+
+    storage = Account._meta.get_field("profile_image").storage
+    if avatar_hash:
+        return storage.url(get_avatar_filepath(user_id, avatar_hash, size))
+    return storage.url(profile_image or get_default_profile_image())
+
+
 # 如果存在原来的url，跳转至原来的url，否则跳到home页面
 def get_redirect_if_exists(request):
     redirect = None
     if request.POST:
         if request.POST.get("next"):
             redirect = str(request.GET.get("next"))
-            print(redirect)
+            logger.debug("redirect: %s", redirect)
         else:
             redirect = "home"
     return redirect
 
 
-def save_temp_profile_image_from_base64String(imageString, user):
-    INCORRECT_PADDING_EXCEPTION = "Incorrect padding"
+def decode_base64_image(image_string):
+    """
+    上传的base64字符串 -> bytes，补齐缺少的 '=' 填充
+    """
+    image_string = str(image_string or "")
+    if image_string.startswith("data:"):
+        image_string = image_string.partition(",")[2]
+    image_string += "=" * (-len(image_string) % 4)
+    return base64.b64decode(image_string)
+
+
+def crop_profile_image(image_bytes, x, y, width, height):
+    """
+    在内存中裁剪头像，返回裁剪后的图片（numpy数组，原图的视图）。
+    先只读取图片头检查像素数（PROFILE_IMAGE_MAX_PIXELS），超过时不解码，避免超大图片占满worker内存；
+    cv2.imdecode 直接读取 image_bytes 的numpy视图，裁剪是切片（不复制）
+    """
+    img = _decode_image(image_bytes, cv2.IMREAD_COLOR)
+    x, y = max(x, 0), max(y, 0)
+    crop_img = img[y:y + height, x:x + width]
+    if crop_img.size == 0:
+        raise ValueError("The crop area is empty.")
+    return crop_img
+
+
+def make_avatar_variants(image_bytes):
+    """
+    生成 AVATAR_SIZES 中每种边长的正方形缩略图（居中裁剪后缩小），
+    返回 (内容哈希, {边长: PNG编码后的bytes})
+    """
+    img = _decode_image(image_bytes, cv2.IMREAD_UNCHANGED)
+    return avatar_hash_for(image_bytes), resize_avatar_variants(img)
+
+
+def avatar_hash_for(image_bytes):
+    return hashlib.sha256(image_bytes).hexdigest()[:AVATAR_HASH_LENGTH]
+
+
+def resize_avatar_variants(img):
+    """
+    已经解码的图片 -> {边长: PNG编码后的bytes}，每种边长只编码一次
+    """
+    height, width = img.shape[:2]
+    side = min(height, width)
+    top, left = (height - side) // 2, (width - side) // 2
+    square = img[top:top + side, left:left + side]
+
+    variants = {}
+    for size in AVATAR_SIZES:
+        # 缩小用 INTER_AREA，原图比缩略图还小时放大用 INTER_CUBIC
+        interpolation = cv2.INTER_AREA if side >= size else cv2.INTER_CUBIC
+        variants[size] = _encode_png(cv2.resize(square, (size, size), interpolation=interpolation))
+    return variants
+
+
+def process_profile_image(image_bytes, x, y, width, height):
+    """
+    裁剪头像并生成缩略图（在 account.images 的进程池中执行，参数和返回值都可以pickle），
+    返回 (裁剪后的PNG, 内容哈希, {边长: 缩略图PNG})
+    """
+    crop_img = crop_profile_image(image_bytes, x, y, width, height)
+    cropped = _encode_png(crop_img)
+    # 缩略图直接从裁剪后的数组生成，不再解码一次编码后的PNG
+    return cropped, avatar_hash_for(cropped), resize_avatar_variants(crop_img)
+
+
+def _encode_png(img):
+    ok, encoded = cv2.imencode(".png", img)
+    if not ok:
+        raise ValueError("Failed to encode the image.")
+    return encoded.tobytes()
+
+
+def _decode_image(image_bytes, flags):
+    """
+    先只读取图片头检查像素数（PROFILE_IMAGE_MAX_PIXELS），超过时不解码，避免超大图片占满worker内存
+    """
     try:
-        if not os.path.exists(settings.TEMP):
-            os.mkdir(settings.TEMP)
-        if not os.path.exists(settings.TEMP + "/" + str(user.pk)):
-            os.mkdir(settings.TEMP + "/" + str(user.pk))
-        url = os.path.join(settings.TEMP + "/" + str(user.pk), TEMP_PROFILE_IMAGE_NAME)
-        storage = FileSystemStorage(location=url)
-        image = base64.b64decode(imageString)
-        with storage.open('', 'wb+') as destination:
-            destination.write(image)
-        return url
-    except Exception as e:
-        print("exception: " + str(e))
-        # workaround for an issue I found
-        if str(e) == INCORRECT_PADDING_EXCEPTION:
-            imageString += "=" * ((4 - len(imageString) % 4) % 4)
-            return save_temp_profile_image_from_base64String(imageString, user)
-    return None
+        with Image.open(io.BytesIO(image_bytes)) as header:
+            image_width, image_height = header.size
+    except (OSError, Image.DecompressionBombError):
+        raise ValueError("Unsupported image format.")
+    if image_width * image_height > getattr(settings, "PROFILE_IMAGE_MAX_PIXELS", 25000000):
+        raise ValueError(f"Image is too large ({image_width}x{image_height}).")
+
+    img = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), flags)
+    if img is None:
+        raise ValueError("Unsupported image format.")
+    return img
 
 
 class LazyAccountEncoder(Serializer):
@@ -60,5 +155,5 @@ class LazyAccountEncoder(Serializer):
         json_data.update({'id': str(obj.id)})
         json_data.update({'email': str(obj.email)})
         json_data.update({'username': str(obj.username)})
-        json_data.update({'profile_image': str(obj.profile_image.url)})
+        json_data.update({'profile_image': str(obj.avatar_url)})
         return json_data
@@ -1,23 +1,24 @@
-import os
+import logging
 
-import cv2
 from django.conf import settings
 from django.contrib.auth import login, logout, authenticate
-from django.core import files
-from django.db.models import Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, redirect
 
 from account.forms import RegistrationForm, AccountAuthenticationForm, AccountUpdateForm
+from account.images import ImagePoolFull, image_pool
 from account.models import Account
+from account.search import AUTOCOMPLETE_LIMIT, search_accounts, username_index
 from friend.friend_request_status import FriendRequestStatus
-from friend.models import FriendList, FriendRequest
-from friend.utils import get_friend_request_or_false
+from friend.models import FriendList, FriendRequest, FriendSuggestion
+from friend.utils import annotate_relationship, get_request_status
 from .utils import (
+    decode_base64_image,
     get_redirect_if_exists,
-    save_temp_profile_image_from_base64String
 )
 
+logger = logging.getLogger(__name__)
+
 
 # 用户注册视图
 def register_view(request, *args, **kwargs):
@@ -89,9 +90,9 @@ def account_view(request, *args, **kwargs):
     context = {}
     # 获取当前访问的用户profile的user_id
     user_id = kwargs.get('user_id')
-    try:
-        account = Account.objects.get(pk=user_id)
-    except Account.DoesNotExist:
+    # 当前用户与被访问用户的关系（是否好友、好友请求）在同一次查询中标注
+    account = annotate_relationship(Account.objects.filter(pk=user_id), request.user).first()
+    if account is None:
         return HttpResponse("That user doesn't exist.")
     if account:
         context['id'] = account.id
@@ -117,21 +118,15 @@ def account_view(request, *args, **kwargs):
         friend_requests = None
         if user.is_authenticated and user != account:
             is_self = False
-            # 如果被访问用户的friend_list中有当前用户user.id，说明是朋友
-            if friends.filter(pk=user.id):
-                is_friend = True
-            else:
-                is_friend = False
+            # 被访问用户是当前用户的好友（好友关系是双向的）
+            is_friend = account.is_friend
+            if not is_friend:
                 # CASE1: 当前被查看用户 对 当前登录用户发送了好友请求
-                if get_friend_request_or_false(sender=account, receiver=user):
-                    request_sent = FriendRequestStatus.THEM_SENT_TO_YOU.value
-                    context['pending_friend_request_id'] = get_friend_request_or_false(sender=account, receiver=user).id
                 # CASE2: 当前登录用户 对 当前被查看用户发送了好友请求
-                elif get_friend_request_or_false(sender=user, receiver=account):
-                    request_sent = FriendRequestStatus.YOU_SENT_TO_THEM.value
                 # CASE3: 没有发送 / 接收好友请求
-                else:
-                    request_sent = FriendRequestStatus.NO_REQUEST_SENT.value
+                request_sent = get_request_status(account)
+                if request_sent == FriendRequestStatus.THEM_SENT_TO_YOU.value:
+                    context['pending_friend_request_id'] = account.pending_friend_request_id
         elif not user.is_authenticated:
             is_self = False
         # You are looking at your own profile
@@ -141,6 +136,9 @@ def account_view(request, *args, **kwargs):
             except FriendRequest.DoesNotExist:
                 # 没有好友请求，pass
                 pass
+            # 可能认识的人（friend.recommendations 预先计算）
+            context['friend_suggestions'] = FriendSuggestion.objects.filter(user=user) \
+                .select_related("suggested").order_by("-mutual_count", "suggested_id")
 
         # 传递模板参数
         context['is_self'] = is_self
@@ -202,31 +200,20 @@ def crop_image_view(request, *args, **kwargs):
     user = request.user
     if request.POST and user.is_authenticated:
         try:
-            imageString = request.POST.get("image")
-            print(imageString[:100])
-            url = save_temp_profile_image_from_base64String(imageString, user)
-            img = cv2.imread(url)
-            print("crop url: ", url)
+            image_bytes = decode_base64_image(request.POST.get("image"))
             cropX = int(float(str(request.POST.get("cropX"))))
             cropY = int(float(str(request.POST.get("cropY"))))
             cropWidth = int(float(str(request.POST.get("cropWidth"))))
             cropHeight = int(float(str(request.POST.get("cropHeight"))))
 
-            if cropX < 0:
-                cropX = 0
-            if cropY < 0:
-                cropY = 0
-            # crop
-            crop_img = img[cropY:cropY + cropHeight, cropX:cropX + cropWidth]
-            cv2.imwrite(url, crop_img)
-            user.profile_image.delete()
-            user.profile_image.save("profile_image.png", files.File(open(url, "rb")))
-            user.save()
-            payload['result'] = "success"
-            payload['cropped_profile_image'] = user.profile_image.url
-            os.remove(url)
+            # 解码、裁剪、编码在进程池中执行，裁剪后的头像url通过通知socket推送
+            payload['job_id'] = image_pool.submit_crop(user.pk, image_bytes, cropX, cropY, cropWidth, cropHeight)
+            payload['result'] = "pending"
+        except ImagePoolFull as e:
+            payload['result'] = "error"
+            payload['exception'] = str(e)
         except Exception as e:
-            print("exception: " + str(e))
+            logger.exception("crop_image_view")
             payload['result'] = "error"
             payload['exception'] = str(e)
 
@@ -237,31 +224,28 @@ def crop_image_view(request, *args, **kwargs):
 def account_search_view(request, *args, **kwargs):
     context = {}
     if request.method == "GET":
-        search_query = request.GET.get("q")
+        search_query = request.GET.get("q", "").strip()
         if len(search_query) > 0:
-
-            # get: single, filter: multiple
-            search_results = Account.objects.filter(
-                Q(username__icontains=search_query) | Q(email__icontains=search_query)
-            )
             user = request.user
+            # 按用户名游标分页，after 为上一页最后一个用户名
+            # 当前登录用户，和搜索结果中的用户是否为朋友（同一次查询中标注，未登录时都不是朋友）
+            search_results, next_cursor = search_accounts(
+                search_query, request.GET.get("after"), queryset=annotate_relationship(Account.objects.all(), user))
             accounts = []  # account, is_friend, [(account1, True), (...), ...]
-            if user.is_authenticated:
-                # get the authenticated users friend list
-                try:
-                    auth_user_friend_list = FriendList.objects.get(user=user)
-                except FriendList.DoesNotExist:
-                    # 如果用户暂时没有FriendList，创建一个
-                    friend_list = FriendList(user=user)
-                    friend_list.save()
-                    auth_user_friend_list = FriendList.objects.get(user=user)
-                # 当前登录用户，和搜索结果中的用户是否为朋友
-                for account in search_results:
-                    accounts.append((account, auth_user_friend_list.is_mutual_friend(account)))
-                context['accounts'] = accounts
-            else:
-                for account in search_results:
-                    accounts.append((account, False))
-                context['accounts'] = accounts
+            for account in search_results:
+                accounts.append((account, account.is_friend))
+            context['accounts'] = accounts
+            context['query'] = search_query
+            context['next_cursor'] = next_cursor
 
     return render(request, "account/search_results.html", context)
+
+
+# 搜索框自动补全（Ajax），用户名前缀匹配，使用进程内排序索引，不查询数据库
+def account_autocomplete_view(request, *args, **kwargs):
+    query = request.GET.get("q", "").strip()
+    results = []
+    if query:
+        for account_id, username in username_index.search(query, AUTOCOMPLETE_LIMIT):
+            results.append({"id": account_id, "username": username})
+    return JsonResponse({"results": results})
@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.core.paginator import Paginator
 from django.core.cache import cache
 
-from chat.models import PrivateChatroom, ChatroomMessage
+from chat.models import PrivateChatroom, ChatroomMessage, UnreadChatRoomMessages
 
 
 class PrivateChatroomAdmin(admin.ModelAdmin):
@@ -50,3 +50,15 @@ class RoomChatMessageAdmin(admin.ModelAdmin):
 
 
 admin.site.register(ChatroomMessage, RoomChatMessageAdmin)
+
+
+class UnreadChatRoomMessagesAdmin(admin.ModelAdmin):
+    list_display = ['room', 'user', 'count', 'reset_timestamp']
+    search_fields = ['room__user1__username', 'room__user2__username', ]
+    readonly_fields = ['id', ]
+
+    class Meta:
+        model = UnreadChatRoomMessages
+
+
+admin.site.register(UnreadChatRoomMessages, UnreadChatRoomMessagesAdmin)
@@ -0,0 +1,281 @@
+import asyncio
+import atexit
+import logging
+import signal
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from metrics.instrumentation import database_sync_to_async
+from metrics.registry import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+BUFFER_DEPTH = Gauge(
+    "chat_message_buffer_depth", "Chat messages waiting in the write-behind buffer.", ["model"])
+BUFFER_FLUSHED_TOTAL = Counter(
+    "chat_message_buffer_flushed_total", "Chat messages written by the write-behind buffer.", ["model"])
+BUFFER_DROPPED_TOTAL = Counter(
+    "chat_message_buffer_dropped_total", "Chat messages the write-behind buffer failed to write.", ["model"])
+BUFFER_FLUSHES_TOTAL = Counter(
+    "chat_message_buffer_flushes_total", "bulk_create calls made by the write-behind buffer.", ["model"])
+
+
+# 本进程的所有写缓冲，关闭时一起写入
+_buffers = []
+
+
+class MessageWriteBuffer:
+    """
+    每个worker进程一个的聊天消息写缓冲（write-behind）。
+
+    发送消息时先分配好id和时间戳，立即广播，再按数量阈值或时间阈值
+    用 bulk_create 批量写入数据库。id 从数据库预留（PostgreSQL 的序列，SQLite 的 sqlite_sequence），
+    其他数据库不能安全地预留id，退化为发送时同步写入。
+
+    关闭时写入剩余消息：ASGI lifespan.shutdown（BufferLifespan）、SIGTERM 和正常退出（atexit）。
+    进程被 SIGKILL / OOM 杀死时，缓冲中的消息会丢失，
+    最多 CHAT_MESSAGE_BUFFER_SIZE 条或最近 CHAT_MESSAGE_FLUSH_INTERVAL 秒内的消息。
+
+    on_flush: 每批消息写入数据库之后（在写入的线程中）调用 on_flush(messages)，
+    用于按批更新与消息相关的冗余数据（未读数、聊天列表），不在发送消息时逐条更新
+    """
+
+    def __init__(self, model, max_size=None, flush_interval=None, on_flush=None):
+        self.model = model
+        self.on_flush = on_flush
+        self.max_size = max_size or getattr(settings, "CHAT_MESSAGE_BUFFER_SIZE", 100)
+        self.flush_interval = flush_interval or getattr(settings, "CHAT_MESSAGE_FLUSH_INTERVAL", 0.5)
+
+        self._pending = []
+        self._timer = None
+        self._timer_loop = None
+
+        # 预先从数据库申请的一段id [_next_id, _last_id]
+        self._next_id = 1
+        self._last_id = 0
+        self._id_lock = threading.Lock()
+
+        _buffers.append(self)
+        atexit.register(self.flush_sync)
+        install_sigterm_handler()
+
+    @property
+    def depth(self):
+        """
+        当前还没有写入数据库的消息数量
+        """
+        return len(self._pending)
+
+    @property
+    def buffered(self):
+        """
+        数据库能否预留id；不能时每条消息在发送时同步写入
+        """
+        return connection.vendor in ("postgresql", "sqlite")
+
+    async def add(self, room, user, content):
+        """
+        创建一条消息（还未写入数据库），返回已经带有id和timestamp的实例
+        """
+        if not self.buffered:
+            return await database_sync_to_async(self._create)(room, user, content)
+        # 预留的id还没有用完时不切换线程
+        msg_id = self._take_id()
+        if msg_id is None:
+            msg_id = await database_sync_to_async(self.allocate_id)()
+        message = self.model(id=msg_id, room=room, user=user, content=content, timestamp=timezone.now())
+        self._pending.append(message)
+        BUFFER_DEPTH.set(len(self._pending), model=self.model.__name__)
+
+        if len(self._pending) >= self.max_size:
+            asyncio.ensure_future(self.flush())
+        else:
+            self._ensure_timer()
+        return message
+
+    def pending_for_room(self, room_id):
+        """
+        某个房间还在缓冲中的消息，新消息在前
+        """
+        return [m for m in reversed(list(self._pending)) if m.room_id == room_id]
+
+    async def flush(self):
+        self._cancel_timer()
+        batch, self._pending = self._pending, []
+        BUFFER_DEPTH.set(0, model=self.model.__name__)
+        if batch:
+            await database_sync_to_async(self._write)(batch)
+
+    def flush_sync(self):
+        """
+        同步写入全部缓冲消息，用于进程退出
+        """
+        self._cancel_timer()
+        batch, self._pending = self._pending, []
+        BUFFER_DEPTH.set(0, model=self.model.__name__)
+        if batch:
+            self._write(batch)
+
+    def allocate_id(self):
+        with self._id_lock:
+            if self._next_id > self._last_id:
+                self._next_id, self._last_id = self._reserve_ids(self.max_size)
+            msg_id = self._next_id
+            self._next_id += 1
+            return msg_id
+
+    def _take_id(self):
+        """
+        从已经预留的id中取一个，用完时返回None
+        """
+        with self._id_lock:
+            if self._next_id > self._last_id:
+                return None
+            msg_id = self._next_id
+            self._next_id += 1
+            return msg_id
+
+    def _reserve_ids(self, count):
+        """
+        从数据库申请一段连续的id，其他进程和普通的INSERT（后台、view）都不会再使用这些id。
+        PostgreSQL 从表的序列中取值；SQLite 在事务中把 sqlite_sequence 增加 count
+        （AUTOINCREMENT 表的新id总是大于 sqlite_sequence 中的值）
+        """
+        table = self.model._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                    [table, count],
+                )
+                ids = [row[0] for row in cursor.fetchall()]
+                return min(ids), max(ids)
+            quoted = connection.ops.quote_name(table)
+            with transaction.atomic():
+                cursor.execute(
+                    f"UPDATE sqlite_sequence SET seq = MAX(seq, (SELECT COALESCE(MAX(id), 0) FROM {quoted})) + %s "
+                    f"WHERE name = %s",
+                    [count, table],
+                )
+                if cursor.rowcount == 0:
+                    # 表中还没有插入过数据
+                    cursor.execute(
+                        f"INSERT INTO sqlite_sequence (name, seq) SELECT %s, COALESCE(MAX(id), 0) + %s FROM {quoted}",
+                        [table, count],
+                    )
+                cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", [table])
+                last = cursor.fetchone()[0]
+            return last - count + 1, last
+
+    def _create(self, room, user, content):
+        """
+        不能预留id的数据库：直接写入一条消息
+        """
+        message = self.model.objects.create(room=room, user=user, content=content)
+        BUFFER_FLUSHED_TOTAL.inc(model=self.model.__name__)
+        self._after_write([message])
+        return message
+
+    def _write(self, batch):
+        model = self.model.__name__
+        BUFFER_FLUSHES_TOTAL.inc(model=model)
+        try:
+            self.model.objects.bulk_create(batch)
+        except Exception:
+            logger.exception("MessageWriteBuffer: bulk_create failed, retrying one by one")
+            # 批量写入失败时逐条写入，丢弃无法写入的消息（例如用户已被删除）
+            written = []
+            for message in batch:
+                try:
+                    with transaction.atomic():
+                        self.model.objects.bulk_create([message])
+                except Exception:
+                    BUFFER_DROPPED_TOTAL.inc(model=model)
+                    logger.exception("MessageWriteBuffer: dropped message %s", message.id)
+                else:
+                    BUFFER_FLUSHED_TOTAL.inc(model=model)
+                    written.append(message)
+            batch = written
+        else:
+            BUFFER_FLUSHED_TOTAL.inc(len(batch), model=model)
+        self._after_write(batch)
+
+    def _after_write(self, messages):
+        if self.on_flush is None or not messages:
+            return
+        try:
+            self.on_flush(messages)
+        except Exception:
+            logger.exception("MessageWriteBuffer: on_flush failed")
+
+    def _ensure_timer(self):
+        loop = asyncio.get_event_loop()
+        if self._timer is None or self._timer_loop is not loop:
+            self._timer_loop = loop
+            self._timer = loop.call_later(self.flush_interval, lambda: asyncio.ensure_future(self.flush()))
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_loop = None
+
+
+def flush_all_sync():
+    for buffer in _buffers:
+        try:
+            buffer.flush_sync()
+        except Exception:
+            logger.exception("MessageWriteBuffer: flush on shutdown failed")
+
+
+async def flush_all():
+    for buffer in _buffers:
+        try:
+            await buffer.flush()
+        except Exception:
+            logger.exception("MessageWriteBuffer: flush on shutdown failed")
+
+
+_sigterm_installed = False
+
+
+def install_sigterm_handler():
+    """
+    SIGTERM 默认直接结束进程，不执行 atexit。
+    没有其他程序处理 SIGTERM 时（daphne/uvicorn 会安装自己的处理函数并正常退出），先写入缓冲再退出
+    """
+    global _sigterm_installed
+    if _sigterm_installed or threading.current_thread() is not threading.main_thread():
+        return
+    _sigterm_installed = True
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+
+    def handle_sigterm(signum, frame):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+class BufferLifespan:
+    """
+    ASGI lifespan（Chat.routing 中的 "lifespan"）：服务器关闭时，在事件循环还在运行时写入所有缓冲
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+
+    async def __call__(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await flush_all()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
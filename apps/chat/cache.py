@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from metrics.registry import Counter
+
+RECENT_CACHE_LOOKUPS = Counter(
+    "chat_recent_messages_cache_total", "Newest history page lookups by cache tier result.", ["cache", "result"])
+
+# 共享缓存中合并更新用的锁
+LOCK_TIMEOUT = 2  # 秒
+LOCK_ATTEMPTS = 20
+LOCK_WAIT = 0.005  # 秒
+
+
+class RecentMessageCache:
+    """
+    每个房间最近 size 条消息的环形缓冲（新消息在前），用于打开房间时的第一页聊天记录。
+
+    两级缓存：
+    - 共享缓存（CACHES[CHAT_RECENT_CACHE_ALIAS]，多worker部署时应为memcached等共享后端），
+      发送消息时更新，冷门房间按 CHAT_RECENT_CACHE_TIMEOUT 过期
+    - 进程内LRU，最多 CHAT_RECENT_CACHE_LOCAL_ROOMS 个房间，只保留 CHAT_RECENT_CACHE_LOCAL_TTL 秒，
+      其他worker发送的消息最多延迟这么久可见
+
+    缓存的是 chat.utils.history_rows 格式的元组，natural_timestamp 在生成帧时计算。
+    共享缓存中还没有某个房间时，发送的消息也会先记下来（complete=False），
+    读取时与数据库结果合并，这样还在其他worker写缓冲中的消息不会丢失。
+    所有方法都会访问共享缓存（可能是网络IO），需要在线程中调用。
+    """
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.timeout = getattr(settings, "CHAT_RECENT_CACHE_TIMEOUT", 60 * 60)
+        self.local_rooms = getattr(settings, "CHAT_RECENT_CACHE_LOCAL_ROOMS", 1000)
+        self.local_ttl = getattr(settings, "CHAT_RECENT_CACHE_LOCAL_TTL", 1.0)
+        self._local = OrderedDict()  # room_id -> (过期时间, rows)
+        self._local_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, "CHAT_RECENT_CACHE_ALIAS", "default")]
+
+    def get(self, room_id):
+        """
+        房间最近的消息，没有缓存时返回None（调用方查询数据库后调用 fill）
+        """
+        rows = self._get_local(room_id)
+        if rows is not None:
+            RECENT_CACHE_LOOKUPS.inc(cache=self.name, result="local_hit")
+            return rows
+        entry = self.cache.get(self._key(room_id))
+        if entry is not None and entry["complete"]:
+            self._set_local(room_id, entry["rows"])
+            RECENT_CACHE_LOOKUPS.inc(cache=self.name, result="shared_hit")
+            return entry["rows"]
+        RECENT_CACHE_LOOKUPS.inc(cache=self.name, result="miss")
+        return None
+
+    def fill(self, room_id, rows):
+        """
+        用数据库中最新的消息建立缓存，与已经记下的新消息合并，返回合并后的结果
+        """
+        key = self._key(room_id)
+        locked = self._acquire(key)
+        try:
+            entry = self.cache.get(key)
+            if entry is not None:
+                rows = merge_rows(self.size, entry["rows"], rows)
+            else:
+                rows = list(rows)[:self.size]
+            if locked:
+                self.cache.set(key, {"rows": rows, "complete": True}, self.timeout)
+                self._set_local(room_id, rows)
+        finally:
+            if locked:
+                self.cache.delete(key + ":lock")
+        return rows
+
+    def push(self, room_id, row):
+        """
+        新发送的消息
+        """
+        key = self._key(room_id)
+        if not self._acquire(key):
+            # 一直拿不到锁（持有者可能已经崩溃）：放弃这个房间的缓存，下次读取时从数据库重建
+            self.cache.delete(key)
+            self._drop_local(room_id)
+            return
+        try:
+            entry = self.cache.get(key) or {"rows": [], "complete": False}
+            entry = {"rows": merge_rows(self.size, entry["rows"], [row]), "complete": entry["complete"]}
+            self.cache.set(key, entry, self.timeout)
+        finally:
+            self.cache.delete(key + ":lock")
+        if entry["complete"]:
+            self._set_local(room_id, entry["rows"])
+        else:
+            self._drop_local(room_id)
+
+    def _acquire(self, key):
+        for _ in range(LOCK_ATTEMPTS):
+            if self.cache.add(key + ":lock", 1, LOCK_TIMEOUT):
+                return True
+            time.sleep(LOCK_WAIT)
+        return False
+
+    def _key(self, room_id):
+        # 元组格式（HISTORY_MESSAGE_FIELDS）改变时修改版本号，不读取旧格式的缓存
+        return f"chat:recent:v2:{self.name}:{room_id}"
+
+    def _get_local(self, room_id):
+        with self._local_lock:
+            item = self._local.get(room_id)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._local[room_id]
+                return None
+            self._local.move_to_end(room_id)
+            return item[1]
+
+    def _set_local(self, room_id, rows):
+        with self._local_lock:
+            self._local[room_id] = (time.monotonic() + self.local_ttl, rows)
+            self._local.move_to_end(room_id)
+            while len(self._local) > self.local_rooms:
+                self._local.popitem(last=False)
+
+    def _drop_local(self, room_id):
+        with self._local_lock:
+            self._local.pop(room_id, None)
+
+
+def merge_rows(limit, *row_lists):
+    """
+    合并几组 history_rows 元组，按id去重，按 (timestamp, id) 从新到旧排序，最多 limit 条
+    """
+    rows = {}
+    for row_list in row_lists:
+        for row in row_list:
+            rows[row[0]] = row
+    return sorted(rows.values(), key=lambda row: (row[-1], row[0]), reverse=True)[:limit]
@@ -4,3 +4,9 @@ MSG_TYPE_ENTER = 1
 MSG_TYPE_LEAVE = 2
 
 DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE = 10
+
+# 聊天页面右侧聊天列表每页的聊天数
+INBOX_PAGE_SIZE = 50
+
+# 在聊天室中收到对方消息后，延迟这么久（秒）再把未读数清零，连续的消息只清零一次
+MARK_READ_DELAY = 1.0
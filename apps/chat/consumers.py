@@ -1,36 +1,65 @@
+import asyncio
 import json
+import logging
 
-
-from channels.db import database_sync_to_async
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.core.paginator import Paginator
-from django.utils import timezone
 
+from account.consumers import AccountEventsConsumerMixin
 from account.utils import LazyAccountEncoder
+from chat.buffer import MessageWriteBuffer
+from chat.cache import RecentMessageCache, merge_rows
 from chat.exceptions import ClientError
-from chat.models import PrivateChatroom, ChatroomMessage
-from chat.utils import calculate_timestamp, LazyChatroomMessageEncoder
+from chat.models import PrivateChatroom, ChatroomMessage, UnreadChatRoomMessages
+from chat.utils import (
+    build_chat_message_frame, build_history_frame, history_page, history_page_before, history_row, history_rows,
+    pending_history_rows,
+)
 from friend.models import FriendList
-from chat.constants import MSG_TYPE_MESSAGE, MSG_TYPE_ENTER, MSG_TYPE_LEAVE, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE
+from metrics.instrumentation import database_sync_to_async, MetricsConsumerMixin
+from chat.constants import MSG_TYPE_ENTER, MSG_TYPE_LEAVE, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE, MARK_READ_DELAY
+
+logger = logging.getLogger(__name__)
+
+
+
+def record_flushed_messages(messages):
+    """
+    一批私聊消息写入数据库之后：更新聊天列表中的最后一条消息，增加接收者的未读数（每个聊天室一次）
+    """
+    PrivateChatroom.objects.record_messages(messages)
+    UnreadChatRoomMessages.objects.increment_for_messages(messages)
+
 
+# 当前worker进程的消息写缓冲
+private_message_buffer = MessageWriteBuffer(ChatroomMessage, on_flush=record_flushed_messages)
+# 当前worker进程的最近消息缓存（打开房间时的第一页聊天记录）
+private_recent_messages = RecentMessageCache("private", DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1)
 
-class ChatConsumer(AsyncJsonWebsocketConsumer):
+
+class ChatConsumer(MetricsConsumerMixin, AccountEventsConsumerMixin, AsyncJsonWebsocketConsumer):
+    metrics_commands = ("join", "leave", "send", "get_room_chat_messages", "get_room_chat_history", "get_user_info")
 
     async def connect(self):
         """
         WebSocket连接时调用
         """
-        print("ChatConsumer: connect: " + str(self.scope["user"]))
+        logger.debug("ChatConsumer: connect: %s", self.scope["user"])
 
         await self.accept()
 
         self.room_id = None
+        # join时完成授权的聊天室，连接存续期间复用，收到chat.room.revoked后失效
+        self.room = None
+        # 待执行的未读数清零
+        self.mark_read_handle = None
 
     async def receive_json(self, content):
         """
         接收前端发来的消息，并按照command进行处理
         """
-        print("ChatConsumer: receive_json")
+        logger.debug("ChatConsumer: receive_json")
         command = content.get("command", None)
         try:
             if command == "join":
@@ -43,17 +72,25 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
                 await self.send_room(content["room_id"], content["message"])
             elif command == "get_room_chat_messages":
                 await self.display_progress_bar(True)
-                room = await get_room_or_error(content['room_id'], self.scope['user'])
-                payload = await get_room_chat_messages(room, content['page_number'])
-                if payload is not None:
-                    payload = json.loads(payload)
-                    await self.send_messages_payload(payload['messages'], payload['new_page_number'])
+                room = await self.get_authorized_room(content['room_id'])
+                frame = await get_room_chat_messages(room, content['page_number'])
+                if frame is not None:
+                    await self.send_messages_payload(frame)
+                else:
+                    raise ClientError(204, "Database error")
+                await self.display_progress_bar(False)
+            elif command == "get_room_chat_history":
+                await self.display_progress_bar(True)
+                room = await self.get_authorized_room(content['room_id'])
+                frame = await get_room_chat_messages_before(room, content.get('before_msg_id'))
+                if frame is not None:
+                    await self.send_messages_payload(frame)
                 else:
                     raise ClientError(204, "Database error")
                 await self.display_progress_bar(False)
             elif command == "get_user_info":
                 await self.display_progress_bar(True)
-                room = await get_room_or_error(content['room_id'], self.scope["user"])
+                room = await self.get_authorized_room(content['room_id'])
                 payload = get_user_info(room, self.scope["user"])
                 if payload is not None:
                     payload = json.loads(payload)
@@ -69,12 +106,12 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         """
         关闭WebSocket连接
         """
-        print("ChatConsumer: disconnect")
+        logger.debug("ChatConsumer: disconnect")
         try:
             if self.room_id is not None:
                 await self.leave_room(self.room_id)
         except Exception as e:
-            print("EXCEPTION: " + str(e))
+            logger.exception("ChatConsumer: disconnect")
             pass
 
     # 几个处理命令的辅助函数
@@ -82,14 +119,15 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         """
         join 命令.
         """
-        print("ChatConsumer: join_room: " + str(room_id))
+        logger.debug("ChatConsumer: join_room: %s", room_id)
         try:
             room = await get_room_or_error(room_id, self.scope["user"])
         except ClientError as e:
             return await self.handle_client_error(e)
 
-        # 存储当前room_id
+        # 存储当前room_id，并缓存授权结果
         self.room_id = room.id
+        self.room = room
 
         # 将用户加入组中
         await self.channel_layer.group_add(
@@ -102,15 +140,18 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
             "join": str(room.id),
         })
 
+        # 打开聊天室即视为已读
+        await reset_unread_messages(room, self.scope["user"])
+
         # 组内发送消息，当前用户进入聊天
         if self.scope["user"].is_authenticated:
             # Notify the group that someone joined
-            await self.channel_layer.group_send(
+            await self.group_send(
                 room.group_name,
                 {
                     "type": "chat.join",  # chat_join()
                     "room_id": room_id,
-                    "profile_image": self.scope["user"].profile_image.url,
+                    "profile_image": self.scope["user"].avatar_url,
                     "username": self.scope["user"].username,
                     "user_id": self.scope["user"].id,
                 }
@@ -121,16 +162,22 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         Called by receive_json when someone sent a leave command.
         """
         # The logged-in user is in our scope thanks to the authentication ASGI middleware
-        print("ChatConsumer: leave_room")
-        room = await get_room_or_error(room_id, self.scope["user"])
+        logger.debug("ChatConsumer: leave_room")
+        room = await self.get_authorized_room(room_id)
+
+        # 离开前收到的消息都已经看过了
+        if self.mark_read_handle is not None:
+            self.mark_read_handle.cancel()
+            self.mark_read_handle = None
+            await reset_unread_messages(room, self.scope["user"])
 
         # Notify the group that someone left
-        await self.channel_layer.group_send(
+        await self.group_send(
             room.group_name,
             {
                 "type": "chat.leave",  # chat_leave
                 "room_id": room_id,
-                "profile_image": self.scope["user"].profile_image.url,
+                "profile_image": self.scope["user"].avatar_url,
                 "username": self.scope["user"].username,
                 "user_id": self.scope["user"].id,
             }
@@ -138,6 +185,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
 
         # Remove that we're in the room
         self.room_id = None
+        self.room = None
 
         # Remove them from the group so they no longer get room messages
         await self.channel_layer.group_discard(
@@ -153,7 +201,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         """
         Called by receive_json when someone sends a message to a room.
         """
-        print("ChatConsumer: send_room")
+        logger.debug("ChatConsumer: send_room")
         # Check they are in this room
         if self.room_id is not None:
             if str(room_id) != str(self.room_id):
@@ -161,21 +209,30 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         else:
             raise ClientError("ROOM_ACCESS_DENIED", "Room access denied")
 
-        # 获取聊天会话
-        room = await get_room_or_error(room_id, self.scope["user"])
+        # 使用join时缓存的聊天会话，不再重复授权
+        room = self.room
 
-        await create_room_chat_message(room, self.scope["user"], message)
+        # 先放入写缓冲（已分配id），立即广播，稍后批量写入数据库；
+        # 聊天列表和对方的未读数在写入之后按批更新（record_flushed_messages），不在广播之前逐条更新
+        chat_message = await private_message_buffer.add(room, self.scope["user"], message)
 
-        await self.channel_layer.group_send(
+        await self.group_send(
             room.group_name,
             {
                 "type": "chat.message",
-                "profile_image": self.scope["user"].profile_image.url,
-                "username": self.scope["user"].username,
+                "text": build_chat_message_frame(chat_message),
                 "user_id": self.scope["user"].id,
-                "message": message,
             }
         )
+        await sync_to_async(private_recent_messages.push)(room.id, history_row(chat_message))
+
+    async def get_authorized_room(self, room_id):
+        """
+        返回join时已经授权的聊天室；不是当前聊天室时，回退到数据库校验
+        """
+        if self.room is not None and str(room_id) == str(self.room.id):
+            return self.room
+        return await get_room_or_error(room_id, self.scope["user"])
 
     # 几个发送消息的工具函数
     async def chat_join(self, event):
@@ -183,7 +240,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         Called when someone has joined our chat.
         """
         # Send a message down to the client
-        print("ChatConsumer: chat_join: " + str(self.scope["user"].id))
+        logger.debug("ChatConsumer: chat_join: %s", self.scope["user"].id)
         if event["username"]:
             await self.send_json(
                 {
@@ -201,7 +258,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         Called when someone has left our chat.
         """
         # Send a message down to the client
-        print("ChatConsumer: chat_leave")
+        logger.debug("ChatConsumer: chat_leave")
         if event["username"]:
             await self.send_json(
                 {
@@ -218,26 +275,44 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         """
         Called when someone has messaged our chat.
         """
-        # Send a message down to the client
-        print("ChatConsumer: chat_message")
-        timestamp = calculate_timestamp(timezone.now())
+        # 消息帧已经在发送方编码好，直接转发给客户端
+        logger.debug("ChatConsumer: chat_message")
+        await self.send(text_data=event["text"])
+
+        # 用户正在聊天室中，对方发来的消息不算未读
+        if event.get("user_id") != self.scope["user"].id and self.mark_read_handle is None:
+            self.mark_read_handle = asyncio.get_event_loop().call_later(
+                MARK_READ_DELAY, lambda: asyncio.ensure_future(self.mark_room_read())
+            )
 
-        await self.send_json(
-            {
-                "msg_type": MSG_TYPE_MESSAGE,
-                "username": event["username"],
-                "user_id": event["user_id"],
-                "profile_image": event["profile_image"],
-                "message": event["message"],
-                "natural_timestamp": timestamp,
-            },
+    async def mark_room_read(self):
+        self.mark_read_handle = None
+        if self.room is not None:
+            await reset_unread_messages(self.room, self.scope["user"])
+
+    async def chat_room_revoked(self, event):
+        """
+        Called when the room is deactivated or the users are no longer friends.
+        Drops the cached authorization so the next command has to be authorized again.
+        """
+        logger.debug("ChatConsumer: chat_room_revoked")
+        if self.room is None or str(event["room_id"]) != str(self.room.id):
+            return
+        group_name = self.room.group_name
+        self.room_id = None
+        self.room = None
+        await self.channel_layer.group_discard(
+            group_name,
+            self.channel_name,
         )
+        await self.handle_client_error(ClientError("ROOM_ACCESS_REVOKED", "你们已经不是好友，无法继续聊天."))
 
     async def handle_client_error(self, e):
         """
         Called when a ClientError is raised.
         Sends error data to UI.
         """
+        self.count_client_error(e)
         errorData = {}
         errorData['error'] = e.code
         if e.message:
@@ -245,22 +320,19 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
             await self.send_json(errorData)
         return
 
-    async def send_messages_payload(self, messages, new_page_number):
+    async def send_messages_payload(self, frame):
         """
-        Send a payload of messages to the ui
+        Send a payload of messages to the ui.
+        frame 已由 build_history_frame 编码好（包括 next_cursor 或 new_page_number），直接发送
         """
-        print("ChatConsumer: send_messages_payload. ")
-        await self.send_json({
-            "messages_payload": "messages_payload",
-            "messages": messages,
-            "new_page_number": new_page_number,
-        })
+        logger.debug("ChatConsumer: send_messages_payload.")
+        await self.send(text_data=frame)
 
     async def send_user_info_payload(self, user_info):
         """
         Send a payload of user information to the ui
         """
-        print("ChatConsumer: send_user_info_payload. ")
+        logger.debug("ChatConsumer: send_user_info_payload.")
         await self.send_json({
             "user_info": user_info,
         })
@@ -272,7 +344,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
         2. is_displayed = False
             - Hide the progress bar on UI
         """
-        print("DISPLAY PROGRESS BAR: " + str(is_displayed))
+        logger.debug("DISPLAY PROGRESS BAR: %s", is_displayed)
         await self.send_json({
             "display_progress_bar": is_displayed
         })
@@ -300,6 +372,11 @@ def get_room_or_error(room_id, user):
     return room
 
 
+@database_sync_to_async
+def reset_unread_messages(room, user):
+    return UnreadChatRoomMessages.objects.reset(room, user)
+
+
 def get_user_info(room, user):
     """
     获取聊天对象的消息
@@ -316,33 +393,65 @@ def get_user_info(room, user):
         payload['user_info'] = s.serialize([other_user])[0]
         return json.dumps(payload)
     except ClientError as e:
-        print("ClientError: " + str(e))
+        logger.exception("get_user_info")
 
     return None
 
 
+def get_newest_history_rows(room):
+    """
+    最新一页（多一条用于判断是否还有更早的消息）：先查最近消息缓存，
+    未命中时查询数据库，带上还在写缓冲中的消息（按id去重），再写入缓存
+    """
+    rows = private_recent_messages.get(room.id)
+    if rows is None:
+        qs = ChatroomMessage.objects.by_room(room)
+        rows = list(history_rows(qs)[:DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1])
+        pending = pending_history_rows(private_message_buffer.pending_for_room(room.id))
+        rows = merge_rows(DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1, pending, rows)
+        rows = private_recent_messages.fill(room.id, rows)
+    return rows
+
+
 @database_sync_to_async
-def create_room_chat_message(room, user, message):
-    return ChatroomMessage.objects.create(user=user, room=room, content=message)
+def get_room_chat_messages_before(room, msg_id):
+    """
+    游标分页获取聊天记录：多取一条用于判断是否还有更早的消息，不做COUNT
+    """
+    try:
+        if msg_id is None:
+            rows, next_cursor = history_page(get_newest_history_rows(room), DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+        else:
+            pending = pending_history_rows(private_message_buffer.pending_for_room(room.id))
+            rows, next_cursor = history_page_before(
+                ChatroomMessage.objects, room, msg_id, pending, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+        return build_history_frame(rows, next_cursor=next_cursor)
+    except Exception as e:
+        logger.exception("get_room_chat_messages_before")
+        return None
 
 
 @database_sync_to_async
 def get_room_chat_messages(room, page_number):
+    """
+    旧的页码分页协议，保留以兼容旧客户端；新客户端使用 get_room_chat_history
+    """
     try:
-        qs = ChatroomMessage.objects.by_room(room)
-        p = Paginator(qs, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+        if int(page_number) == 1:
+            rows = get_newest_history_rows(room)[:DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE]
+            return build_history_frame(rows, new_page_number=2)
 
-        payload = {}
+        qs = history_rows(ChatroomMessage.objects.by_room(room))
+        p = Paginator(qs, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
 
         new_page_number = int(page_number)
         if new_page_number <= p.num_pages:
-            new_page_number = new_page_number + 1
-            s = LazyChatroomMessageEncoder()
-            payload['messages'] = s.serialize(p.page(page_number).object_list)
-        else:
-            payload['messages'] = "None"
-        payload['new_page_number'] = new_page_number
-        return json.dumps(payload)
+            return build_history_frame(p.page(page_number).object_list, new_page_number=new_page_number + 1)
+        return json.dumps({
+            "messages_payload": "messages_payload",
+            "messages": "None",
+            "new_page_number": new_page_number,
+        })
     except Exception as e:
-        print("EXCEPTION: " + str(e))
+        logger.exception("get_room_chat_messages")
         return None
\ No newline at end of file
@@ -0,0 +1,19 @@
+# Generated by Django 2.2.15 on 2026-10-17 11:38
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0003_auto_20261017_1136'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chatroommessage',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
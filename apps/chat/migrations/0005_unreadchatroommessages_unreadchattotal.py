@@ -0,0 +1,46 @@
+# Generated by Django 2.2.15 on 2026-10-17 11:56
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('account', '0001_initial'),
+        ('chat', '0004_auto_20261017_1138'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadChatTotal',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '未读私聊消息总数',
+                'verbose_name_plural': '未读私聊消息总数',
+                'db_table': 'tb_unread_chat_total',
+            },
+        ),
+        migrations.CreateModel(
+            name='UnreadChatRoomMessages',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('most_recent_message', models.CharField(blank=True, max_length=500, null=True)),
+                ('reset_timestamp', models.DateTimeField()),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chat.PrivateChatroom')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '未读私聊消息',
+                'verbose_name_plural': '未读私聊消息',
+                'db_table': 'tb_unread_chatroom_messages',
+                'unique_together': {('user', 'room')},
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.2.15 on 2026-10-17 11:59
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Substr
+import django.utils.timezone
+
+
+def fill_last_message(apps, schema_editor):
+    """
+    已有的聊天室用最后一条消息填充 last_message 和 last_activity
+    """
+    PrivateChatroom = apps.get_model('chat', 'PrivateChatroom')
+    ChatroomMessage = apps.get_model('chat', 'ChatroomMessage')
+    latest = ChatroomMessage.objects.filter(room=OuterRef('pk')).order_by('-timestamp', '-id')
+    PrivateChatroom.objects.filter(pk__in=ChatroomMessage.objects.values('room')).update(
+        last_message=Subquery(latest.annotate(preview=Substr('content', 1, 500)).values('preview')[:1]),
+        last_activity=Subquery(latest.values('timestamp')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0005_unreadchatroommessages_unreadchattotal'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='privatechatroom',
+            name='last_activity',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='privatechatroom',
+            name='last_message',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.AddIndex(
+            model_name='privatechatroom',
+            index=models.Index(fields=['user1', '-last_activity'], name='private_room_u1_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privatechatroom',
+            index=models.Index(fields=['user2', '-last_activity'], name='private_room_u2_activity_idx'),
+        ),
+        migrations.RunPython(fill_last_message, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:01
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def normalize_pairs(apps, schema_editor):
+    """
+    每对用户只保留一个聊天室（id最小的），并让 user1 < user2。
+    重复聊天室的消息和未读数合并到保留的聊天室中；自己和自己的聊天室不满足 user1 < user2，直接删除
+    """
+    PrivateChatroom = apps.get_model('chat', 'PrivateChatroom')
+    ChatroomMessage = apps.get_model('chat', 'ChatroomMessage')
+    UnreadChatRoomMessages = apps.get_model('chat', 'UnreadChatRoomMessages')
+    Notification = apps.get_model('notification', 'Notification')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    unread_type = ContentType.objects.filter(app_label='chat', model='unreadchatroommessages').first()
+
+    self_rooms = PrivateChatroom.objects.filter(user1=F('user2'))
+    self_unread = UnreadChatRoomMessages.objects.filter(room__in=self_rooms).values_list('pk', flat=True)
+    Notification.objects.filter(content_type=unread_type, object_id__in=list(self_unread)).delete()
+    # 消息和未读数随聊天室级联删除
+    self_rooms.delete()
+
+    kept = {}
+    for room in PrivateChatroom.objects.order_by('id'):
+        pair = (min(room.user1_id, room.user2_id), max(room.user1_id, room.user2_id))
+        keep = kept.setdefault(pair, room)
+        if keep.pk == room.pk:
+            continue
+
+        ChatroomMessage.objects.filter(room=room).update(room=keep)
+        for unread in UnreadChatRoomMessages.objects.filter(room=room):
+            notifications = Notification.objects.filter(content_type=unread_type, object_id=unread.pk)
+            target = UnreadChatRoomMessages.objects.filter(room=keep, user_id=unread.user_id).first()
+            if target is None:
+                UnreadChatRoomMessages.objects.filter(pk=unread.pk).update(room=keep)
+                for pk, redirect_url in notifications.values_list('pk', 'redirect_url'):
+                    Notification.objects.filter(pk=pk).update(
+                        redirect_url=redirect_url.replace(f"room_id={room.pk}", f"room_id={keep.pk}"))
+            else:
+                UnreadChatRoomMessages.objects.filter(pk=target.pk).update(count=F('count') + unread.count)
+                notifications.delete()
+                unread.delete()
+
+        if room.last_activity > keep.last_activity:
+            keep.last_activity = room.last_activity
+            keep.last_message = room.last_message
+        keep.is_active = keep.is_active or room.is_active
+        PrivateChatroom.objects.filter(pk=keep.pk).update(
+            last_activity=keep.last_activity, last_message=keep.last_message, is_active=keep.is_active)
+        room.delete()
+
+    PrivateChatroom.objects.filter(user1__gt=F('user2')).update(user1=F('user2'), user2=F('user1'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0006_privatechatroom_last_activity'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('notification', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_pairs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='privatechatroom',
+            constraint=models.UniqueConstraint(fields=('user1', 'user2'), name='private_room_unique_pair'),
+        ),
+        migrations.AddConstraint(
+            model_name='privatechatroom',
+            constraint=models.CheckConstraint(check=models.Q(user1__lt=F('user2')), name='private_room_ordered_pair'),
+        ),
+    ]
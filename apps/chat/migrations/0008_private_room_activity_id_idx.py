@@ -0,0 +1,29 @@
+# Generated by Django 2.2.15 on 2026-10-17 13:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0007_privatechatroom_unique_pair'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='privatechatroom',
+            name='private_room_u1_activity_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='privatechatroom',
+            name='private_room_u2_activity_idx',
+        ),
+        migrations.AddIndex(
+            model_name='privatechatroom',
+            index=models.Index(fields=['user1', '-last_activity', '-id'], name='private_room_u1_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privatechatroom',
+            index=models.Index(fields=['user2', '-last_activity', '-id'], name='private_room_u2_activity_idx'),
+        ),
+    ]
@@ -1,5 +1,67 @@
-from django.db import models
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import F, Q, Subquery
 from django.conf import settings
+from django.utils import timezone
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from chat.constants import INBOX_PAGE_SIZE
+from notification.models import Notification
+from notification.utils import push_notifications_on_commit, push_to_user
+
+
+class PrivateChatroomManager(models.Manager):
+    def get_or_create_for_pair(self, user1, user2):
+        """
+        两个用户之间的聊天（不区分顺序），不存在时创建。
+        按id排序后 user1 < user2，(user1, user2) 唯一，并发创建时只会有一个成功。
+        不能和自己聊天（user1 < user2 的约束），抛出 ValueError
+        """
+        if user1.id == user2.id:
+            raise ValueError("Cannot create a private chat with yourself.")
+        if user1.id > user2.id:
+            user1, user2 = user2, user1
+        return self.get_or_create(user1=user1, user2=user2)
+
+    def inbox_page(self, user, cursor=None, page_size=INBOX_PAGE_SIZE):
+        """
+        游标分页：返回 (用户的一页聊天, 下一页的游标)，最近有消息的在前，没有更多聊天时游标为None。
+        cursor 为上一页最后一个聊天的 (last_activity, id)，为空时从最新的聊天开始。
+        user 作为 user1 和作为 user2 的聊天分别查询（各自按 (user1/user2, -last_activity, -id) 索引顺序读取，
+        最多 page_size+1 行，不排序用户的全部聊天），在内存中合并后多取一条判断是否还有下一页
+        """
+        rooms = []
+        for field in ("user1", "user2"):
+            qs = self.filter(**{field: user}, is_active=True).select_related("user1", "user2") \
+                .order_by("-last_activity", "-id")
+            if cursor is not None:
+                last_activity, room_id = cursor
+                qs = qs.filter(Q(last_activity__lt=last_activity) | Q(last_activity=last_activity, id__lt=room_id))
+            rooms += qs[:page_size + 1]
+        rooms.sort(key=lambda room: (room.last_activity, room.id), reverse=True)
+        if len(rooms) > page_size:
+            last = rooms[page_size - 1]
+            return rooms[:page_size], (last.last_activity, last.id)
+        return rooms, None
+
+    def record_messages(self, messages):
+        """
+        一批消息写入数据库之后更新聊天列表中显示的最后一条消息和排序用的时间：
+        每个聊天室一条UPDATE，使用这批消息中该聊天室的最后一条；
+        last_activity 已经更新的聊天室（其他进程先写入了更新的消息）不会被旧消息覆盖
+        """
+        latest = {}
+        for message in messages:
+            current = latest.get(message.room_id)
+            if current is None or (message.timestamp, message.id) > (current.timestamp, current.id):
+                latest[message.room_id] = message
+        for room_id, message in latest.items():
+            self.filter(pk=room_id, last_activity__lte=message.timestamp) \
+                .update(last_message=message.content[:500], last_activity=message.timestamp)
 
 
 class PrivateChatroom(models.Model):
@@ -11,8 +73,23 @@ class PrivateChatroom(models.Model):
 
     is_active = models.BooleanField(default=True)
 
+    # 冗余字段：聊天列表按最近消息排序并显示预览，不再逐个聊天室查询消息表
+    last_message = models.CharField(max_length=500, blank=True, default="")
+    last_activity = models.DateTimeField(default=timezone.now)
+
+    objects = PrivateChatroomManager()
+
     class Meta:
         db_table = 'tb_private_chatroom'
+        constraints = [
+            models.UniqueConstraint(fields=['user1', 'user2'], name='private_room_unique_pair'),
+            models.CheckConstraint(check=Q(user1__lt=F('user2')), name='private_room_ordered_pair'),
+        ]
+        indexes = [
+            # 聊天列表（inbox_page）按索引顺序读取
+            models.Index(fields=['user1', '-last_activity', '-id'], name='private_room_u1_activity_idx'),
+            models.Index(fields=['user2', '-last_activity', '-id'], name='private_room_u2_activity_idx'),
+        ]
         verbose_name = '私聊'
         verbose_name_plural = verbose_name
 
@@ -27,10 +104,44 @@ class PrivateChatroom(models.Model):
         """
         return f"PrivateChatRoom-{self.id}"
 
+    def get_other_user(self, user):
+        return self.user2 if self.user1_id == user.id else self.user1
+
+    def revoke_access(self):
+        """
+        通知已加入该聊天室的socket丢弃缓存的授权（被删除好友或聊天室失效时调用）
+        """
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        async_to_sync(channel_layer.group_send)(
+            self.group_name,
+            {
+                "type": "chat.room.revoked",  # ChatConsumer.chat_room_revoked()
+                "room_id": self.id,
+            }
+        )
+
 
 class ChatroomMessageManager(models.Manager):
     def by_room(self, room):
-        qs = ChatroomMessage.objects.filter(room=room).order_by("-timestamp")
+        qs = ChatroomMessage.objects.filter(room=room).order_by("-timestamp", "-id")
+        return qs
+
+    def by_room_before(self, room, msg_id=None, timestamp=None):
+        """
+        游标分页：返回 (timestamp, msg_id) 之前（更早）的消息，不使用COUNT(*)和OFFSET。
+        走 (room, -timestamp, -id) 索引，msg_id 为空时从最新消息开始；
+        没有 timestamp 时按主键查询 msg_id 的时间戳（这条消息必须已经写入数据库）
+        """
+        qs = self.by_room(room)
+        if msg_id is not None and timestamp is not None:
+            qs = qs.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=msg_id))
+        elif msg_id is not None:
+            anchor = ChatroomMessage.objects.filter(pk=msg_id).values("timestamp")[:1]
+            qs = qs.filter(
+                Q(timestamp__lt=Subquery(anchor)) | Q(timestamp=Subquery(anchor), id__lt=msg_id)
+            )
         return qs
 
 
@@ -40,15 +151,170 @@ class ChatroomMessage(models.Model):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     room = models.ForeignKey(PrivateChatroom, on_delete=models.CASCADE)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # 使用default而不是auto_now_add，写缓冲中预先生成的时间戳在bulk_create时不会被覆盖
+    timestamp = models.DateTimeField(default=timezone.now)
     content = models.TextField(unique=False, blank=False, )
 
     objects = ChatroomMessageManager()
 
     class Meta:
         db_table = 'tb_private_chatroom_message'
+        indexes = [
+            models.Index(fields=['room', '-timestamp', '-id'], name='private_msg_room_ts_idx'),
+        ]
         verbose_name = '私聊消息'
         verbose_name_plural = verbose_name
 
     def __str__(self):
         return self.content
+
+
+class UnreadChatRoomMessagesManager(models.Manager):
+    def increment_for_messages(self, messages):
+        """
+        写缓冲写入一批私聊消息之后调用（MessageWriteBuffer.on_flush）：
+        每个 (接收者, 聊天室) 只更新一次未读数和一次通知，不在发送每条消息时更新。
+        接收者上次清零（reset）之后的消息才计入未读，清零在写入之前发生时（接收者已经在聊天室中看到了消息）不会多算
+        """
+        groups = {}
+        for message in messages:
+            recipient = message.room.get_other_user(message.user)
+            groups.setdefault((recipient.id, message.room_id), (recipient, []))[1].append(message)
+        for recipient, room_messages in groups.values():
+            self._increment(recipient, room_messages)
+
+    def _increment(self, user, messages):
+        room = messages[0].room
+        with transaction.atomic():
+            # 先锁住 (user, room) 这一行，再更新总数，与 reset 的加锁顺序相同
+            unread, created = self.select_for_update().get_or_create(
+                room=room, user=user, defaults={"reset_timestamp": timezone.now()})
+            if not created:
+                messages = [m for m in messages if m.timestamp > unread.reset_timestamp]
+            if not messages:
+                return
+            latest = max(messages, key=lambda m: (m.timestamp, m.id))
+            self.filter(pk=unread.pk).update(count=F("count") + len(messages),
+                                             most_recent_message=latest.content[:500])
+            UnreadChatTotal.objects.add(user, len(messages))
+
+            content_type = ContentType.objects.get_for_model(UnreadChatRoomMessages)
+            verb = latest.content[:255]
+            if Notification.objects.filter(target=user, content_type=content_type, object_id=unread.pk).update(
+                    verb=verb, timestamp=timezone.now(), read=False):
+                # update() 不触发 post_save，需要自己推送
+                push_notifications_on_commit(target=user, content_type=content_type, object_id=unread.pk)
+            else:
+                Notification.objects.create(
+                    target=user,
+                    from_user=latest.user,
+                    redirect_url=f"{settings.BASE_URL}/chat/?room_id={room.id}",
+                    verb=verb,
+                    content_type=content_type,
+                    object_id=unread.pk,
+                )
+
+    def reset(self, room, user):
+        """
+        user 已经阅读了 room 中的消息：记录清零时间（之后才写入的更早的消息不再计入未读），
+        未读数清零，从总数中减去，删除对应的通知。返回清零前的未读数
+        """
+        with transaction.atomic():
+            unread, _ = self.select_for_update().get_or_create(
+                room=room, user=user, defaults={"reset_timestamp": timezone.now()})
+            count = unread.count
+            unread.count = 0
+            unread.reset_timestamp = timezone.now()
+            unread.save(update_fields=["count", "reset_timestamp"])
+            if count == 0:
+                return 0
+            UnreadChatTotal.objects.add(user, -count)
+            unread.notifications.all().delete()
+            return count
+
+
+class UnreadChatRoomMessages(models.Model):
+    """
+    每个用户在每个私聊聊天室中的未读消息数。
+    私聊消息写入数据库后按批增加（private_message_buffer 的 on_flush），用户进入聊天室或在聊天室中收到消息后清零
+    """
+    room = models.ForeignKey(PrivateChatroom, on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    count = models.PositiveIntegerField(default=0)
+    most_recent_message = models.CharField(max_length=500, blank=True, null=True)
+    # 上次清零的时间
+    reset_timestamp = models.DateTimeField()
+
+    notifications = GenericRelation(Notification)
+
+    objects = UnreadChatRoomMessagesManager()
+
+    class Meta:
+        db_table = 'tb_unread_chatroom_messages'
+        unique_together = [('user', 'room')]
+        verbose_name = '未读私聊消息'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.user} 在 {self.room} 中的未读消息"
+
+    @property
+    def get_cname(self):
+        """
+        For determining what kind of object is associated with a Notification
+        """
+        return "UnreadChatRoomMessages"
+
+    def get_other_user(self):
+        return self.room.user2 if self.room.user1_id == self.user_id else self.room.user1
+
+
+class UnreadChatTotalManager(models.Manager):
+    def add(self, user, amount):
+        if not self.filter(user=user).update(count=F("count") + amount):
+            self.get_or_create(user=user)
+            self.filter(user=user).update(count=F("count") + amount)
+        transaction.on_commit(lambda: self.push_count(user))
+
+    def push_count(self, user):
+        """
+        未读总数推送给用户已连接的通知socket（导航栏上的红点）
+        """
+        push_to_user(user.id, {
+            "type": "notification.chat.count",  # NotificationConsumer.notification_chat_count()
+            "count": self.count_for(user),
+        })
+
+    def count_for(self, user):
+        """
+        用户所有聊天室的未读消息总数，主键查询，不统计消息表
+        """
+        return self.filter(user=user).values_list("count", flat=True).first() or 0
+
+
+class UnreadChatTotal(models.Model):
+    """
+    每个用户所有聊天室的未读消息总数（= 该用户所有 UnreadChatRoomMessages.count 之和），
+    与 UnreadChatRoomMessages 在同一个事务中更新
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True)
+    count = models.IntegerField(default=0)
+
+    objects = UnreadChatTotalManager()
+
+    class Meta:
+        db_table = 'tb_unread_chat_total'
+        verbose_name = '未读私聊消息总数'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.user}: {self.count}"
+
+
+@receiver(post_save, sender=PrivateChatroom)
+def revoke_inactive_chatroom(sender, instance, created, **kwargs):
+    """
+    聊天室被设为失效时，立即让已连接的socket失去授权
+    """
+    if not created and not instance.is_active:
+        instance.revoke_access()
@@ -1,3 +1,260 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import Account
+from chat.buffer import MessageWriteBuffer
+from chat.consumers import record_flushed_messages
+from chat.models import ChatroomMessage, PrivateChatroom, UnreadChatRoomMessages, UnreadChatTotal
+from notification.models import Notification
+from chat.utils import find_or_create_private_chat, history_page, history_page_before, history_row, history_rows
+
+PAGE_SIZE = 30
+
+
+class HistoryCursorTests(TestCase):
+    """
+    游标分页跨越写缓冲：最新的消息还没有写入数据库时，后面的页不能丢失
+    """
+
+    def setUp(self):
+        self.user1 = Account.objects.create_user("a@test.local", "a", "password")
+        self.user2 = Account.objects.create_user("b@test.local", "b", "password")
+        self.room, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user2)
+        self.start = timezone.now() - timedelta(hours=1)
+
+    def message(self, i):
+        return ChatroomMessage(id=i, room=self.room, user=self.user1, content=f"m{i}",
+                               timestamp=self.start + timedelta(seconds=i))
+
+    def fill(self, flushed, pending):
+        """
+        id 1..flushed 已经写入数据库，之后的 pending 条还在写缓冲中，返回缓冲中的行（新的在前）
+        """
+        ChatroomMessage.objects.bulk_create([self.message(i) for i in range(1, flushed + 1)])
+        return [history_row(self.message(i)) for i in range(flushed + pending, flushed, -1)]
+
+    def newest_page(self, pending):
+        rows = list(history_rows(ChatroomMessage.objects.by_room(self.room))[:PAGE_SIZE + 1])
+        return history_page(sorted(pending + rows, key=lambda row: row[0], reverse=True)[:PAGE_SIZE + 1], PAGE_SIZE)
+
+    def collect(self, pending):
+        rows, cursor = self.newest_page(pending)
+        ids = [row[0] for row in rows]
+        while cursor is not None:
+            rows, cursor = history_page_before(ChatroomMessage.objects, self.room, cursor, pending, PAGE_SIZE)
+            ids += [row[0] for row in rows]
+        return ids
+
+    def test_pages_across_pending_messages(self):
+        pending = self.fill(40, 35)
+        self.assertEqual(self.collect(pending), list(range(75, 0, -1)))
+
+    def test_all_flushed(self):
+        pending = self.fill(65, 0)
+        self.assertEqual(self.collect(pending), list(range(65, 0, -1)))
+
+    def test_cursor_carries_timestamp(self):
+        pending = self.fill(40, 35)
+        _, cursor = self.newest_page(pending)
+        # 游标指向的消息（id 46）还没有写入数据库，下一页只靠游标中的时间戳定位
+        self.assertFalse(ChatroomMessage.objects.filter(pk=46).exists())
+        rows, _ = history_page_before(ChatroomMessage.objects, self.room, cursor, [], PAGE_SIZE)
+        self.assertEqual(rows[0][0], 40)
+
+    def test_legacy_message_id_cursor(self):
+        pending = self.fill(40, 35)
+        rows, _ = history_page_before(ChatroomMessage.objects, self.room, "46", pending, PAGE_SIZE)
+        self.assertEqual([row[0] for row in rows], list(range(45, 15, -1)))
+        rows, cursor = history_page_before(ChatroomMessage.objects, self.room, "20", pending, PAGE_SIZE)
+        self.assertEqual([row[0] for row in rows], list(range(19, 0, -1)))
+        self.assertIsNone(cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            history_page_before(ChatroomMessage.objects, self.room, "not-a-cursor", [], PAGE_SIZE)
+
+
+class MessageWriteBufferTests(TestCase):
+
+    def setUp(self):
+        self.user1 = Account.objects.create_user("a@test.local", "a", "password")
+        self.user2 = Account.objects.create_user("b@test.local", "b", "password")
+        self.room, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user2)
+
+    def test_reserved_ids_are_not_reused(self):
+        # 两个进程的缓冲和普通的INSERT不会拿到相同的id
+        buffer1 = MessageWriteBuffer(ChatroomMessage, max_size=5, flush_interval=60)
+        buffer2 = MessageWriteBuffer(ChatroomMessage, max_size=5, flush_interval=60)
+        ids = [buffer.allocate_id() for _ in range(7) for buffer in (buffer1, buffer2)]
+        direct = ChatroomMessage.objects.create(room=self.room, user=self.user1, content="direct")
+        self.assertEqual(len(set(ids + [direct.id])), 15)
+        self.assertGreater(direct.id, max(ids))
+
+    def test_flush_sync_writes_pending_messages(self):
+        buffer = MessageWriteBuffer(ChatroomMessage, max_size=5, flush_interval=60)
+        message = ChatroomMessage(id=buffer.allocate_id(), room=self.room, user=self.user1, content="hello",
+                                  timestamp=timezone.now())
+        buffer._pending.append(message)
+        buffer.flush_sync()
+        self.assertEqual(buffer.depth, 0)
+        self.assertTrue(ChatroomMessage.objects.filter(pk=message.id, content="hello").exists())
+
+
+class UnreadCounterTests(TestCase):
+    """
+    未读数在消息写入之后按批增加（写缓冲的 on_flush）
+    """
+
+    def setUp(self):
+        self.user1 = Account.objects.create_user("a@test.local", "a", "password")
+        self.user2 = Account.objects.create_user("b@test.local", "b", "password")
+        self.room, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user2)
+        self.buffer = MessageWriteBuffer(ChatroomMessage, max_size=50, flush_interval=60,
+                                         on_flush=record_flushed_messages)
+
+    def send(self, user, content, timestamp=None):
+        message = ChatroomMessage(id=self.buffer.allocate_id(), room=self.room, user=user, content=content,
+                                  timestamp=timestamp or timezone.now())
+        self.buffer._pending.append(message)
+        return message
+
+    def unread(self, user):
+        return UnreadChatRoomMessages.objects.get(room=self.room, user=user)
+
+    def test_flush_increments_recipient_once_per_room(self):
+        for i in range(5):
+            self.send(self.user1, f"m{i}")
+        self.send(self.user2, "reply")
+        self.buffer.flush_sync()
+
+        self.assertEqual(self.unread(self.user2).count, 5)
+        self.assertEqual(self.unread(self.user2).most_recent_message, "m4")
+        self.assertEqual(self.unread(self.user1).count, 1)
+        self.assertEqual(UnreadChatTotal.objects.count_for(self.user2), 5)
+        self.assertEqual(UnreadChatTotal.objects.count_for(self.user1), 1)
+        # 每个聊天室一条通知，内容是最后一条消息
+        notifications = Notification.objects.filter(target=self.user2)
+        self.assertEqual([n.verb for n in notifications], ["m4"])
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.last_message, "reply")
+
+    def test_messages_read_before_flush_are_not_counted(self):
+        # 接收者在聊天室中已经看到了消息（清零），消息之后才写入数据库
+        self.send(self.user1, "seen", timezone.now() - timedelta(seconds=5))
+        UnreadChatRoomMessages.objects.reset(self.room, self.user2)
+        self.send(self.user1, "new")
+        self.buffer.flush_sync()
+
+        self.assertEqual(self.unread(self.user2).count, 1)
+        self.assertEqual(UnreadChatTotal.objects.count_for(self.user2), 1)
+
+    def test_reset(self):
+        for i in range(3):
+            self.send(self.user1, f"m{i}")
+        self.buffer.flush_sync()
+
+        self.assertEqual(UnreadChatRoomMessages.objects.reset(self.room, self.user2), 3)
+        self.assertEqual(self.unread(self.user2).count, 0)
+        self.assertEqual(UnreadChatTotal.objects.count_for(self.user2), 0)
+        self.assertFalse(Notification.objects.filter(target=self.user2).exists())
+        self.assertEqual(UnreadChatRoomMessages.objects.reset(self.room, self.user2), 0)
+
+
+class InboxTests(TestCase):
+
+    def setUp(self):
+        self.user1 = Account.objects.create_user("a@test.local", "a", "password")
+        self.user2 = Account.objects.create_user("b@test.local", "b", "password")
+        self.user3 = Account.objects.create_user("c@test.local", "c", "password")
+        self.room1, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user2)
+        self.room2, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user3)
+
+    def message(self, room, content, seconds):
+        return ChatroomMessage(room=room, user=self.user1, content=content,
+                               timestamp=timezone.now() + timedelta(seconds=seconds))
+
+    def test_one_update_per_room(self):
+        messages = [self.message(self.room1, "a1", 1), self.message(self.room2, "b1", 2),
+                    self.message(self.room1, "a3", 3), self.message(self.room1, "a2", 2)]
+        with self.assertNumQueries(2):
+            PrivateChatroom.objects.record_messages(messages)
+        self.room1.refresh_from_db()
+        self.room2.refresh_from_db()
+        self.assertEqual((self.room1.last_message, self.room2.last_message), ("a3", "b1"))
+
+    def test_older_flush_does_not_overwrite(self):
+        PrivateChatroom.objects.record_messages([self.message(self.room1, "new", 10)])
+        PrivateChatroom.objects.record_messages([self.message(self.room1, "old", 5)])
+        self.room1.refresh_from_db()
+        self.assertEqual(self.room1.last_message, "new")
+
+
+class PrivateChatroomPairTests(TestCase):
+
+    def setUp(self):
+        self.user1 = Account.objects.create_user("a@test.local", "a", "password")
+        self.user2 = Account.objects.create_user("b@test.local", "b", "password")
+
+    def test_pair_is_ordered(self):
+        room, created = PrivateChatroom.objects.get_or_create_for_pair(self.user2, self.user1)
+        self.assertTrue(created)
+        self.assertEqual((room.user1, room.user2), (self.user1, self.user2))
+        same, created = PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user2)
+        self.assertFalse(created)
+        self.assertEqual(same, room)
+        self.assertEqual(find_or_create_private_chat(self.user2, self.user1), room)
+
+    def test_self_pair_is_rejected(self):
+        with self.assertRaises(ValueError):
+            PrivateChatroom.objects.get_or_create_for_pair(self.user1, self.user1)
+        with self.assertRaises(ValueError):
+            find_or_create_private_chat(self.user1, self.user1)
+        self.assertFalse(PrivateChatroom.objects.exists())
+
+    def test_view_rejects_self_chat(self):
+        self.client.force_login(self.user1)
+        response = self.client.post(reverse("chat:create-or-return-private-chat"), {"user2_id": self.user1.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("chatroom_id", response.json())
+        self.assertFalse(PrivateChatroom.objects.exists())
+
+
+class InboxPageTests(TestCase):
+
+    def setUp(self):
+        self.user = Account.objects.create_user("m@test.local", "m", "password")
+        now = timezone.now()
+        self.rooms = []
+        for i in range(7):
+            other = Account.objects.create_user(f"u{i}@test.local", f"u{i}", "password")
+            # 一半聊天中 user 是 user1，一半是 user2
+            room, _ = PrivateChatroom.objects.get_or_create_for_pair(self.user, other)
+            # 两个聊天的 last_activity 相同，按id排序
+            PrivateChatroom.objects.filter(pk=room.pk).update(last_activity=now - timedelta(minutes=i // 2 * 2))
+            self.rooms.append(room)
+        inactive, _ = PrivateChatroom.objects.get_or_create_for_pair(
+            self.user, Account.objects.create_user("x@test.local", "x", "password"))
+        PrivateChatroom.objects.filter(pk=inactive.pk).update(is_active=False)
+
+    def test_pages_follow_last_activity(self):
+        expected = [room.pk for room in sorted(
+            PrivateChatroom.objects.filter(pk__in=[r.pk for r in self.rooms]),
+            key=lambda room: (room.last_activity, room.id), reverse=True)]
+        ids, cursor = [], None
+        while True:
+            with self.assertNumQueries(2):
+                rooms, cursor = PrivateChatroom.objects.inbox_page(self.user, cursor, page_size=3)
+            ids += [room.pk for room in rooms]
+            if cursor is None:
+                break
+        self.assertEqual(ids, expected)
 
-# Create your tests here.
+    def test_view_uses_cursor(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("chat:private-chat-room"))
+        self.assertEqual(len(response.context["m_and_f"]), 7)
+        self.assertIsNone(response.context["inbox_next_cursor"])
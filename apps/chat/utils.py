@@ -1,36 +1,67 @@
-from datetime import datetime
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
-from django.contrib.humanize.templatetags.humanize import naturalday
-from django.core.serializers.python import Serializer
+from django.conf import settings
+from django.utils import timezone
 
+from account.utils import get_avatar_url
+from chat.cache import merge_rows
 from chat.constants import MSG_TYPE_MESSAGE
 from chat.models import PrivateChatroom
+from notification.utils import decode_cursor, encode_cursor
+
+# 聊天记录只取这几列（一次join用户表），顺序与 build_history_frame 中的解包一致
+HISTORY_MESSAGE_FIELDS = (
+    "id", "user_id", "user__username", "user__profile_image", "user__avatar_hash", "content", "timestamp",
+)
+
+
+# 进程内缓存 (较小的用户id, 较大的用户id) -> 私聊id，用户对对应的聊天室不会改变
+_private_room_ids = OrderedDict()
+_private_room_ids_lock = threading.Lock()
 
 
 def find_or_create_private_chat(user1, user2):
     """
-    获取两个用户之间的聊天，如果不存在，创建一个
+    获取两个用户之间的聊天，如果不存在，创建一个。
+    缓存命中时按主键查询，否则走 (user1, user2) 唯一索引 get_or_create。
+    user1 和 user2 是同一个用户时抛出 ValueError
     """
-    try:
-        chat = PrivateChatroom.objects.get(user1=user1, user2=user2)
-    except PrivateChatroom.DoesNotExist:
+    if user1.id == user2.id:
+        raise ValueError("Cannot create a private chat with yourself.")
+    key = (min(user1.id, user2.id), max(user1.id, user2.id))
+    with _private_room_ids_lock:
+        room_id = _private_room_ids.get(key)
+    if room_id is not None:
         try:
-            chat = PrivateChatroom.objects.get(user1=user2, user2=user1)
+            return PrivateChatroom.objects.get(pk=room_id)
         except PrivateChatroom.DoesNotExist:
-            chat = PrivateChatroom(user1=user1, user2=user2)
-            chat.save()
+            # 聊天室已被删除（例如用户被删除），重新创建
+            pass
+    chat, _ = PrivateChatroom.objects.get_or_create_for_pair(user1, user2)
+    with _private_room_ids_lock:
+        _private_room_ids[key] = chat.id
+        _private_room_ids.move_to_end(key)
+        while len(_private_room_ids) > getattr(settings, "CHAT_PRIVATE_ROOM_CACHE_SIZE", 10000):
+            _private_room_ids.popitem(last=False)
     return chat
 
 
-def calculate_timestamp(timestamp):
+def calculate_timestamp(timestamp, today=None):
     """
-
+    "today at 10:30 PM" / "yesterday at ..." / "10/17/2026"，按时间戳自身的时区计算
+    today: 批量格式化时由调用方算好传入，避免每条消息都重新取当前日期
     """
+    if today is None:
+        today = datetime.now(timestamp.tzinfo).date()
+    day = timestamp.date()
     # 今天或昨天
-    if (naturalday(timestamp) == "today") or (naturalday(timestamp) == "yesterday"):
+    if day == today or day == today - timedelta(days=1):
         str_time = datetime.strftime(timestamp, "%I:%M %p")
         str_time = str_time.strip("0")
-        ts = f"{naturalday(timestamp)} at {str_time}"
+        ts = f"{'today' if day == today else 'yesterday'} at {str_time}"
     # 其他日期
     else:
         str_time = datetime.strftime(timestamp, "%m/%d/%Y")
@@ -38,14 +69,113 @@ def calculate_timestamp(timestamp):
     return str(ts)
 
 
-class LazyChatroomMessageEncoder(Serializer):
-    def get_dump_object(self, obj):
-        json_data = {}
-        json_data.update({'msg_type': MSG_TYPE_MESSAGE})
-        json_data.update({'msg_id': str(obj.id)})
-        json_data.update({'user_id': str(obj.user.id)})
-        json_data.update({'username': str(obj.user.username)})
-        json_data.update({'message': str(obj.content)})
-        json_data.update({'profile_image': str(obj.user.profile_image.url)})
-        json_data.update({'natural_timestamp': calculate_timestamp(obj.timestamp)})
-        return json_data
+def build_chat_message_frame(chat_message):
+    """
+    在发送方一次性生成广播给整个房间的消息帧（编码好的JSON文本），接收方原样转发
+    """
+    user = chat_message.user
+    return json.dumps({
+        'msg_type': MSG_TYPE_MESSAGE,
+        'msg_id': str(chat_message.id),
+        'username': user.username,
+        'user_id': user.id,
+        'profile_image': user.avatar_url,
+        'message': chat_message.content,
+        'natural_timestamp': calculate_timestamp(chat_message.timestamp),
+        'timestamp': chat_message.timestamp.isoformat(),
+    })
+
+
+def history_rows(queryset):
+    """
+    消息查询集 -> HISTORY_MESSAGE_FIELDS 元组，不创建模型实例
+    """
+    return queryset.values_list(*HISTORY_MESSAGE_FIELDS)
+
+
+def history_row(message):
+    """
+    消息实例（user已加载，例如刚发送的消息） -> 与 history_rows 相同的元组
+    """
+    user = message.user
+    return (message.id, user.id, user.username, user.profile_image.name, user.avatar_hash, message.content,
+            message.timestamp)
+
+
+def pending_history_rows(messages):
+    """
+    还在写缓冲中的消息 -> 与 history_rows 相同的元组
+    """
+    return [history_row(m) for m in messages]
+
+
+def encode_history_cursor(row):
+    """
+    一页中最早的一条消息（history_rows 元组） -> 下一页的游标 "时间戳_id"。
+    游标自带时间戳，这条消息还在写缓冲中（数据库中还没有这一行）时也能定位下一页
+    """
+    return encode_cursor((row[-1], row[0]))
+
+
+def decode_history_cursor(value):
+    """
+    客户端发送的 before_msg_id -> (timestamp, id)。
+    只有消息id（旧客户端）时 timestamp 为None，由 by_room_before 按主键查询时间戳；格式不对时抛出 ValueError
+    """
+    value = str(value)
+    if value.isdigit():
+        return None, int(value)
+    return decode_cursor(value)
+
+
+def history_page_before(manager, room, cursor, pending, page_size):
+    """
+    游标之前（更早）的一页聊天记录，返回 (rows, next_cursor)，没有更早的消息时 next_cursor 为None。
+    manager: 消息模型的manager（by_room_before）
+    pending: 本进程写缓冲中这个房间的消息（pending_history_rows），与数据库中的消息合并
+    """
+    timestamp, msg_id = decode_history_cursor(cursor)
+    if timestamp is None:
+        # 旧格式的游标指向还在写缓冲中的消息时，从缓冲中取时间戳
+        timestamp = next((row[-1] for row in pending if row[0] == msg_id), None)
+    rows = list(history_rows(manager.by_room_before(room, msg_id, timestamp))[:page_size + 1])
+    if timestamp is not None:
+        pending = [row for row in pending if (row[-1], row[0]) < (timestamp, msg_id)]
+        rows = merge_rows(page_size + 1, pending, rows)
+    return history_page(rows, page_size)
+
+
+def history_page(rows, page_size):
+    """
+    多取了一条的 rows（从新到旧） -> (一页, next_cursor)
+    """
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, encode_history_cursor(rows[-1])
+    return rows, None
+
+
+def build_history_frame(rows, **extra):
+    """
+    一次编码生成发送给客户端的聊天记录帧（JSON文本），consumer直接 send(text_data=...)。
+    extra 为分页信息（next_cursor 或 new_page_number）
+    """
+    image_urls = {}
+    today = timezone.now().date()
+    messages = []
+    for msg_id, user_id, username, profile_image, avatar_hash, content, timestamp in rows:
+        # 一页消息通常只来自少数几个用户
+        url = image_urls.get(user_id)
+        if url is None:
+            url = image_urls[user_id] = get_avatar_url(user_id, avatar_hash, profile_image)
+        messages.append({
+            'msg_type': MSG_TYPE_MESSAGE,
+            'msg_id': str(msg_id),
+            'user_id': str(user_id),
+            'username': username,
+            'message': content,
+            'profile_image': url,
+            'natural_timestamp': calculate_timestamp(timestamp, today),
+            'timestamp': timestamp.isoformat(),
+        })
+    return json.dumps({"messages_payload": "messages_payload", "messages": messages, **extra})
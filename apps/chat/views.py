@@ -1,4 +1,4 @@
-from itertools import chain
+import logging
 
 from django.http import JsonResponse
 from django.shortcuts import render, redirect
@@ -7,6 +7,9 @@ from django.conf import settings
 from account.models import Account
 from chat.models import PrivateChatroom, ChatroomMessage
 from chat.utils import find_or_create_private_chat
+from notification.utils import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
 
 DEBUG = False
 
@@ -22,18 +25,18 @@ def private_chat_room_view(request, *args, **kwargs):
     context = {}
     if room_id:
         try:
-            room = PrivateChatroom.objects.get(pk=room_id)
+            room = PrivateChatroom.objects.select_related("user1", "user2").get(pk=room_id)
             context['room'] = room
+            context['room_friend'] = room.get_other_user(user)
         except PrivateChatroom.DoesNotExist:
             pass
 
-    # 1. 找到与该用户有关的所有聊天室
-    rooms1 = PrivateChatroom.objects.filter(user1=user, is_active=True)
-    rooms2 = PrivateChatroom.objects.filter(user2=user, is_active=True)
-
-    # 2. merge the lists
-    rooms = list(chain(rooms1, rooms2))
-    print(str(len(rooms)))
+    # 与该用户有关的聊天室，最近有消息的在前（游标分页，不统计总数）
+    try:
+        cursor = decode_cursor(request.GET.get("cursor"))
+    except ValueError:
+        cursor = None
+    rooms, next_cursor = PrivateChatroom.objects.inbox_page(user, cursor)
 
     """
     m_and_f:
@@ -51,16 +54,15 @@ def private_chat_room_view(request, *args, **kwargs):
     """
     m_and_f = []
     for room in rooms:
-        # 找到对方
-        if room.user1 == user:
-            friend = room.user2
-        else:
-            friend = room.user1
         m_and_f.append({
-            'message': "",
-            'friend': friend
+            'message': room.last_message,
+            'friend': room.get_other_user(user),  # 已经select_related，不再查询
+            'last_activity': room.last_activity,
         })
     context['m_and_f'] = m_and_f
+    # 第一页之后可以回到最新的聊天，游标分页不能向前翻页
+    context['inbox_is_first_page'] = cursor is None
+    context['inbox_next_cursor'] = encode_cursor(next_cursor)
 
     context['debug'] = DEBUG
     context['debug_mode'] = settings.DEBUG
@@ -76,10 +78,13 @@ def create_or_return_private_chat(request, *args, **kwargs):
             user2_id = request.POST.get("user2_id")
             try:
                 user2 = Account.objects.get(pk=user2_id)
-                chat = find_or_create_private_chat(user1, user2)
-                payload['response'] = "Successfully got the chat."
-                payload['chatroom_id'] = chat.id
-            except Account.DoesNotExist:
+                if user2 == user1:
+                    payload['response'] = "You can't start a chat with yourself."
+                else:
+                    chat = find_or_create_private_chat(user1, user2)
+                    payload['response'] = "Successfully got the chat."
+                    payload['chatroom_id'] = chat.id
+            except (Account.DoesNotExist, ValueError):
                 payload['response'] = "Unable to start a chat with that user."
     else:
         payload['response'] = "You can't start a chat if you are not authenticated."
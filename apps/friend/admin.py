@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from friend.models import FriendList, FriendRequest
+from friend.models import FriendList, FriendRequest, FriendSuggestion
 
 
 class FriendListAdmin(admin.ModelAdmin):
@@ -26,3 +26,15 @@ class FriendRequestAdmin(admin.ModelAdmin):
 
 
 admin.site.register(FriendRequest, FriendRequestAdmin)
+
+
+class FriendSuggestionAdmin(admin.ModelAdmin):
+    list_display = ['user', 'suggested', 'mutual_count']
+    search_fields = ['user__username', 'suggested__username']
+    readonly_fields = ['user', 'suggested', 'mutual_count']
+
+    class Meta:
+        model = FriendSuggestion
+
+
+admin.site.register(FriendSuggestion, FriendSuggestionAdmin)
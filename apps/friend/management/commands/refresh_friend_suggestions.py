@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from friend.recommendations import FriendGraph, rebuild_suggestions
+
+
+class Command(BaseCommand):
+    help = "全量重建所有用户的好友推荐（可能认识的人），建议每天定时执行"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=None,
+                            help="每个用户保留的推荐数，默认 FRIEND_SUGGESTION_COUNT")
+
+    def handle(self, *args, **options):
+        graph = FriendGraph.from_database()
+        written = rebuild_suggestions(graph, options["count"])
+        self.stdout.write(f"{len(graph.user_ids)} users, {written} suggestions")
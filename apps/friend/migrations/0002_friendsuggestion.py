@@ -0,0 +1,31 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('friend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FriendSuggestion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mutual_count', models.PositiveIntegerField()),
+                ('suggested', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='friend_suggestions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '好友推荐',
+                'verbose_name_plural': '好友推荐',
+                'db_table': 'tb_friend_suggestion',
+                'unique_together': {('user', 'suggested')},
+            },
+        ),
+    ]
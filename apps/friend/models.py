@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -32,6 +32,7 @@ class FriendList(models.Model):
         if account not in self.friends.all():
             self.friends.add(account)
             self.save()
+            refresh_friend_suggestions(self.user, account)
 
             content_type = ContentType.objects.get_for_model(self)
             # 发送消息提示
@@ -55,10 +56,13 @@ class FriendList(models.Model):
         """
         if account in self.friends.all():
             self.friends.remove(account)
+            refresh_friend_suggestions(self.user, account)
         chat = find_or_create_private_chat(self.user, account)
         if chat.is_active:
             chat.is_active = False
-            chat.save()
+            chat.save()  # post_save 中会通知已连接的socket
+        else:
+            chat.revoke_access()
 
     def unfriend(self, removee):
         """
@@ -98,9 +102,7 @@ class FriendList(models.Model):
         """
         Is this a friend?
         """
-        if friend in self.friends.all():
-            return True
-        return False
+        return self.friends.filter(pk=friend.pk).exists()
 
     @property
     def get_cname(self):
@@ -110,6 +112,36 @@ class FriendList(models.Model):
         return "FriendList"
 
 
+class FriendSuggestion(models.Model):
+    """
+    可能认识的人：与 user 共同好友最多的前 FRIEND_SUGGESTION_COUNT 个非好友。
+    由 refresh_friend_suggestions 命令批量计算，好友关系变化时增量更新（见 friend.recommendations）
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="friend_suggestions")
+    suggested = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    mutual_count = models.PositiveIntegerField()
+
+    class Meta:
+        db_table = 'tb_friend_suggestion'
+        unique_together = [('user', 'suggested')]
+        verbose_name = '好友推荐'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.user} -> {self.suggested} ({self.mutual_count})"
+
+
+def refresh_friend_suggestions(user, friend):
+    """
+    user 的好友列表中增加或删除了 friend，在事务提交后增量更新受影响的推荐
+    """
+    def refresh():
+        from friend.recommendations import refresh_after_change
+        refresh_after_change(user.id, friend.id)
+
+    transaction.on_commit(refresh)
+
+
 class FriendRequest(models.Model):
     """
     A friend request consists of two main parts:
@@ -134,10 +166,12 @@ class FriendRequest(models.Model):
     def __str__(self):
         return self.sender.username
 
+    @transaction.atomic
     def accept(self):
         """
         Accept a friend request.
         Update both SENDER and RECEIVER friend lists.
+        在一个事务中完成，提交后才推送通知，推送的通知中 is_active 已经是 False
         """
 
         receiver_friend_list = FriendList.objects.get(user=self.receiver)
@@ -173,6 +207,7 @@ class FriendRequest(models.Model):
 
             return receiver_notification
 
+    @transaction.atomic
     def decline(self):
         """
         Decline a friend request.
@@ -202,6 +237,7 @@ class FriendRequest(models.Model):
 
         return notification
 
+    @transaction.atomic
     def cancel(self):
         """
         Cancel a friend request.
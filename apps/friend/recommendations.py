@@ -0,0 +1,264 @@
+"""
+"可能认识的人"：按共同好友数推荐好友。
+
+好友关系（tb_friend_list 的多对多表）加载为 CSR 压缩邻接表（indptr/indices 两个numpy数组），
+共同好友数 |N(u) ∩ N(v)| 对一批用户一次性向量化计算：
+展开每个用户的好友、好友的好友（二跳），编码为 行号 * 用户数 + 候选人 后用 np.unique 计数，
+去掉本人和已经是好友的候选人，每个用户保留共同好友最多的前K个，写入 FriendSuggestion。
+
+- rebuild_suggestions: 全量重建（refresh_friend_suggestions 管理命令，定期执行）
+- refresh_after_change: 好友关系变化时增量更新，只读取受影响用户的邻接表
+"""
+import logging
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+
+from friend.models import FriendList, FriendSuggestion
+
+logger = logging.getLogger(__name__)
+
+# 每批最多展开的二跳边数，控制一批计算的内存（约 16 字节/条）
+MAX_BATCH_PAIRS = 4000000
+# 从数据库读取邻接表时每次fetch的行数
+FETCH_SIZE = 100000
+# bulk_create 每条INSERT的行数（SQLite一条语句最多500个 UNION ALL）
+WRITE_BATCH_SIZE = 500
+
+
+def get_suggestion_count():
+    return getattr(settings, "FRIEND_SUGGESTION_COUNT", 10)
+
+
+class FriendGraph:
+    """
+    CSR 邻接表：第 i 行（用户 user_ids[i]）的好友是 indices[indptr[i]:indptr[i + 1]]（行号，升序）
+    """
+
+    def __init__(self, user_ids, indptr, indices):
+        self.user_ids = user_ids
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_edges(cls, sources, targets):
+        """
+        sources[i] 的好友列表中有 targets[i]（用户id）
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        user_ids = np.unique(np.concatenate([sources, targets]))
+        rows = np.searchsorted(user_ids, sources)
+        cols = np.searchsorted(user_ids, targets)
+
+        # 按 (行, 列) 排序并去重
+        keys = np.unique(rows * len(user_ids) + cols)
+        rows, cols = keys // len(user_ids), keys % len(user_ids)
+
+        indptr = np.zeros(len(user_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(user_ids)), out=indptr[1:])
+        return cls(user_ids, indptr, cols)
+
+    @classmethod
+    def from_database(cls, user_ids=None):
+        """
+        读取好友关系，user_ids 不为空时只读取这些用户的好友列表
+        """
+        qs = FriendList.friends.through.objects.values_list("friendlist__user_id", "account_id")
+        if user_ids is not None:
+            qs = qs.filter(friendlist__user_id__in=[int(user_id) for user_id in user_ids])
+        sources, targets = [], []
+        sql, params = qs.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                edges = np.array(rows, dtype=np.int64)
+                sources.append(edges[:, 0])
+                targets.append(edges[:, 1])
+        if not sources:
+            return cls.from_edges([], [])
+        return cls.from_edges(np.concatenate(sources), np.concatenate(targets))
+
+    @property
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def rows_of(self, user_ids):
+        """
+        用户id -> 行号，不在图中的用户为 -1
+        """
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        rows = np.searchsorted(self.user_ids, user_ids)
+        rows[rows == len(self.user_ids)] = 0
+        found = len(self.user_ids) > 0 and self.user_ids[rows] == user_ids
+        return np.where(found, rows, -1)
+
+    def neighbors(self, rows):
+        """
+        一批行的全部好友：返回 (所属的位置（rows中的下标）, 好友行号)，同一行内好友按行号升序
+        """
+        starts = self.indptr[rows]
+        lengths = self.indptr[np.asarray(rows) + 1] - starts
+        owners = np.repeat(np.arange(len(rows)), lengths)
+        # 每个元素在 indices 中的位置 = 所在行的起点 + 在行内的偏移
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return owners, self.indices[np.repeat(starts, lengths) + offsets]
+
+    def mutual_counts(self, rows):
+        """
+        rows 中每个用户与所有 非好友、非本人 的二跳用户的共同好友数：
+        返回 (所属的位置, 候选人行号, 共同好友数)，按 (所属的位置, 候选人) 排序
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        size = len(self.user_ids)
+        owners, friends = self.neighbors(rows)
+        hop_owners, candidates = self.neighbors(friends)
+        hop_owners = owners[hop_owners]
+
+        keys, counts = np.unique(hop_owners * size + candidates, return_counts=True)
+        # 去掉已经是好友的（直接好友的编码本身就是有序的）和本人
+        direct = owners * size + friends
+        position = np.searchsorted(direct, keys)
+        position[position == len(direct)] = 0
+        keep = (direct[position] != keys) if len(direct) else np.ones(len(keys), dtype=bool)
+        owners, candidates = keys // size, keys % size
+        keep &= candidates != rows[owners]
+        return owners[keep], candidates[keep], counts[keep]
+
+    def top_suggestions(self, rows, k):
+        """
+        rows 中每个用户共同好友最多的前k个候选人（共同好友数相同时id小的在前）：
+        返回 (用户id, 推荐用户id, 共同好友数) 三个数组，按用户、名次排序
+        """
+        owners, candidates, counts = self.mutual_counts(rows)
+        order = np.lexsort((candidates, -counts, owners))
+        owners, candidates, counts = owners[order], candidates[order], counts[order]
+        rank = np.arange(len(owners)) - np.searchsorted(owners, owners)
+        keep = rank < k
+        return (
+            self.user_ids[np.asarray(rows, dtype=np.int64)[owners[keep]]],
+            self.user_ids[candidates[keep]],
+            counts[keep],
+        )
+
+    def batches(self, max_pairs=MAX_BATCH_PAIRS):
+        """
+        把所有行按二跳展开的大小切分成连续的若干批（行号区间 [start, stop)）
+        """
+        degrees = self.degrees
+        # 每一行的二跳大小 = 该行所有好友的好友数之和
+        hop_sizes = np.concatenate([[0], np.cumsum(degrees[self.indices])])
+        per_row = hop_sizes[self.indptr[1:]] - hop_sizes[self.indptr[:-1]]
+        cumulative = np.cumsum(per_row)
+        start = 0
+        while start < len(per_row):
+            done = cumulative[start - 1] if start else 0
+            stop = int(np.searchsorted(cumulative, done + max_pairs, side="right"))
+            stop = max(stop, start + 1)
+            yield start, stop
+            start = stop
+
+
+def rebuild_suggestions(graph=None, k=None):
+    """
+    全量重建所有用户的推荐，返回写入的推荐数
+    """
+    graph = graph or FriendGraph.from_database()
+    k = k or get_suggestion_count()
+    started = time.perf_counter()
+    written = 0
+    batches = list(graph.batches())
+    for number, (start, stop) in enumerate(batches):
+        users, suggested, counts = graph.top_suggestions(np.arange(start, stop), k)
+        # 按用户id区间替换，区间覆盖所有id，这样没有好友的用户的旧推荐也会被删除
+        stale = FriendSuggestion.objects.all()
+        if number > 0:
+            stale = stale.filter(user_id__gte=int(graph.user_ids[start]))
+        if number < len(batches) - 1:
+            stale = stale.filter(user_id__lt=int(graph.user_ids[stop]))
+        with transaction.atomic():
+            stale.delete()
+            FriendSuggestion.objects.bulk_create([
+                FriendSuggestion(user_id=int(user), suggested_id=int(other), mutual_count=int(count))
+                for user, other, count in zip(users, suggested, counts)
+            ], batch_size=WRITE_BATCH_SIZE)
+        written += len(users)
+    if not batches:
+        FriendSuggestion.objects.all().delete()
+    logger.info("rebuild_suggestions: %s users, %s suggestions in %.1fs",
+                len(graph.user_ids), written, time.perf_counter() - started)
+    return written
+
+
+def refresh_after_change(user_id, friend_id, k=None):
+    """
+    user 的好友列表中增加或删除了 friend（只有 user 的好友列表变了）之后调用：
+
+    - user 与所有人的共同好友数都可能改变：重新计算 user 的推荐
+    - 对方好友列表中有 friend 的用户 v，与 user 的共同好友数改变了：只更新 v 的推荐中 user 这一项，
+      user 掉出前K名后空出的位置等下一次全量重建时补上
+    """
+    k = k or get_suggestion_count()
+    through = FriendList.friends.through
+
+    # 1. user 的推荐：只需要 user 和 user 的好友这些行
+    friends = list(through.objects.filter(friendlist__user_id=user_id).values_list("account_id", flat=True))
+    graph = FriendGraph.from_database([user_id] + friends)
+    rows = graph.rows_of([user_id])
+    with transaction.atomic():
+        FriendSuggestion.objects.filter(user_id=user_id).delete()
+        if rows[0] >= 0:
+            _, suggested, counts = graph.top_suggestions(rows, k)
+            FriendSuggestion.objects.bulk_create([
+                FriendSuggestion(user_id=user_id, suggested_id=int(other), mutual_count=int(count))
+                for other, count in zip(suggested, counts)
+            ])
+
+    # 2. 好友列表中有 friend 的用户与 user 的共同好友数
+    others = set(through.objects.filter(account_id=friend_id).values_list("friendlist__user_id", flat=True))
+    others.discard(user_id)
+    if not others:
+        return
+    others = sorted(others)
+    graph = FriendGraph.from_database(others)
+    rows = graph.rows_of(others)
+    owners, their_friends = graph.neighbors(rows)
+    their_friends = graph.user_ids[their_friends]
+    mutual = np.bincount(owners[np.isin(their_friends, friends)], minlength=len(others))
+    already_friends = np.zeros(len(others), dtype=bool)
+    already_friends[owners[their_friends == user_id]] = True
+
+    with transaction.atomic():
+        stored = {}
+        for suggestion in FriendSuggestion.objects.select_for_update().filter(user_id__in=others):
+            stored.setdefault(suggestion.user_id, []).append(suggestion)
+        for other, count, is_friend in zip(others, mutual.tolist(), already_friends.tolist()):
+            _update_suggestion(other, user_id, 0 if is_friend else count, stored.get(other, []), k)
+
+
+def _update_suggestion(user_id, suggested_id, count, current, k):
+    """
+    更新 user 的推荐中 suggested 这一项（共同好友数变为 count）
+    """
+    existing = next((s for s in current if s.suggested_id == suggested_id), None)
+    if existing is not None:
+        if count == 0:
+            existing.delete()
+        elif existing.mutual_count != count:
+            existing.mutual_count = count
+            existing.save(update_fields=["mutual_count"])
+        return
+    if count == 0:
+        return
+    if len(current) < k:
+        FriendSuggestion.objects.create(user_id=user_id, suggested_id=suggested_id, mutual_count=count)
+        return
+    weakest = min(current, key=lambda s: (s.mutual_count, -s.suggested_id))
+    if (count, -suggested_id) > (weakest.mutual_count, -weakest.suggested_id):
+        weakest.delete()
+        FriendSuggestion.objects.create(user_id=user_id, suggested_id=suggested_id, mutual_count=count)
@@ -1,4 +1,7 @@
-from friend.models import FriendRequest
+from django.db.models import BooleanField, Exists, IntegerField, OuterRef, Subquery, Value
+
+from friend.friend_request_status import FriendRequestStatus
+from friend.models import FriendList, FriendRequest
 
 
 def get_friend_request_or_false(sender, receiver):
@@ -6,3 +9,41 @@ def get_friend_request_or_false(sender, receiver):
         return FriendRequest.objects.get(sender=sender, receiver=receiver, is_active=True)
     except FriendRequest.DoesNotExist:
         return False
+
+
+def annotate_relationship(accounts, user):
+    """
+    一次查询标注 accounts（Account查询集）中每个账号与 user 的关系，不再逐行调用 is_mutual_friend：
+        is_friend: 是否是 user 的好友
+        pending_friend_request_id: 对方发给 user 的有效好友请求id，没有时为None
+        friend_request_sent: user 是否已经向对方发送了有效的好友请求
+    user 未登录时全部为 非好友/没有请求
+    """
+    if not user.is_authenticated:
+        return accounts.annotate(
+            is_friend=Value(False, output_field=BooleanField()),
+            pending_friend_request_id=Value(None, output_field=IntegerField()),
+            friend_request_sent=Value(False, output_field=BooleanField()),
+        )
+    return accounts.annotate(
+        is_friend=Exists(
+            FriendList.friends.through.objects.filter(friendlist__user=user, account=OuterRef("pk"))
+        ),
+        pending_friend_request_id=Subquery(
+            FriendRequest.objects.filter(sender=OuterRef("pk"), receiver=user, is_active=True).values("id")[:1]
+        ),
+        friend_request_sent=Exists(
+            FriendRequest.objects.filter(sender=user, receiver=OuterRef("pk"), is_active=True)
+        ),
+    )
+
+
+def get_request_status(account):
+    """
+    经过 annotate_relationship 标注的账号与当前用户之间的好友请求状态
+    """
+    if account.pending_friend_request_id is not None:
+        return FriendRequestStatus.THEM_SENT_TO_YOU.value
+    if account.friend_request_sent:
+        return FriendRequestStatus.YOU_SENT_TO_THEM.value
+    return FriendRequestStatus.NO_REQUEST_SENT.value
@@ -3,6 +3,7 @@ from django.shortcuts import render, redirect
 
 from account.models import Account
 from friend.models import FriendRequest, FriendList
+from friend.utils import annotate_relationship
 
 
 # 展示friend列表视图
@@ -25,13 +26,12 @@ def friend_list_view(request, *args, **kwargs):
                 return HttpResponse(f"Could not find a friends list for {this_user.username}")
 
             # 如果当前登录用户不是被查看用户，并且不是被查看用户的朋友，你没有权限观看他的好友列表
-            if user != this_user and user not in friend_list.friends.all():
+            if user != this_user and not friend_list.friends.filter(pk=user.pk).exists():
                 return HttpResponse("You must be friends to view their friends list.")
 
             friends = []  # [(account1, True)..] 当前用户与被查看用户的朋友也是朋友，True
-            auth_user_friend_list = FriendList.objects.get(user=user)
-            for friend in friend_list.friends.all():
-                friends.append((friend, auth_user_friend_list.is_mutual_friend(friend)))
+            for friend in annotate_relationship(friend_list.friends.all(), user):
+                friends.append((friend, friend.is_friend))
             context['friends'] = friends
         else:
             return HttpResponse("You must be friends to view their friends.")
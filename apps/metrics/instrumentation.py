@@ -0,0 +1,78 @@
+import functools
+import time
+
+from channels.db import database_sync_to_async as channels_database_sync_to_async
+
+from metrics.registry import Counter, Gauge, Histogram
+
+WS_OPEN_CONNECTIONS = Gauge(
+    "ws_open_connections", "Open WebSocket connections per consumer.", ["consumer"])
+WS_COMMAND_LATENCY = Histogram(
+    "ws_command_latency_seconds", "Time spent handling a receive_json command.", ["consumer", "command"])
+WS_GROUP_SEND_TOTAL = Counter(
+    "ws_group_send_total", "group_send fan-outs by consumer and event type.", ["consumer", "type"])
+WS_CLIENT_ERRORS = Counter(
+    "ws_client_errors_total", "ClientError raised by consumers, by code.", ["consumer", "code"])
+DATABASE_SYNC_SECONDS = Histogram(
+    "database_sync_to_async_seconds", "Time awaiting database_sync_to_async calls.", ["function"])
+
+
+def database_sync_to_async(func):
+    """
+    与 channels.db.database_sync_to_async 相同，同时记录整个调用（包括线程切换）的耗时
+    """
+    async_func = channels_database_sync_to_async(func)
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await async_func(*args, **kwargs)
+        finally:
+            DATABASE_SYNC_SECONDS.observe(time.perf_counter() - start, function=name)
+
+    return wrapper
+
+
+class MetricsConsumerMixin:
+    """
+    放在 AsyncJsonWebsocketConsumer 之前，记录连接数、每个command的耗时和group_send次数。
+    metrics_commands 之外的command都记为 "unknown"，避免客户端制造任意多的label
+    """
+    metrics_commands = ()
+
+    @property
+    def metrics_name(self):
+        return type(self).__name__
+
+    async def websocket_connect(self, message):
+        WS_OPEN_CONNECTIONS.inc(consumer=self.metrics_name)
+        await super().websocket_connect(message)
+
+    async def websocket_disconnect(self, message):
+        WS_OPEN_CONNECTIONS.dec(consumer=self.metrics_name)
+        await super().websocket_disconnect(message)
+
+    async def receive(self, text_data=None, bytes_data=None, **kwargs):
+        if not text_data:
+            return await super().receive(text_data=text_data, bytes_data=bytes_data, **kwargs)
+        content = await self.decode_json(text_data)
+        command = content.get("command") if isinstance(content, dict) else None
+        if command not in self.metrics_commands:
+            command = "unknown"
+        start = time.perf_counter()
+        try:
+            await self.receive_json(content, **kwargs)
+        finally:
+            WS_COMMAND_LATENCY.observe(time.perf_counter() - start, consumer=self.metrics_name, command=command)
+
+    async def group_send(self, group, message):
+        """
+        channel_layer.group_send，并计数
+        """
+        WS_GROUP_SEND_TOTAL.inc(consumer=self.metrics_name, type=message["type"])
+        await self.channel_layer.group_send(group, message)
+
+    def count_client_error(self, e):
+        WS_CLIENT_ERRORS.inc(consumer=self.metrics_name, code=e.code)
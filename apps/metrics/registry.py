@@ -0,0 +1,124 @@
+"""
+进程内的指标注册表，按 Prometheus 文本格式输出（metrics.views.metrics_view）。
+
+每个worker进程有自己的一份数据，由抓取该进程的 /metrics/ 得到。
+"""
+import threading
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_metrics = []
+
+
+class Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{self._format_labels(key)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            sample = self._values.get(key)
+            if sample is None:
+                # [每个桶的计数..., sum, count]
+                sample = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample[i] += 1
+                    break
+            sample[-2] += value
+            sample[-1] += 1
+
+    def _render_sample(self, key, value):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, value):
+            cumulative += count
+            lines.append(f"{self.name}_bucket{self._format_labels(key, [('le', _format_value(bound))])} {cumulative}")
+        lines.append(f"{self.name}_bucket{self._format_labels(key, [('le', '+Inf')])} {value[-1]}")
+        lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_value(value[-2])}")
+        lines.append(f"{self.name}_count{self._format_labels(key)} {value[-1]}")
+        return lines
+
+
+def render_metrics():
+    """
+    所有指标的 Prometheus 文本格式
+    """
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from metrics.views import metrics_view
+
+app_name = 'metrics'
+
+urlpatterns = [
+    path('', metrics_view, name='metrics'),
+]
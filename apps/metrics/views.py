@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+import metrics.instrumentation  # noqa: F401 注册consumer相关指标
+from metrics.registry import render_metrics
+
+
+def metrics_view(request, *args, **kwargs):
+    """
+    Prometheus 抓取当前进程的指标，只允许 INTERNAL_IPS 或管理员访问
+    """
+    if request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS and not request.user.is_staff:
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,5 +1,8 @@
 DEFAULT_NOTIFICATION_PAGE_SIZE = 10
 
+# 导航栏上的未读通知数只统计这些类型（私聊消息的未读数见 chat.models.UnreadChatTotal）
+GENERAL_NOTIFICATION_TYPES = ("FriendRequest", "FriendList")
+
 """
 "General" notifications include:
     1. FriendRequest
@@ -8,4 +11,16 @@ DEFAULT_NOTIFICATION_PAGE_SIZE = 10
 GENERAL_MSG_TYPE_NOTIFICATIONS_PAYLOAD = 0  # New 'general' notifications data payload incoming
 GENERAL_MSG_TYPE_PAGINATION_EXHAUSTED = 1  # No more 'general' notifications to retrieve
 GENERAL_MSG_TYPE_NOTIFICATIONS_REFRESH_PAYLOAD = 2  # Retrieved all 'general' notifications newer than the oldest visible on screen
-GENERAL_MSG_TYPE_UPDATED_NOTIFICATION = 5  # Update a notification that has been altered (Ex: Accept/decline a friend request)
\ No newline at end of file
+GENERAL_MSG_TYPE_GET_NEW_GENERAL_NOTIFICATIONS = 3  # New or updated 'general' notifications pushed by the server
+GENERAL_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT = 4  # Number of unread 'general' notifications
+GENERAL_MSG_TYPE_UPDATED_NOTIFICATION = 5  # Update a notification that has been altered (Ex: Accept/decline a friend request)
+GENERAL_MSG_TYPE_PROFILE_IMAGE_CROPPED = 6  # Result of a profile image crop job (see account.images)
+
+"""
+"Chat" notifications include:
+    1. UnreadChatRoomMessages
+"""
+CHAT_MSG_TYPE_NOTIFICATIONS_PAYLOAD = 10  # New 'chat' notifications data payload incoming
+CHAT_MSG_TYPE_PAGINATION_EXHAUSTED = 11  # No more 'chat' notifications to retrieve
+CHAT_MSG_TYPE_GET_NEW_NOTIFICATIONS = 13  # Get any new chat notifications
+CHAT_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT = 14  # Number of unread chat messages
@@ -1,21 +1,29 @@
 import json
+import logging
 from datetime import datetime
 
-from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.contrib.contenttypes.models import ContentType
-from django.core.paginator import Paginator
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from chat.exceptions import ClientError
+from chat.models import UnreadChatRoomMessages, UnreadChatTotal
 from friend.models import FriendRequest, FriendList
-from notification.constants import DEFAULT_NOTIFICATION_PAGE_SIZE, GENERAL_MSG_TYPE_NOTIFICATIONS_PAYLOAD, \
+from metrics.instrumentation import database_sync_to_async, MetricsConsumerMixin
+from notification.constants import GENERAL_MSG_TYPE_NOTIFICATIONS_PAYLOAD, \
     GENERAL_MSG_TYPE_UPDATED_NOTIFICATION, GENERAL_MSG_TYPE_PAGINATION_EXHAUSTED, \
-    GENERAL_MSG_TYPE_NOTIFICATIONS_REFRESH_PAYLOAD
-from notification.models import Notification
-from notification.utils import LazyNotificationEncoder
+    GENERAL_MSG_TYPE_NOTIFICATIONS_REFRESH_PAYLOAD, GENERAL_MSG_TYPE_GET_NEW_GENERAL_NOTIFICATIONS, \
+    GENERAL_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT, GENERAL_MSG_TYPE_PROFILE_IMAGE_CROPPED, \
+    CHAT_MSG_TYPE_NOTIFICATIONS_PAYLOAD, CHAT_MSG_TYPE_PAGINATION_EXHAUSTED, CHAT_MSG_TYPE_GET_NEW_NOTIFICATIONS, \
+    CHAT_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT
+from notification.models import Notification, UnreadNotificationCount
+from notification.utils import LazyNotificationEncoder, decode_cursor, encode_cursor, notification_group_name
 
+logger = logging.getLogger(__name__)
 
-class NotificationConsumer(AsyncJsonWebsocketConsumer):
+
+class NotificationConsumer(MetricsConsumerMixin, AsyncJsonWebsocketConsumer):
     """
     Passing data to and from header.html. Notifications are displayed as "drop-downs" in the nav bar.
     There is two major categories of notifications:
@@ -25,19 +33,37 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
         1. Chat Notifications
             1. UnreadChatRoomMessages
     """
+    metrics_commands = ("get_general_notifications", "accept_friend_request", "decline_friend_request",
+                        "refresh_general_notifications", "get_chat_notifications", "get_new_chat_notifications",
+                        "get_unread_chat_notifications_count", "get_unread_general_notifications_count",
+                        "mark_notifications_read")
 
     async def connect(self):
         """
         Called when the websocket is handshaking as part of initial connection.
+        Logged in users join their own group, new and updated notifications are pushed to it
+        (see notification.utils.push_notifications), so the client does not poll.
         """
-        print("NotificationConsumer: connect: " + str(self.scope["user"]))
+        logger.debug("NotificationConsumer: connect: %s", self.scope["user"])
         await self.accept()
+        self.group_name = None
+        if self.scope["user"].is_authenticated:
+            self.group_name = notification_group_name(self.scope["user"].id)
+            await self.channel_layer.group_add(
+                self.group_name,
+                self.channel_name,
+            )
 
     async def disconnect(self, code):
         """
         Called when the WebSocket closes for any reason.
         """
-        print("NotificationConsumer: disconnect")
+        logger.debug("NotificationConsumer: disconnect")
+        if getattr(self, "group_name", None) is not None:
+            await self.channel_layer.group_discard(
+                self.group_name,
+                self.channel_name,
+            )
 
     async def receive_json(self, content):
         """
@@ -45,15 +71,15 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
         for us and pass it as the first argument.
         """
         command = content.get("command", None)
-        print("NotificationConsumer: receive_json. Command: " + command)
+        logger.debug("NotificationConsumer: receive_json. Command: %s", command)
         try:
             if command == "get_general_notifications":
-                payload = await get_general_notifications(self.scope["user"], content.get("page_number", None))
+                payload = await get_general_notifications(self.scope["user"], content.get("cursor", None))
                 if payload is None:
                     await self.general_pagination_exhausted()
                 else:
                     payload = json.loads(payload)
-                    await self.send_general_notifications_payload(payload['notifications'], payload['new_page_number'])
+                    await self.send_general_notifications_payload(payload['notifications'], payload['next_cursor'])
             elif command == "accept_friend_request":
                 notification_id = content['notification_id']
                 payload = await accept_friend_request(self.scope['user'], notification_id)
@@ -78,28 +104,53 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
                 else:
                     payload = json.loads(payload)
                     await self.send_general_refreshed_notifications_payload(payload['notifications'])
+            elif command == "get_chat_notifications":
+                payload = await get_chat_notifications(self.scope["user"], content.get("cursor", None))
+                if payload is None:
+                    await self.chat_pagination_exhausted()
+                else:
+                    payload = json.loads(payload)
+                    await self.send_chat_notifications_payload(payload['notifications'], payload['next_cursor'])
+            elif command == "get_new_chat_notifications":
+                payload = await get_new_chat_notifications(self.scope["user"], content.get("newest_timestamp"))
+                if payload is None:
+                    raise ClientError(204, "Something went wrong. Try refreshing the browser.")
+                else:
+                    payload = json.loads(payload)
+                    await self.send_new_chat_notifications_payload(payload['notifications'])
+            elif command == "get_unread_chat_notifications_count":
+                count = await get_unread_chat_notifications_count(self.scope["user"])
+                await self.send_unread_chat_notifications_count(count)
+            elif command == "get_unread_general_notifications_count":
+                count = await get_unread_general_notifications_count(self.scope["user"])
+                await self.send_unread_general_notifications_count(count)
+            elif command == "mark_notifications_read":
+                # 新的未读数通过 notification_general_count 推送给用户所有的socket
+                await mark_notifications_read(self.scope["user"], content.get("newest_timestamp"))
         except Exception as e:
-            print("EXCEPTION: receive_json: " + str(e))
-            pass
+            if isinstance(e, ClientError):
+                self.count_client_error(e)
+            logger.exception("NotificationConsumer: receive_json")
 
     async def display_progress_bar(self, shouldDisplay):
-        print("NotificationConsumer: display_progress_bar: " + str(shouldDisplay))
+        logger.debug("NotificationConsumer: display_progress_bar: %s", shouldDisplay)
         await self.send_json(
             {
                 "progress_bar": shouldDisplay,
             },
         )
 
-    async def send_general_notifications_payload(self, notifications, new_page_number):
+    async def send_general_notifications_payload(self, notifications, next_cursor):
         """
         Called by receive_json when ready to send a json array of the notifications
+        next_cursor is None when this is the last page
         """
         # print("NotificationConsumer: send_general_notifications_payload")
         await self.send_json(
             {
                 "general_msg_type": GENERAL_MSG_TYPE_NOTIFICATIONS_PAYLOAD,
                 "notifications": notifications,
-                "new_page_number": new_page_number,
+                "next_cursor": next_cursor,
             },
         )
 
@@ -136,34 +187,125 @@ class NotificationConsumer(AsyncJsonWebsocketConsumer):
             },
         )
 
+    async def send_chat_notifications_payload(self, notifications, next_cursor):
+        """
+        Called by receive_json when ready to send a json array of the chat notifications
+        next_cursor is None when this is the last page
+        """
+        await self.send_json(
+            {
+                "chat_msg_type": CHAT_MSG_TYPE_NOTIFICATIONS_PAYLOAD,
+                "notifications": notifications,
+                "next_cursor": next_cursor,
+            },
+        )
+
+    async def chat_pagination_exhausted(self):
+        """
+        Called by receive_json when pagination is exhausted for chat notifications
+        """
+        await self.send_json({
+            "chat_msg_type": CHAT_MSG_TYPE_PAGINATION_EXHAUSTED,
+        })
+
+    async def send_new_chat_notifications_payload(self, notifications):
+        """
+        Called by receive_json when ready to send a json array of the new chat notifications
+        """
+        await self.send_json(
+            {
+                "chat_msg_type": CHAT_MSG_TYPE_GET_NEW_NOTIFICATIONS,
+                "notifications": notifications,
+            },
+        )
+
+    async def notification_general(self, event):
+        """
+        Called when a 'general' notification of this user is created or updated.
+        """
+        await self.send_json(
+            {
+                "general_msg_type": GENERAL_MSG_TYPE_GET_NEW_GENERAL_NOTIFICATIONS,
+                "notifications": event["notifications"],
+            },
+        )
+
+    async def notification_general_count(self, event):
+        """
+        Called when the number of unread 'general' notifications of this user changes.
+        """
+        await self.send_unread_general_notifications_count(event["count"])
+
+    async def send_unread_general_notifications_count(self, count):
+        """
+        未读通知数（导航栏上的红点）
+        """
+        await self.send_json(
+            {
+                "general_msg_type": GENERAL_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT,
+                "count": count,
+            },
+        )
+
+    async def notification_profile_image(self, event):
+        """
+        Called when a profile image crop job of this user finished (see account.images).
+        """
+        payload = {key: value for key, value in event.items() if key != "type"}
+        await self.send_json(
+            {
+                "general_msg_type": GENERAL_MSG_TYPE_PROFILE_IMAGE_CROPPED,
+                **payload,
+            },
+        )
+
+    async def notification_chat(self, event):
+        """
+        Called when a chat notification of this user is created or updated (a new private message).
+        """
+        await self.send_new_chat_notifications_payload(event["notifications"])
+
+    async def notification_chat_count(self, event):
+        """
+        Called when the number of unread private messages of this user changes.
+        """
+        await self.send_unread_chat_notifications_count(event["count"])
+
+    async def send_unread_chat_notifications_count(self, count):
+        """
+        未读私聊消息总数（导航栏上的红点）
+        """
+        await self.send_json(
+            {
+                "chat_msg_type": CHAT_MSG_TYPE_GET_UNREAD_NOTIFICATIONS_COUNT,
+                "count": count,
+            },
+        )
+
 
 @database_sync_to_async
-def get_general_notifications(user, page_number):
+def get_general_notifications(user, cursor):
     """
     Get General Notifications with Pagination (next page of results).
     This is for appending to the bottom of the notifications list.
+    cursor is the 'next_cursor' of the previous page (empty for the first page).
     General Notifications are:
     1. FriendRequest
     2. FriendList
     """
     if user.is_authenticated:
-        friend_request_ct = ContentType.objects.get_for_model(FriendRequest)
-        friend_list_ct = ContentType.objects.get_for_model(FriendList)
-        notifications = Notification.objects.filter(target=user,
-                                                    content_type__in=[friend_request_ct, friend_list_ct]).order_by(
-            '-timestamp')
-        p = Paginator(notifications, DEFAULT_NOTIFICATION_PAGE_SIZE)
-
-        payload = {}
-        if len(notifications) > 0:
-            if int(page_number) <= p.num_pages:
-                s = LazyNotificationEncoder()
-                serialized_notifications = s.serialize(p.page(page_number).object_list)
-                payload['notifications'] = serialized_notifications
-                new_page_number = int(page_number) + 1
-                payload['new_page_number'] = new_page_number
-        else:
+        try:
+            cursor = decode_cursor(cursor)
+        except ValueError:
+            raise ClientError("INVALID_CURSOR", "Invalid notification cursor.")
+        content_types = ContentType.objects.get_for_models(FriendRequest, FriendList).values()
+        notifications, next_cursor = Notification.objects.page_for(user, content_types, cursor)
+        if not notifications:
             return None
+        payload = {}
+        s = LazyNotificationEncoder()
+        payload['notifications'] = s.serialize(notifications)
+        payload['next_cursor'] = encode_cursor(next_cursor)
     else:
         raise ClientError("User must be authenticated to get notifications.")
 
@@ -232,10 +374,10 @@ def refresh_general_notifications(user, oldest_timestamp, newest_timestamp):
         newest_ts = datetime.strptime(newest_ts, '%Y-%m-%d %H:%M:%S.%f')
         friend_request_ct = ContentType.objects.get_for_model(FriendRequest)
         friend_list_ct = ContentType.objects.get_for_model(FriendList)
-        notifications = Notification.objects.filter(target=user,
-                                                    content_type__in=[friend_request_ct, friend_list_ct],
-                                                    timestamp__gte=oldest_ts,
-                                                    timestamp__lte=newest_ts).order_by('-timestamp')
+        notifications = Notification.objects.with_related().filter(target=user,
+                                                                   content_type__in=[friend_request_ct, friend_list_ct],
+                                                                   timestamp__gte=oldest_ts,
+                                                                   timestamp__lte=newest_ts).order_by('-timestamp')
 
         s = LazyNotificationEncoder()
         payload['notifications'] = s.serialize(notifications)
@@ -244,3 +386,97 @@ def refresh_general_notifications(user, oldest_timestamp, newest_timestamp):
 
     return json.dumps(payload)
 
+
+@database_sync_to_async
+def get_chat_notifications(user, cursor):
+    """
+    Get Chat Notifications with Pagination (next page of results).
+    cursor is the 'next_cursor' of the previous page (empty for the first page).
+    Chat Notifications are:
+    1. UnreadChatRoomMessages
+    """
+    if user.is_authenticated:
+        try:
+            cursor = decode_cursor(cursor)
+        except ValueError:
+            raise ClientError("INVALID_CURSOR", "Invalid notification cursor.")
+        chat_message_ct = ContentType.objects.get_for_model(UnreadChatRoomMessages)
+        notifications, next_cursor = Notification.objects.page_for(user, [chat_message_ct], cursor)
+        if not notifications:
+            return None
+        payload = {}
+        s = LazyNotificationEncoder()
+        payload['notifications'] = s.serialize(notifications)
+        payload['next_cursor'] = encode_cursor(next_cursor)
+        return json.dumps(payload)
+    else:
+        raise ClientError("AUTH_ERROR", "User must be authenticated to get notifications.")
+
+
+@database_sync_to_async
+def get_new_chat_notifications(user, newest_timestamp):
+    """
+    Retrieve any chat notifications newer than the newest one on the screen.
+    """
+    if user.is_authenticated:
+        newest_ts = parse_datetime(str(newest_timestamp or "").strip())
+        if newest_ts is None:
+            return None
+        if timezone.is_naive(newest_ts):
+            newest_ts = timezone.make_aware(newest_ts, timezone.utc)
+        chat_message_ct = ContentType.objects.get_for_model(UnreadChatRoomMessages)
+        notifications = Notification.objects.with_related().filter(target=user, content_type=chat_message_ct,
+                                                                   timestamp__gt=newest_ts).order_by('-timestamp')
+        payload = {}
+        s = LazyNotificationEncoder()
+        payload['notifications'] = s.serialize(notifications)
+        return json.dumps(payload)
+    else:
+        raise ClientError("AUTH_ERROR", "User must be authenticated to get notifications.")
+
+
+@database_sync_to_async
+def get_unread_chat_notifications_count(user):
+    """
+    未读私聊消息总数：读取每个用户一行的计数，不统计消息表
+    """
+    if user.is_authenticated:
+        return UnreadChatTotal.objects.count_for(user)
+    else:
+        raise ClientError("AUTH_ERROR", "User must be authenticated to get notifications.")
+
+
+@database_sync_to_async
+def get_unread_general_notifications_count(user):
+    """
+    未读通知数：读取每个用户一行的计数，不统计通知表
+    """
+    if user.is_authenticated:
+        return UnreadNotificationCount.objects.count_for(user.id)
+    else:
+        raise ClientError("AUTH_ERROR", "User must be authenticated to get notifications.")
+
+
+@database_sync_to_async
+def mark_notifications_read(user, newest_timestamp):
+    """
+    把 newest_timestamp（页面上最新的一条通知）之前的通知标记为已读，没有时间戳时标记所有通知。
+    时间戳格式不对时抛出 ClientError，不能把页面上没有显示过的通知也标记为已读
+    """
+    if user.is_authenticated:
+        newest_timestamp = str(newest_timestamp or "").strip()
+        if not newest_timestamp:
+            until = timezone.now()
+        else:
+            try:
+                until = parse_datetime(newest_timestamp)
+            except ValueError:
+                until = None
+            if until is None:
+                raise ClientError("INVALID_TIMESTAMP", "Invalid notification timestamp.")
+            if timezone.is_naive(until):
+                until = timezone.make_aware(until, timezone.utc)
+        content_types = ContentType.objects.get_for_models(FriendRequest, FriendList).values()
+        return Notification.objects.mark_read(user, content_types, until)
+    else:
+        raise ClientError("AUTH_ERROR", "User must be authenticated to get notifications.")
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from notification.retention import prune_notifications
+
+
+class Command(BaseCommand):
+    help = "删除旧的已读通知（早于 NOTIFICATION_RETENTION_DAYS 天，或每个用户最新的 NOTIFICATION_KEEP_LAST 条之外），建议每天定时执行"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None,
+                            help="删除早于这么多天的已读通知，默认 NOTIFICATION_RETENTION_DAYS，0 表示不按时间删除")
+        parser.add_argument("--keep-last", type=int, default=None,
+                            help="每个用户保留的最新通知数，默认 NOTIFICATION_KEEP_LAST，0 表示不限制")
+        parser.add_argument("--batch-size", type=int, default=None,
+                            help="每批删除的行数，默认 NOTIFICATION_RETENTION_BATCH_SIZE")
+        parser.add_argument("--pause", type=float, default=0, help="每批之间暂停的秒数，减轻数据库压力")
+        parser.add_argument("--archive", help="删除之前把通知追加写入这个文件（JSON Lines）")
+        parser.add_argument("--dry-run", action="store_true", help="只统计将要删除的通知，不删除")
+        parser.add_argument("--full", action="store_true",
+                            help="检查所有用户的通知数（默认只检查上次执行之后收到了新通知的用户），修改 --keep-last 之后使用")
+        parser.add_argument("--interval", type=float, default=None,
+                            help="不退出，每隔这么多秒执行一次（不使用cron时）")
+
+    def handle(self, *args, **options):
+        if options["interval"] is not None and options["interval"] <= 0:
+            raise CommandError("--interval must be positive")
+        while True:
+            self.prune(options)
+            if options["interval"] is None:
+                return
+            # 之后只检查新收到通知的用户
+            options["full"] = False
+            time.sleep(options["interval"])
+
+    def prune(self, options):
+        archive = open(options["archive"], "a", encoding="utf-8") if options["archive"] else None
+        try:
+            report = prune_notifications(options["days"], options["keep_last"], options["batch_size"], archive,
+                                         options["dry_run"], options["pause"], options["full"])
+        finally:
+            if archive is not None:
+                archive.close()
+        verb = "would delete" if options["dry_run"] else "deleted"
+        self.stdout.write(f"{verb} {report['expired']} expired notifications, "
+                          f"{report['over_limit']} notifications of {report['users_over_limit']} users over the limit")
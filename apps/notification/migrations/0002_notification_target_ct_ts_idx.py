@@ -0,0 +1,17 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notification', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['target', 'content_type', '-timestamp', '-id'], name='notification_target_ct_ts_idx'),
+        ),
+    ]
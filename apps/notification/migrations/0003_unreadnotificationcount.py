@@ -0,0 +1,47 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:19
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def fill_unread_counts(apps, schema_editor):
+    """
+    按已有的未读 FriendRequest/FriendList 通知计算每个用户的未读数
+    """
+    Notification = apps.get_model('notification', 'Notification')
+    UnreadNotificationCount = apps.get_model('notification', 'UnreadNotificationCount')
+    unread = (Notification.objects
+              .filter(read=False, content_type__app_label='friend',
+                      content_type__model__in=['friendrequest', 'friendlist'])
+              .order_by().values('target').annotate(count=Count('id')))
+    UnreadNotificationCount.objects.bulk_create(
+        [UnreadNotificationCount(user_id=row['target'], count=row['count']) for row in unread.iterator()],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_account_search_indexes'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('notification', '0002_notification_target_ct_ts_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadNotificationCount',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '未读通知数',
+                'verbose_name_plural': '未读通知数',
+                'db_table': 'tb_unread_notification_count',
+            },
+        ),
+        migrations.RunPython(fill_unread_counts, migrations.RunPython.noop),
+    ]
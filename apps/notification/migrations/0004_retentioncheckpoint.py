@@ -0,0 +1,26 @@
+# Generated by Django 2.2.15 on 2026-10-17 12:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notification', '0003_unreadnotificationcount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RetentionCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '通知清理进度',
+                'verbose_name_plural': '通知清理进度',
+                'db_table': 'tb_notification_retention_checkpoint',
+            },
+        ),
+    ]
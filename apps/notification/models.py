@@ -1,7 +1,49 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from notification.constants import DEFAULT_NOTIFICATION_PAGE_SIZE, GENERAL_NOTIFICATION_TYPES
+from notification.utils import push_notifications_on_commit, push_to_user
+
+
+class NotificationManager(models.Manager):
+    def with_related(self):
+        """
+        序列化（LazyNotificationEncoder）需要的关联对象：from_user 用JOIN，
+        content_object 按 content_type 分组每种类型一次查询
+        """
+        return self.select_related("from_user").prefetch_related("content_object")
+
+    def page_for(self, target, content_types, cursor=None, page_size=DEFAULT_NOTIFICATION_PAGE_SIZE):
+        """
+        游标分页：返回 (一页通知, 下一页的游标)，没有更多通知时游标为None。
+        cursor 为上一页最后一条通知的 (timestamp, id)，为空时从最新的通知开始。
+        走 (target, content_type, -timestamp, -id) 索引，多取一条判断是否还有下一页，不使用COUNT(*)和OFFSET
+        """
+        qs = self.with_related().filter(target=target, content_type__in=content_types).order_by("-timestamp", "-id")
+        if cursor is not None:
+            timestamp, notification_id = cursor
+            qs = qs.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=notification_id))
+        notifications = list(qs[:page_size + 1])
+        if len(notifications) > page_size:
+            last = notifications[page_size - 1]
+            return notifications[:page_size], (last.timestamp, last.id)
+        return notifications, None
+
+    def mark_read(self, target, content_types, until):
+        """
+        把 target 在 until 之前（包括）的未读通知一次性标记为已读（一条UPDATE），同时更新未读数，返回标记的条数
+        """
+        with transaction.atomic():
+            count = self.filter(target=target, content_type__in=content_types, read=False,
+                                timestamp__lte=until).update(read=True)
+            if count:
+                UnreadNotificationCount.objects.add(target.id, -count)
+        return count
 
 
 class Notification(models.Model):
@@ -30,13 +72,122 @@ class Notification(models.Model):
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey()
 
+    objects = NotificationManager()
+
     class Meta:
         db_table = 'tb_notification'
+        indexes = [
+            # 通知列表的游标分页
+            models.Index(fields=['target', 'content_type', '-timestamp', '-id'], name='notification_target_ct_ts_idx'),
+        ]
         verbose_name = '提示'
         verbose_name_plural = verbose_name
 
     def __str__(self):
         return self.verb
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 保存时与数据库中的 read 比较，维护未读数
+        instance._loaded_read = instance.__dict__.get("read")
+        return instance
+
     def get_content_object_type(self):
-        return str(self.content_object.get_cname)  # 获取类型
+        # 获取类型：各模型的 get_cname 就是类名，从 content_type_id 得到（ContentType有进程内缓存），不加载 content_object
+        return ContentType.objects.get_for_id(self.content_type_id).model_class().__name__
+
+    def is_general(self):
+        """
+        计入导航栏未读通知数的类型
+        """
+        return self.get_content_object_type() in GENERAL_NOTIFICATION_TYPES
+
+
+class UnreadNotificationCountManager(models.Manager):
+    def add(self, user_id, amount):
+        if not self.filter(user_id=user_id).update(count=F("count") + amount) and amount > 0:
+            # 减少时没有计数行说明本来就没有未读通知（或者用户正在被删除），不需要创建
+            self.get_or_create(user_id=user_id)
+            self.filter(user_id=user_id).update(count=F("count") + amount)
+        transaction.on_commit(lambda: self.push_count(user_id))
+
+    def count_for(self, user_id):
+        """
+        用户的未读通知数，主键查询，不统计通知表
+        """
+        return self.filter(user_id=user_id).values_list("count", flat=True).first() or 0
+
+    def push_count(self, user_id):
+        """
+        未读通知数推送给用户已连接的通知socket
+        """
+        push_to_user(user_id, {
+            "type": "notification.general.count",  # NotificationConsumer.notification_general_count()
+            "count": self.count_for(user_id),
+        })
+
+
+class UnreadNotificationCount(models.Model):
+    """
+    每个用户未读的 FriendRequest/FriendList 通知数（= read=False 的通知数），
+    新建、删除通知和 read 变化时（post_save/post_delete、NotificationManager.mark_read）更新
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True)
+    count = models.IntegerField(default=0)
+
+    objects = UnreadNotificationCountManager()
+
+    class Meta:
+        db_table = 'tb_unread_notification_count'
+        verbose_name = '未读通知数'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.user}: {self.count}"
+
+
+class RetentionCheckpoint(models.Model):
+    """
+    prune_notifications 上次检查时的最大通知id（notification.retention），
+    下次只检查之后收到了新通知的用户是否超过 NOTIFICATION_KEEP_LAST 条
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    last_id = models.BigIntegerField(default=0)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'tb_notification_retention_checkpoint'
+        verbose_name = '通知清理进度'
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
+
+
+@receiver(post_save, sender=Notification)
+def push_saved_notification(sender, instance, **kwargs):
+    """
+    新建或更新（FriendRequest.accept/decline/cancel、FriendList.add_friend/unfriend 等）的通知推送给目标用户
+    """
+    push_notifications_on_commit(pk=instance.pk)
+
+
+@receiver(post_save, sender=Notification)
+def count_saved_notification(sender, instance, created, **kwargs):
+    """
+    新建的未读通知 +1，已读 <-> 未读 变化时 ±1
+    """
+    if not instance.is_general():
+        return
+    was_unread = not created and getattr(instance, "_loaded_read", True) is False
+    amount = int(not instance.read) - int(was_unread)
+    if amount:
+        UnreadNotificationCount.objects.add(instance.target_id, amount)
+    instance._loaded_read = instance.read
+
+
+@receiver(post_delete, sender=Notification)
+def count_deleted_notification(sender, instance, **kwargs):
+    if not instance.read and instance.is_general():
+        UnreadNotificationCount.objects.add(instance.target_id, -1)
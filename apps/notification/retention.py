@@ -0,0 +1,144 @@
+"""
+通知保留策略：删除（可以先归档）旧的已读通知，tb_notification 不会无限增长。
+
+- expired: 早于 NOTIFICATION_RETENTION_DAYS 天的已读通知
+- over_limit: 每个用户最新的 NOTIFICATION_KEEP_LAST 条之外的已读通知。
+  只检查上次执行之后收到了新通知的用户（RetentionCheckpoint 记录上次检查时的最大通知id），
+  不在整张表上 GROUP BY；修改 NOTIFICATION_KEEP_LAST 之后用 --full 检查所有用户
+
+未读通知、还在等待处理的好友请求的通知不会删除。
+每批按主键选出最多 NOTIFICATION_RETENTION_BATCH_SIZE 行，在各自的短事务中按主键删除，不长时间锁表。
+由 prune_notifications 管理命令执行（--dry-run 只统计，--interval 在进程内定期执行）
+"""
+import json
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef, Q
+from django.utils import timezone
+
+from friend.models import FriendRequest
+from notification.models import Notification, RetentionCheckpoint
+
+logger = logging.getLogger(__name__)
+
+OVER_LIMIT_CHECKPOINT = "over_limit"
+
+# 归档文件（JSON Lines）中每条通知保存的字段
+ARCHIVE_FIELDS = ("id", "target_id", "from_user_id", "redirect_url", "verb", "timestamp", "read",
+                  "content_type_id", "object_id")
+
+
+def get_retention_days():
+    return getattr(settings, "NOTIFICATION_RETENTION_DAYS", 90)
+
+
+def get_keep_last():
+    return getattr(settings, "NOTIFICATION_KEEP_LAST", 200)
+
+
+def get_batch_size():
+    return getattr(settings, "NOTIFICATION_RETENTION_BATCH_SIZE", 1000)
+
+
+def prunable():
+    """
+    可以删除的通知：已读，并且不是还在等待处理（可以同意/拒绝）的好友请求
+    """
+    pending = FriendRequest.objects.filter(pk=OuterRef("object_id"), is_active=True)
+    return (Notification.objects.filter(read=True)
+            .annotate(pending_request=Exists(pending))
+            .exclude(content_type=ContentType.objects.get_for_model(FriendRequest), pending_request=True))
+
+
+def expired(days):
+    return prunable().filter(timestamp__lt=timezone.now() - timedelta(days=days))
+
+
+def users_over_limit(keep_last, since_id=0):
+    """
+    id 大于 since_id 的通知的目标用户中，通知数超过 keep_last 的用户。
+    候选用户按主键范围查询，每个用户走 (target, ...) 索引取第 keep_last+1 条判断，不统计全部通知
+    """
+    candidates = list(Notification.objects.filter(pk__gt=since_id).order_by()
+                      .values_list("target", flat=True).distinct())
+    return [user_id for user_id in candidates
+            if Notification.objects.filter(target_id=user_id).order_by()[keep_last:keep_last + 1].exists()]
+
+
+def beyond_keep_last(user_id, keep_last):
+    """
+    用户最新的 keep_last 条之外的可以删除的通知
+    """
+    cutoff = list(Notification.objects.filter(target_id=user_id).order_by("-timestamp", "-id")
+                  .values_list("timestamp", "id")[keep_last - 1:keep_last])
+    if not cutoff:
+        return Notification.objects.none()
+    timestamp, notification_id = cutoff[0]
+    return prunable().filter(target_id=user_id).filter(
+        Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=notification_id))
+
+
+def delete_in_batches(qs, batch_size, archive=None, dry_run=False, pause=0):
+    """
+    按主键顺序每次选出 batch_size 行删除，返回删除（dry_run 时为将要删除）的行数。
+    archive: 删除之前把这些行写入的文件（JSON Lines）
+    """
+    deleted = 0
+    last_id = 0
+    while True:
+        rows = list(qs.filter(pk__gt=last_id).order_by("pk").values(*ARCHIVE_FIELDS)[:batch_size])
+        if not rows:
+            return deleted
+        last_id = rows[-1]["id"]
+        if dry_run:
+            deleted += len(rows)
+            continue
+        if archive is not None:
+            for row in rows:
+                archive.write(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n")
+            archive.flush()
+        with transaction.atomic():
+            # 选出之后又变成未读的通知不删除；QuerySet.delete() 会发送 post_delete，
+            # 由 count_deleted_notification 维护 UnreadNotificationCount
+            deleted += Notification.objects.filter(pk__in=[row["id"] for row in rows], read=True).delete()[0]
+        if pause:
+            time.sleep(pause)
+
+
+def prune_notifications(days=None, keep_last=None, batch_size=None, archive=None, dry_run=False, pause=0,
+                        full=False):
+    """
+    执行两种保留策略，返回 {"expired": 行数, "over_limit": 行数, "users_over_limit": 用户数}。
+    days / keep_last 为0时不执行对应的策略。dry_run 时同一行可能在两种策略中都被统计。
+    full: 检查所有用户是否超过 keep_last，而不只是上次执行之后收到了新通知的用户
+    """
+    days = get_retention_days() if days is None else days
+    keep_last = get_keep_last() if keep_last is None else keep_last
+    batch_size = batch_size or get_batch_size()
+    started = time.perf_counter()
+    report = {"expired": 0, "over_limit": 0, "users_over_limit": 0}
+
+    if days:
+        report["expired"] = delete_in_batches(expired(days), batch_size, archive, dry_run, pause)
+    if keep_last:
+        checkpoint, _ = RetentionCheckpoint.objects.get_or_create(name=OVER_LIMIT_CHECKPOINT)
+        # 检查之前记下最大id，检查期间收到的新通知留给下一次
+        last_id = Notification.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+        # 先取出用户列表，不在删除的同时遍历同一张表的游标
+        for user_id in users_over_limit(keep_last, 0 if full else checkpoint.last_id):
+            report["users_over_limit"] += 1
+            report["over_limit"] += delete_in_batches(
+                beyond_keep_last(user_id, keep_last), batch_size, archive, dry_run, pause)
+        if not dry_run:
+            checkpoint.last_id = last_id
+            checkpoint.save()
+
+    logger.info("prune_notifications%s: %s in %.1fs", " (dry run)" if dry_run else "", report,
+                time.perf_counter() - started)
+    return report
@@ -1,3 +1,126 @@
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.utils import timezone
+
+from account.models import Account
+from chat.exceptions import ClientError
+from chat.models import UnreadChatRoomMessages
+from friend.models import FriendList
+from notification.consumers import mark_notifications_read
+from notification.models import Notification, UnreadNotificationCount
+from notification.retention import prune_notifications, users_over_limit
+
+
+class NotificationTestMixin:
+
+    def setUp(self):
+        self.user = Account.objects.create_user("a@test.local", "a", "password")
+        self.other = Account.objects.create_user("b@test.local", "b", "password")
+        self.friend_list = FriendList.objects.get(user=self.user)
+
+    def notify(self, user=None, read=False, days_ago=0):
+        user = user or self.user
+        notification = Notification.objects.create(
+            target=user, from_user=self.other, verb="hello", read=read,
+            content_type=ContentType.objects.get_for_model(FriendList), object_id=self.friend_list.pk)
+        if days_ago:
+            Notification.objects.filter(pk=notification.pk).update(
+                timestamp=timezone.now() - timedelta(days=days_ago))
+        return notification
+
+
+class RetentionTests(NotificationTestMixin, TestCase):
+
+    def test_expired_read_notifications_are_deleted(self):
+        old_read = self.notify(read=True, days_ago=100)
+        old_unread = self.notify(days_ago=100)
+        recent_read = self.notify(read=True)
+
+        report = prune_notifications(days=90, keep_last=0)
+
+        self.assertEqual(report["expired"], 1)
+        self.assertFalse(Notification.objects.filter(pk=old_read.pk).exists())
+        self.assertEqual(Notification.objects.filter(pk__in=[old_unread.pk, recent_read.pk]).count(), 2)
+        self.assertEqual(UnreadNotificationCount.objects.count_for(self.user.id), 1)
+
+    def test_over_limit_only_checks_users_with_new_notifications(self):
+        for _ in range(5):
+            self.notify(read=True)
+        self.assertEqual(users_over_limit(3), [self.user.id])
+
+        report = prune_notifications(days=0, keep_last=3)
+        self.assertEqual((report["users_over_limit"], report["over_limit"]), (1, 2))
+        self.assertEqual(Notification.objects.filter(target=self.user).count(), 3)
+
+        # 之后只有 other 收到了新通知
+        for _ in range(2):
+            self.notify(user=self.other, read=True)
+        self.assertEqual(prune_notifications(days=0, keep_last=2)["users_over_limit"], 0)
+        # --full 检查所有用户
+        report = prune_notifications(days=0, keep_last=2, full=True)
+        self.assertEqual((report["users_over_limit"], report["over_limit"]), (1, 1))
+
+
+class UnreadNotificationCountTests(NotificationTestMixin, TestCase):
+
+    def count(self):
+        return UnreadNotificationCount.objects.count_for(self.user.id)
+
+    def test_created_and_deleted(self):
+        first = self.notify()
+        self.notify()
+        self.notify(read=True)
+        self.assertEqual(self.count(), 2)
+        first.delete()
+        self.assertEqual(self.count(), 1)
+
+    def test_read_flag_changes(self):
+        notification = self.notify()
+        notification.read = True
+        notification.save()
+        self.assertEqual(self.count(), 0)
+        # 从数据库加载的实例与数据库中的 read 比较
+        notification = Notification.objects.get(pk=notification.pk)
+        notification.read = False
+        notification.save()
+        notification.save()
+        self.assertEqual(self.count(), 1)
+
+    def test_mark_read(self):
+        for _ in range(3):
+            self.notify()
+        later = self.notify()
+        Notification.objects.filter(pk=later.pk).update(timestamp=timezone.now() + timedelta(minutes=1))
+        content_types = [ContentType.objects.get_for_model(FriendList)]
+
+        self.assertEqual(Notification.objects.mark_read(self.user, content_types, timezone.now()), 3)
+        self.assertEqual(self.count(), 1)
+        self.assertEqual(Notification.objects.filter(target=self.user, read=False).count(), 1)
+
+    def test_chat_notifications_are_not_counted(self):
+        Notification.objects.create(
+            target=self.user, from_user=self.other, verb="hi",
+            content_type=ContentType.objects.get_for_model(UnreadChatRoomMessages), object_id=1)
+        self.assertEqual(self.count(), 0)
+
+
+class MarkNotificationsReadTests(NotificationTestMixin, TestCase):
+    # 不经过 database_sync_to_async 的线程，直接在测试的事务中执行
+    mark_read = staticmethod(mark_notifications_read.__wrapped__)
+
+    def test_invalid_timestamp_is_rejected(self):
+        self.notify()
+        for value in ("yesterday", "2026-13-45T00:00:00"):
+            with self.assertRaises(ClientError):
+                self.mark_read(self.user, value)
+        self.assertEqual(UnreadNotificationCount.objects.count_for(self.user.id), 1)
 
-# Create your tests here.
+    def test_timestamp_limits_marked_notifications(self):
+        shown = self.notify(days_ago=1)
+        self.notify()
+        shown.refresh_from_db()
+        self.assertEqual(self.mark_read(self.user, shown.timestamp.isoformat()), 1)
+        self.assertEqual(self.mark_read(self.user, None), 1)
+        self.assertEqual(UnreadNotificationCount.objects.count_for(self.user.id), 0)
@@ -1,5 +1,86 @@
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
 from django.core.serializers.python import Serializer
 from django.contrib.humanize.templatetags.humanize import naturaltime
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def notification_group_name(user_id):
+    """
+    用户所有已打开页面的 NotificationConsumer 加入的组
+    """
+    return f"Notifications-{user_id}"
+
+
+def push_to_user(user_id, event):
+    """
+    发送给用户所有已连接的通知socket，推送失败不影响调用方（页面刷新后会重新获取通知）
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(notification_group_name(user_id), event)
+    except Exception:
+        logger.exception("push_to_user: group_send failed")
+
+
+def push_notifications(**lookup):
+    """
+    把新建或更新的通知（Notification.objects.filter(**lookup)）推送给目标用户：
+    FriendRequest/FriendList -> NotificationConsumer.notification_general()，
+    UnreadChatRoomMessages -> NotificationConsumer.notification_chat()
+    """
+    from notification.models import Notification
+
+    events = {}
+    s = LazyNotificationEncoder()
+    for notification in Notification.objects.with_related().filter(**lookup).order_by("timestamp", "id"):
+        if notification.get_content_object_type() == "UnreadChatRoomMessages":
+            event_type = "notification.chat"
+        else:
+            event_type = "notification.general"
+        events.setdefault((notification.target_id, event_type), []).extend(s.serialize([notification]))
+    for (user_id, event_type), notifications in events.items():
+        push_to_user(user_id, {"type": event_type, "notifications": notifications})
+
+
+def push_notifications_on_commit(**lookup):
+    """
+    事务提交后再推送，socket收到时数据库中已经是新的数据
+    """
+    transaction.on_commit(lambda: push_notifications(**lookup))
+
+
+def encode_cursor(cursor):
+    """
+    NotificationManager.page_for 返回的 (timestamp, id) -> 发送给模板的字符串，没有下一页时为None
+    """
+    if cursor is None:
+        return None
+    timestamp, notification_id = cursor
+    return f"{timestamp.isoformat()}_{notification_id}"
+
+
+def decode_cursor(value):
+    """
+    模板发送的游标 -> (timestamp, id)，为空时（第一页）返回None，格式不对时抛出 ValueError
+    """
+    if not value:
+        return None
+    timestamp, _, notification_id = str(value).rpartition("_")
+    timestamp = parse_datetime(timestamp)
+    if timestamp is None or not notification_id.isdigit():
+        raise ValueError(f"invalid notification cursor: {value!r}")
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp, timezone.utc)
+    return timestamp, int(notification_id)
 
 
 class LazyNotificationEncoder(Serializer):
@@ -11,9 +92,13 @@ class LazyNotificationEncoder(Serializer):
         3. UnreadChatRoomMessage
     """
     def get_dump_object(self, obj):
+        """
+        obj 应该来自 Notification.objects.with_related()，否则每条通知都要查询 from_user 和 content_object
+        """
         dump_object = {}
-        if obj.get_content_object_type() == "FriendRequest":
-            dump_object.update({'notification_type': obj.get_content_object_type()})
+        notification_type = obj.get_content_object_type()
+        if notification_type == "FriendRequest":
+            dump_object.update({'notification_type': notification_type})
             dump_object.update({'notification_id': str(obj.pk)})
             dump_object.update({'verb': obj.verb})
             dump_object.update({'is_active': str(obj.content_object.is_active)})
@@ -25,11 +110,11 @@ class LazyNotificationEncoder(Serializer):
                     'redirect_url': str(obj.redirect_url),
                 },
                 "from": {
-                    "image_url": str(obj.from_user.profile_image.url)
+                    "image_url": str(obj.from_user.avatar_url)
                 }
             })
-        if obj.get_content_object_type() == "FriendList":
-            dump_object.update({'notification_type': obj.get_content_object_type()})
+        if notification_type == "FriendList":
+            dump_object.update({'notification_type': notification_type})
             dump_object.update({'notification_id': str(obj.pk)})
             dump_object.update({'verb': obj.verb})
             dump_object.update({'natural_timestamp': str(naturaltime(obj.timestamp))})
@@ -40,7 +125,22 @@ class LazyNotificationEncoder(Serializer):
                     'redirect_url': str(obj.redirect_url),
                 },
                 "from": {
-                    "image_url": str(obj.from_user.profile_image.url)
+                    "image_url": str(obj.from_user.avatar_url)
+                }
+            })
+        if notification_type == "UnreadChatRoomMessages":
+            dump_object.update({'notification_type': notification_type})
+            dump_object.update({'notification_id': str(obj.pk)})
+            dump_object.update({'verb': obj.verb})
+            dump_object.update({'natural_timestamp': str(naturaltime(obj.timestamp))})
+            dump_object.update({'timestamp': str(obj.timestamp)})
+            dump_object.update({
+                'actions': {
+                    'redirect_url': str(obj.redirect_url),
+                },
+                "from": {
+                    "title": str(obj.from_user.username),
+                    "image_url": str(obj.from_user.avatar_url)
                 }
             })
-        return dump_object
\ No newline at end of file
+        return dump_object
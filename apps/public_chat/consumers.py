@@ -1,24 +1,46 @@
 import json
+import logging
+import time
+from collections import OrderedDict
 
-from channels.db import database_sync_to_async
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
 from django.core.paginator import Paginator
-from django.core.serializers.python import Serializer
-from django.utils import timezone
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
+from account.consumers import AccountEventsConsumerMixin
+from chat.buffer import MessageWriteBuffer
+from chat.cache import RecentMessageCache, merge_rows
 from chat.exceptions import ClientError
-from chat.utils import calculate_timestamp
+from chat.utils import (
+    build_chat_message_frame, build_history_frame, history_page, history_page_before, history_row, history_rows,
+    pending_history_rows,
+)
+from metrics.instrumentation import database_sync_to_async, MetricsConsumerMixin
 from public_chat.models import PublicChatroom, PublicChatroomMessage
-from .constants import MSG_TYPE_CONNECTED_USER_COUNT, MSG_TYPE_MESSAGE, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE
+from public_chat.presence import ConnectedUserCountCoalescer, get_presence
+from .constants import MSG_TYPE_CONNECTED_USER_COUNT, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE
 
+logger = logging.getLogger(__name__)
 
-class PublicChatConsumer(AsyncJsonWebsocketConsumer):
+# 当前worker进程的消息写缓冲
+public_message_buffer = MessageWriteBuffer(PublicChatroomMessage)
+# 当前worker进程的最近消息缓存（打开房间时的第一页聊天记录）
+public_recent_messages = RecentMessageCache("public", DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1)
+# 当前worker进程的在线人数广播合并器
+user_count_coalescer = ConnectedUserCountCoalescer()
+
+
+class PublicChatConsumer(MetricsConsumerMixin, AccountEventsConsumerMixin, AsyncJsonWebsocketConsumer):
+    metrics_commands = ("send", "join", "leave", "get_room_chat_messages", "get_room_chat_history")
 
     async def connect(self):
         """
         Called when websocket is handshaking as part of initial connection
         """
-        print("PublicChatConsumer: connect:" + str(self.scope['user']))
+        logger.debug("PublicChatConsumer: connect: %s", self.scope['user'])
         await self.accept()
 
         self.room_id = None
@@ -27,7 +49,7 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
         """
         Called when a WebSocket connection is closed.
         """
-        print("PublicChatConsumer disconnect")
+        logger.debug("PublicChatConsumer disconnect")
         try:
             if self.room_id is not None:
                 await self.leave_room(self.room_id)
@@ -40,7 +62,7 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
         """
         command = content.get("command", None)
         message = content.get("message", None)
-        print(f"PublicChatConsumer: receive_json: command: {command}, message: {message}")
+        logger.debug("PublicChatConsumer: receive_json: command: %s, message: %s", command, message)
         try:
             if command == "send":
                 if len(content['message'].lstrip()) == 0:
@@ -55,10 +77,18 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
             elif command == "get_room_chat_messages":
                 await self.display_progress_bar(True)
                 room = await get_room_or_error(content['room_id'])
-                payload = await get_room_chat_messages(room, content['page_number'])
-                if payload is not None:
-                    payload = json.loads(payload)
-                    await self.send_messages_payload(payload['messages'], payload['new_page_number'])
+                frame = await get_room_chat_messages(room, content['page_number'])
+                if frame is not None:
+                    await self.send_messages_payload(frame)
+                else:
+                    raise ClientError(204, "聊天记录获取错误.")
+                await self.display_progress_bar(False)
+            elif command == "get_room_chat_history":
+                await self.display_progress_bar(True)
+                room = await get_room_or_error(content['room_id'])
+                frame = await get_room_chat_messages_before(room, content.get('before_msg_id'))
+                if frame is not None:
+                    await self.send_messages_payload(frame)
                 else:
                     raise ClientError(204, "聊天记录获取错误.")
                 await self.display_progress_bar(False)
@@ -71,7 +101,7 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
         Called by receive_json when someone sends a message to a room.
         """
         # Check they are in this room
-        print("PublicChatConsumer: send_room")
+        logger.debug("PublicChatConsumer: send_room")
         if self.room_id is not None:
             if str(room_id) != str(self.room_id):
                 raise ClientError("ROOM_ACCESS_DENIED", "Room access denied")
@@ -83,32 +113,31 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
         # Get the room and send to the group about it
         room = await get_room_or_error(room_id)
 
-        await create_public_room_chat_message(room, self.scope['user'], message)
+        # 先放入写缓冲（已分配id），立即广播，稍后批量写入数据库
+        chat_message = await public_message_buffer.add(room, self.scope['user'], message)
 
-        await self.channel_layer.group_send(
+        await self.group_send(
             room.group_name, {
                 "type": "chat.message",  # 调用函数chat_message()
-                "profile_image": self.scope["user"].profile_image.url,
-                "username": self.scope["user"].username,
-                "user_id": self.scope["user"].id,
-                "message": message,
+                "text": build_chat_message_frame(chat_message),
             }
         )
+        await sync_to_async(public_recent_messages.push)(room.id, history_row(chat_message))
 
     async def join_room(self, room_id):
         """
         Called by receive_json when someone sent a join command.
         """
-        print("PublicChatConsumer: join_room")
+        logger.debug("PublicChatConsumer: join_room")
         is_auth = is_authenticated(self.scope["user"])
         try:
             room = await get_room_or_error(room_id)
         except ClientError as e:
             await self.handle_client_error(e)
         else:
-            # Add user to "users" list for room
+            # 记录在线状态（不经过ORM）
             if is_auth:
-                await connect_user(room, self.scope["user"])
+                await get_presence().connect(room.id, self.scope["user"].id, self.channel_name)
 
             # Store that we're in the room
             self.room_id = room.id
@@ -124,23 +153,20 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
                 "join": str(room.id)
             })
 
-            num_connected_users = get_num_connected_users(room)
-            await self.channel_layer.group_send(room.group_name, {
-                "type": "connected.user.count",  # 调用函数connected_user_count()
-                "connected_user_count": num_connected_users,
-            })
+            # 在线人数广播会被合并，每个房间每个间隔最多一次
+            user_count_coalescer.changed(self.channel_layer, room)
 
     async def leave_room(self, room_id):
         """
         Called by receive_json when someone sent a leave command.
         """
-        print("PublicChatConsumer: leave_room")
+        logger.debug("PublicChatConsumer: leave_room")
         is_auth = is_authenticated(self.scope["user"])
         room = await get_room_or_error(room_id)
 
-        # Remove user from "users" list
+        # 移除在线状态
         if is_auth:
-            await disconnect_user(room, self.scope["user"])
+            await get_presence().disconnect(room.id, self.scope["user"].id, self.channel_name)
 
         # Remove that we're in the room
         self.room_id = None
@@ -150,44 +176,35 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
             self.channel_name,
         )
 
-        num_connected_users = get_num_connected_users(room)
-        await self.channel_layer.group_send(room.group_name, {
-            "type": "connected.user.count",  # 调用函数connected_user_count()
-            "connected_user_count": num_connected_users,
-        })
+        user_count_coalescer.changed(self.channel_layer, room)
 
     async def handle_client_error(self, e):
         """
         Called when a ClientError is raised.
         Sends error data to UI.
         """
+        self.count_client_error(e)
         errorData = {'error': e.code}
         if e.message:
             errorData['message'] = e.message
             await self.send_json(errorData)
 
-    async def send_messages_payload(self, messages, new_page_number):
+    async def send_messages_payload(self, frame):
         """
-        按分页形式，加载之前的消息
+        加载之前的消息
         Parameters
         ----------
-        messages: 消息
-        new_page_number: 页号
+        frame: build_history_frame 编码好的消息帧（包括 next_cursor 或 new_page_number），直接发送
 
         Returns
         -------
 
         """
-        print("PublicChatConsumer: send_messages_payload. ")
-
-        await self.send_json({
-            "messages_payload": "messages_payload",
-            "messages": messages,
-            "new_page_number": new_page_number,
-        })
+        logger.debug("PublicChatConsumer: send_messages_payload.")
+        await self.send(text_data=frame)
 
     async def display_progress_bar(self, is_displayed):
-        print("DISPLAY PROGRESS BAR: " + str(is_displayed))
+        logger.debug("DISPLAY PROGRESS BAR: %s", is_displayed)
         await self.send_json({
             "display_progress_bar": is_displayed
         })
@@ -195,19 +212,10 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
     async def chat_message(self, event):
         """
         Called when someone has messaged our chat.
-        将
+        消息帧已经在发送方编码好，直接转发给客户端
         """
-        # Send a message down to the client
-        print("PublicChatConsumer: chat_message from user #" + str(event["user_id"]))
-        timestamp = calculate_timestamp(timezone.now())
-        await self.send_json({
-            "msg_type": MSG_TYPE_MESSAGE,
-            "profile_image": event["profile_image"],
-            "username": event["username"],
-            "user_id": event["user_id"],
-            "message": event["message"],
-            "natural_timestamp": timestamp,
-        })
+        logger.debug("PublicChatConsumer: chat_message")
+        await self.send(text_data=event["text"])
 
     async def connected_user_count(self, event):
         """
@@ -215,7 +223,7 @@ class PublicChatConsumer(AsyncJsonWebsocketConsumer):
         This number is displayed in the room so other users know how many users are connected to the chat.
         """
         # Send a message down to the client
-        print("PublicChatConsumer: connected_user_count: count: " + str(event["connected_user_count"]))
+        logger.debug("PublicChatConsumer: connected_user_count: count: %s", event["connected_user_count"])
         await self.send_json({
             "msg_type": MSG_TYPE_CONNECTED_USER_COUNT,
             "connected_user_count": event["connected_user_count"]
@@ -226,32 +234,37 @@ def is_authenticated(user):
     return user.is_authenticated
 
 
-def get_num_connected_users(room):
-    if room.users:
-        return len(room.users.all())
-    return 0
+# 公共聊天室只在后台创建，按进程缓存，join/leave/send 不再每次查询数据库。
+# room_id -> (聊天室, 过期时间)，最多 PUBLIC_ROOM_CACHE_SIZE 个；本进程中的修改/删除立即失效，
+# 其他进程（例如后台）的修改最多 PUBLIC_ROOM_CACHE_TIMEOUT 秒后生效
+_rooms = OrderedDict()
 
 
-@database_sync_to_async
-def create_public_room_chat_message(room, user, message):
-    return PublicChatroomMessage.objects.create(user=user, room=room, content=message)
-
-
-@database_sync_to_async
-def connect_user(room, user):
-    return room.connect_user(user)
+async def get_room_or_error(room_id):
+    """
+    Tries to fetch a room for the user
+    """
+    key = str(room_id)
+    cached = _rooms.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        _rooms.move_to_end(key)
+        return cached[0]
+    room = await fetch_room_or_error(room_id)
+    _rooms[key] = (room, time.monotonic() + getattr(settings, "PUBLIC_ROOM_CACHE_TIMEOUT", 60))
+    _rooms.move_to_end(key)
+    while len(_rooms) > getattr(settings, "PUBLIC_ROOM_CACHE_SIZE", 1000):
+        _rooms.popitem(last=False)
+    return room
 
 
-@database_sync_to_async
-def disconnect_user(room, user):
-    return room.disconnect_user(user)
+@receiver(post_save, sender=PublicChatroom)
+@receiver(post_delete, sender=PublicChatroom)
+def evict_cached_room(sender, instance, **kwargs):
+    _rooms.pop(str(instance.pk), None)
 
 
 @database_sync_to_async
-def get_room_or_error(room_id):
-    """
-    Tries to fetch a room for the user
-    """
+def fetch_room_or_error(room_id):
     try:
         room = PublicChatroom.objects.get(pk=room_id)
     except PublicChatroom.DoesNotExist:
@@ -259,41 +272,62 @@ def get_room_or_error(room_id):
     return room
 
 
-@database_sync_to_async
-def get_room_chat_messages(room, page_number):
-    try:
+def get_newest_history_rows(room):
+    """
+    最新一页（多一条用于判断是否还有更早的消息）：先查最近消息缓存，
+    未命中时查询数据库，带上还在写缓冲中的消息（按id去重），再写入缓存
+    """
+    rows = public_recent_messages.get(room.id)
+    if rows is None:
         qs = PublicChatroomMessage.objects.by_room(room)
-        p = Paginator(qs, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+        rows = list(history_rows(qs)[:DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1])
+        pending = pending_history_rows(public_message_buffer.pending_for_room(room.id))
+        rows = merge_rows(DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE + 1, pending, rows)
+        rows = public_recent_messages.fill(room.id, rows)
+    return rows
 
-        payload = {}
 
-        new_page_number = int(page_number)
-        if new_page_number <= p.num_pages:
-            new_page_number = new_page_number + 1
-            s = LazyRoomChatMessageEncoder()
-            payload['messages'] = s.serialize(p.page(page_number).object_list)
+@database_sync_to_async
+def get_room_chat_messages_before(room, msg_id):
+    """
+    游标分页获取聊天记录：多取一条用于判断是否还有更早的消息，不做COUNT
+    """
+    try:
+        if msg_id is None:
+            rows, next_cursor = history_page(get_newest_history_rows(room), DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
         else:
-            payload['messages'] = "None"
-        payload['new_page_number'] = new_page_number
-        return json.dumps(payload)
+            pending = pending_history_rows(public_message_buffer.pending_for_room(room.id))
+            rows, next_cursor = history_page_before(
+                PublicChatroomMessage.objects, room, msg_id, pending, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+        return build_history_frame(rows, next_cursor=next_cursor)
 
     except Exception as e:
-        print("EXCEPTION: " + str(e))
+        logger.exception("get_room_chat_messages_before")
         return None
 
 
-class LazyRoomChatMessageEncoder(Serializer):
+@database_sync_to_async
+def get_room_chat_messages(room, page_number):
     """
-    自定义序列化器
+    旧的页码分页协议，保留以兼容旧客户端；新客户端使用 get_room_chat_history
     """
+    try:
+        if int(page_number) == 1:
+            rows = get_newest_history_rows(room)[:DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE]
+            return build_history_frame(rows, new_page_number=2)
 
-    def get_dump_object(self, obj):
-        json_data = {}
-        json_data.update({'msg_type': MSG_TYPE_MESSAGE})
-        json_data.update({'user_id': str(obj.user.id)})
-        json_data.update({'msg_id': str(obj.id)})
-        json_data.update({'username': str(obj.user.username)})
-        json_data.update({'message': str(obj.content)})
-        json_data.update({'profile_image': str(obj.user.profile_image.url)})
-        json_data.update({'natural_timestamp': calculate_timestamp(obj.timestamp)})
-        return json_data
+        qs = history_rows(PublicChatroomMessage.objects.by_room(room))
+        p = Paginator(qs, DEFAULT_ROOM_CHAT_MESSAGE_PAGE_SIZE)
+
+        new_page_number = int(page_number)
+        if new_page_number <= p.num_pages:
+            return build_history_frame(p.page(page_number).object_list, new_page_number=new_page_number + 1)
+        return json.dumps({
+            "messages_payload": "messages_payload",
+            "messages": "None",
+            "new_page_number": new_page_number,
+        })
+
+    except Exception as e:
+        logger.exception("get_room_chat_messages")
+        return None
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.15 on 2026-10-17 11:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_chat', '0003_auto_20210217_1632'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publicchatroommessage',
+            index=models.Index(fields=['room', '-timestamp', '-id'], name='public_msg_room_ts_idx'),
+        ),
+    ]
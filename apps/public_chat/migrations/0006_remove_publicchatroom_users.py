@@ -0,0 +1,17 @@
+# Generated by Django 2.2.15 on 2026-10-17 11:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_chat', '0005_auto_20261017_1138'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='publicchatroom',
+            name='users',
+        ),
+    ]
@@ -1,10 +1,11 @@
 from django.db import models
+from django.db.models import Q, Subquery
 from django.conf import settings
+from django.utils import timezone
 
 
 class PublicChatroom(models.Model):
     title = models.CharField(max_length=255, unique=True, blank=False)
-    users = models.ManyToManyField(settings.AUTH_USER_MODEL, blank=True, help_text="聊天室中的用户")
 
     class Meta:
         db_table = 'tb_public_chatroom'
@@ -14,31 +15,6 @@ class PublicChatroom(models.Model):
     def __str__(self):
         return self.title
 
-    def connect_user(self, user):
-        """
-        如果用户被加入到users list，返回True
-        """
-        is_user_added = False
-        if not user in self.users.all():
-            self.users.add(user)
-            self.save()
-            is_user_added = True
-        elif user in self.users.all():
-            is_user_added = True
-        return is_user_added
-
-    def disconnect_user(self, user):
-        """
-        删除
-        """
-        is_user_removed = False
-        if user in self.users.all():
-            self.users.remove(user)
-            self.save()
-            is_user_removed = True
-
-        return is_user_removed
-
     @property
     def group_name(self):
         """
@@ -54,7 +30,23 @@ class PublicChatroom(models.Model):
 class PublicChatroomMessageManager(models.Manager):
     def by_room(self, room):
         # retrieve the newest message first
-        qs = PublicChatroomMessage.objects.filter(room=room).order_by("-timestamp")
+        qs = PublicChatroomMessage.objects.filter(room=room).order_by("-timestamp", "-id")
+        return qs
+
+    def by_room_before(self, room, msg_id=None, timestamp=None):
+        """
+        游标分页：返回 (timestamp, msg_id) 之前（更早）的消息，不使用COUNT(*)和OFFSET。
+        走 (room, -timestamp, -id) 索引，msg_id 为空时从最新消息开始；
+        没有 timestamp 时按主键查询 msg_id 的时间戳（这条消息必须已经写入数据库）
+        """
+        qs = self.by_room(room)
+        if msg_id is not None and timestamp is not None:
+            qs = qs.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=msg_id))
+        elif msg_id is not None:
+            anchor = PublicChatroomMessage.objects.filter(pk=msg_id).values("timestamp")[:1]
+            qs = qs.filter(
+                Q(timestamp__lt=Subquery(anchor)) | Q(timestamp=Subquery(anchor), id__lt=msg_id)
+            )
         return qs
 
 
@@ -64,13 +56,17 @@ class PublicChatroomMessage(models.Model):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     room = models.ForeignKey(PublicChatroom, on_delete=models.CASCADE)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # 使用default而不是auto_now_add，写缓冲中预先生成的时间戳在bulk_create时不会被覆盖
+    timestamp = models.DateTimeField(default=timezone.now)
     content = models.TextField(unique=False, blank=False)
 
     objects = PublicChatroomMessageManager()
 
     class Meta:
         db_table = 'tb_public_chatroom_message'
+        indexes = [
+            models.Index(fields=['room', '-timestamp', '-id'], name='public_msg_room_ts_idx'),
+        ]
         verbose_name = '公共聊天室消息'
         verbose_name_plural = verbose_name
 
@@ -0,0 +1,322 @@
+"""
+公共聊天室在线状态（presence）
+
+每个房间记录 user_id -> 连接数（同一用户多个标签页只算一个在线用户），
+每个连接带有过期时间，由所在worker定时续期；worker崩溃后它的连接会自动过期。
+房间在线人数是 O(1) 读取，join/leave 不再经过 ORM。
+
+配置方式与 CHANNEL_LAYERS 相同：
+
+    PRESENCE = {
+        'BACKEND': 'public_chat.presence.RedisPresenceBackend',
+        'CONFIG': {'hosts': [('127.0.0.1', 6379)], 'ttl': 60},
+    }
+"""
+import abc
+import asyncio
+import logging
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from metrics.instrumentation import WS_GROUP_SEND_TOTAL
+from metrics.registry import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+USER_COUNT_BROADCAST_DELAY = Histogram(
+    "connected_user_count_broadcast_delay_seconds",
+    "Delay between a public room count change and its coalesced broadcast.")
+USER_COUNT_COALESCED_TOTAL = Counter(
+    "connected_user_count_coalesced_total", "Count changes merged into an already scheduled broadcast.")
+
+DEFAULT_PRESENCE = {
+    'BACKEND': 'public_chat.presence.InMemoryPresenceBackend',
+}
+
+
+class BasePresenceBackend(abc.ABC):
+    """
+    子类实现 _add / _remove / _refresh / count，
+    这里负责记录本进程的连接并定时续期
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._local = {}  # channel_name -> (room_id, user_id)
+        self._heartbeat = None
+        self._heartbeat_loop = None
+
+    async def connect(self, room_id, user_id, channel_name):
+        """
+        记录一个连接，返回房间当前在线人数
+        """
+        self._local[channel_name] = (room_id, user_id)
+        self._ensure_heartbeat()
+        return await self._add(room_id, user_id, channel_name, time.time() + self.ttl)
+
+    async def disconnect(self, room_id, user_id, channel_name):
+        """
+        移除一个连接，返回房间当前在线人数
+        """
+        self._local.pop(channel_name, None)
+        return await self._remove(room_id, user_id, channel_name)
+
+    @abc.abstractmethod
+    async def count(self, room_id):
+        """
+        房间当前在线人数（不包括已经过期的连接）
+        """
+
+    @abc.abstractmethod
+    async def _add(self, room_id, user_id, channel_name, expires):
+        """
+        记录一个连接，返回房间当前在线人数
+        """
+
+    @abc.abstractmethod
+    async def _remove(self, room_id, user_id, channel_name):
+        """
+        移除一个连接，返回房间当前在线人数
+        """
+
+    @abc.abstractmethod
+    async def _refresh(self, connections, expires):
+        """
+        connections: [(room_id, user_id, channel_name), ...]
+        """
+
+    def _ensure_heartbeat(self):
+        loop = asyncio.get_event_loop()
+        if self._heartbeat is None or self._heartbeat.done() or self._heartbeat_loop is not loop:
+            self._heartbeat_loop = loop
+            self._heartbeat = asyncio.ensure_future(self._run_heartbeat())
+
+    async def _run_heartbeat(self):
+        while self._local:
+            await asyncio.sleep(self.ttl / 3)
+            connections = [(room_id, user_id, channel_name)
+                           for channel_name, (room_id, user_id) in list(self._local.items())]
+            try:
+                await self._refresh(connections, time.time() + self.ttl)
+            except Exception:
+                logger.exception("presence heartbeat")
+
+
+class InMemoryPresenceBackend(BasePresenceBackend):
+    """
+    单进程内存实现，用于测试和本地开发
+    """
+
+    def __init__(self, ttl=60):
+        super().__init__(ttl=ttl)
+        self._users = {}  # room_id -> {user_id: 连接数}
+        self._connections = {}  # room_id -> {channel_name: (user_id, 过期时间)}
+
+    async def count(self, room_id):
+        self._expire(str(room_id))
+        return len(self._users.get(str(room_id), {}))
+
+    async def _add(self, room_id, user_id, channel_name, expires):
+        room_id = str(room_id)
+        self._expire(room_id)
+        connections = self._connections.setdefault(room_id, {})
+        if channel_name not in connections:
+            users = self._users.setdefault(room_id, {})
+            users[user_id] = users.get(user_id, 0) + 1
+        connections[channel_name] = (user_id, expires)
+        return len(self._users[room_id])
+
+    async def _remove(self, room_id, user_id, channel_name):
+        room_id = str(room_id)
+        self._expire(room_id)
+        self._drop(room_id, channel_name)
+        return len(self._users.get(room_id, {}))
+
+    async def _refresh(self, connections, expires):
+        for room_id, user_id, channel_name in connections:
+            room_connections = self._connections.get(str(room_id), {})
+            if channel_name in room_connections:
+                room_connections[channel_name] = (user_id, expires)
+
+    def _expire(self, room_id):
+        now = time.time()
+        expired = [channel_name for channel_name, (_, expires) in self._connections.get(room_id, {}).items()
+                   if expires <= now]
+        for channel_name in expired:
+            self._drop(room_id, channel_name)
+
+    def _drop(self, room_id, channel_name):
+        connection = self._connections.get(room_id, {}).pop(channel_name, None)
+        if connection is None:
+            return
+        users = self._users[room_id]
+        user_id = connection[0]
+        users[user_id] -= 1
+        if users[user_id] <= 0:
+            del users[user_id]
+
+
+# KEYS[1]: 房间 user_id -> 连接数 的hash，KEYS[2]: 房间连接的zset（score为过期时间）
+# 先清理过期连接，保证崩溃的worker留下的连接不会一直计数
+_EXPIRE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, member in ipairs(expired) do
+    local user_id = string.match(member, '^([^|]+)|')
+    redis.call('ZREM', KEYS[2], member)
+    if redis.call('HINCRBY', KEYS[1], user_id, -1) <= 0 then
+        redis.call('HDEL', KEYS[1], user_id)
+    end
+end
+"""
+
+# ARGV: now, member, user_id, expires
+_ADD_SCRIPT = _EXPIRE_SCRIPT + """
+if redis.call('ZADD', KEYS[2], ARGV[4], ARGV[2]) == 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[3], 1)
+end
+return redis.call('HLEN', KEYS[1])
+"""
+
+# ARGV: now, member, user_id
+_REMOVE_SCRIPT = _EXPIRE_SCRIPT + """
+if redis.call('ZREM', KEYS[2], ARGV[2]) == 1 then
+    if redis.call('HINCRBY', KEYS[1], ARGV[3], -1) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[3])
+    end
+end
+return redis.call('HLEN', KEYS[1])
+"""
+
+# ARGV: now
+_COUNT_SCRIPT = _EXPIRE_SCRIPT + """
+return redis.call('HLEN', KEYS[1])
+"""
+
+# ARGV: expires, member；只续期仍然存在的连接
+_REFRESH_SCRIPT = """
+if redis.call('ZSCORE', KEYS[2], ARGV[2]) then
+    redis.call('ZADD', KEYS[2], ARGV[1], ARGV[2])
+end
+"""
+
+
+class RedisPresenceBackend(BasePresenceBackend):
+    """
+    基于Redis的共享实现，所有worker共用同一份在线状态
+    """
+
+    def __init__(self, hosts=None, prefix="presence", ttl=60):
+        super().__init__(ttl=ttl)
+        self.hosts = hosts or [('127.0.0.1', 6379)]
+        self.prefix = prefix
+        self._pools = {}  # 每个event loop一个连接池
+
+    async def count(self, room_id):
+        redis = await self._connection()
+        return await redis.eval(
+            _COUNT_SCRIPT,
+            keys=[self._users_key(room_id), self._connections_key(room_id)],
+            args=[time.time()],
+        )
+
+    async def _add(self, room_id, user_id, channel_name, expires):
+        redis = await self._connection()
+        return await redis.eval(
+            _ADD_SCRIPT,
+            keys=[self._users_key(room_id), self._connections_key(room_id)],
+            args=[time.time(), self._member(user_id, channel_name), user_id, expires],
+        )
+
+    async def _remove(self, room_id, user_id, channel_name):
+        redis = await self._connection()
+        return await redis.eval(
+            _REMOVE_SCRIPT,
+            keys=[self._users_key(room_id), self._connections_key(room_id)],
+            args=[time.time(), self._member(user_id, channel_name), user_id],
+        )
+
+    async def _refresh(self, connections, expires):
+        redis = await self._connection()
+        pipe = redis.pipeline()
+        for room_id, user_id, channel_name in connections:
+            pipe.eval(
+                _REFRESH_SCRIPT,
+                keys=[self._users_key(room_id), self._connections_key(room_id)],
+                args=[expires, self._member(user_id, channel_name)],
+            )
+        await pipe.execute()
+
+    async def _connection(self):
+        import aioredis
+        loop = asyncio.get_event_loop()
+        if loop not in self._pools:
+            self._pools[loop] = await aioredis.create_redis_pool(self.hosts[0])
+        return self._pools[loop]
+
+    def _users_key(self, room_id):
+        return f"{self.prefix}:room:{room_id}:users"
+
+    def _connections_key(self, room_id):
+        return f"{self.prefix}:room:{room_id}:connections"
+
+    @staticmethod
+    def _member(user_id, channel_name):
+        return f"{user_id}|{channel_name}"
+
+
+class ConnectedUserCountCoalescer:
+    """
+    合并房间在线人数的广播：每个房间每个 interval 最多广播一次，广播时读取最新人数。
+    避免部署后大量重连时 N 次 join 产生 N 次全房间广播（O(N²) 帧）。
+    每个worker进程各自合并自己产生的变化
+    """
+
+    def __init__(self, interval=None):
+        self.interval = interval or getattr(settings, "CONNECTED_USER_COUNT_INTERVAL", 1.0)
+        self._pending = {}  # room_id -> 第一次未广播变化的时间
+        self._last_sent = {}  # room_id -> 上次广播时间
+
+    def changed(self, channel_layer, room):
+        """
+        房间人数发生变化，安排（或合并进）一次广播
+        """
+        if room.id in self._pending:
+            USER_COUNT_COALESCED_TOTAL.inc()
+            return
+        now = time.monotonic()
+        self._pending[room.id] = now
+        delay = max(0.0, self._last_sent.get(room.id, 0.0) + self.interval - now)
+        asyncio.get_event_loop().call_later(
+            delay, lambda: asyncio.ensure_future(self._broadcast(channel_layer, room))
+        )
+
+    async def _broadcast(self, channel_layer, room):
+        changed_at = self._pending.pop(room.id)
+        self._last_sent[room.id] = time.monotonic()
+        try:
+            num_connected_users = await get_presence().count(room.id)
+            WS_GROUP_SEND_TOTAL.inc(consumer="PublicChatConsumer", type="connected.user.count")
+            await channel_layer.group_send(room.group_name, {
+                "type": "connected.user.count",  # 调用函数connected_user_count()
+                "connected_user_count": num_connected_users,
+            })
+        except Exception:
+            logger.exception("connected user count broadcast")
+            return
+        USER_COUNT_BROADCAST_DELAY.observe(time.monotonic() - changed_at)
+
+
+_presence = None
+
+
+def get_presence():
+    """
+    返回当前进程的presence后端（按 settings.PRESENCE 创建）
+    """
+    global _presence
+    if _presence is None:
+        config = getattr(settings, "PRESENCE", DEFAULT_PRESENCE)
+        _presence = import_string(config['BACKEND'])(**config.get('CONFIG', {}))
+    return _presence
@@ -1,3 +1,143 @@
-from django.test import TestCase
+import socket
+import time
+import unittest
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from chat.exceptions import ClientError
+from public_chat import consumers
+from public_chat.models import PublicChatroom
+from public_chat.presence import BasePresenceBackend, InMemoryPresenceBackend, RedisPresenceBackend
+
+REDIS_HOST = getattr(settings, "PRESENCE", {}).get("CONFIG", {}).get("hosts", [("127.0.0.1", 6379)])[0]
+
+
+def redis_available():
+    try:
+        socket.create_connection(REDIS_HOST, timeout=0.5).close()
+    except OSError:
+        return False
+    return True
+
+
+class PresenceBackendTestsMixin:
+    """
+    两种后端共用的测试，子类实现 make_backend
+    """
+
+    def run_with_backend(self, test):
+        async def run():
+            backend = self.make_backend()
+            try:
+                await test(backend)
+            finally:
+                await self.close_backend(backend)
+
+        async_to_sync(run)()
+
+    async def close_backend(self, backend):
+        pass
+
+    def test_count_users_not_connections(self):
+        async def test(backend):
+            self.assertEqual(await backend.connect(1, 10, "a"), 1)
+            self.assertEqual(await backend.connect(1, 10, "b"), 1)
+            self.assertEqual(await backend.connect(1, 11, "c"), 2)
+            self.assertEqual(await backend.disconnect(1, 10, "a"), 2)
+            self.assertEqual(await backend.disconnect(1, 10, "b"), 1)
+            self.assertEqual(await backend.count(1), 1)
+            self.assertEqual(await backend.count(2), 0)
+
+        self.run_with_backend(test)
+
+    def test_count_drops_expired_connections(self):
+        async def test(backend):
+            await backend.connect(1, 10, "a")
+            # 另一个（已经崩溃的）worker留下的过期连接
+            await backend._add(1, 11, "crashed", time.time() - 1)
+            self.assertEqual(await backend.count(1), 1)
+
+        self.run_with_backend(test)
+
+
+class InMemoryPresenceBackendTests(PresenceBackendTestsMixin, SimpleTestCase):
+
+    def make_backend(self):
+        return InMemoryPresenceBackend()
+
+    def test_base_backend_is_abstract(self):
+        with self.assertRaises(TypeError):
+            BasePresenceBackend()
+
+
+@unittest.skipUnless(redis_available(), "Redis is not available")
+class RedisPresenceBackendTests(PresenceBackendTestsMixin, SimpleTestCase):
+
+    def make_backend(self):
+        return RedisPresenceBackend(hosts=[REDIS_HOST], prefix=f"test-presence-{uuid.uuid4().hex}")
+
+    async def close_backend(self, backend):
+        redis = await backend._connection()
+        keys = await redis.keys(f"{backend.prefix}:*")
+        if keys:
+            await redis.delete(*keys)
+        redis.close()
+        await redis.wait_closed()
+
+
+class RoomCacheTests(TestCase):
+
+    def setUp(self):
+        consumers._rooms.clear()
+        self.room = PublicChatroom.objects.create(title="lobby")
+        self.fetches = 0
+
+    def tearDown(self):
+        consumers._rooms.clear()
+
+    def get(self, room_id):
+        # 在测试线程（测试的事务）中查询，协程中只返回结果
+        room = PublicChatroom.objects.filter(pk=room_id).first()
+
+        async def fetch(room_id):
+            self.fetches += 1
+            if room is None:
+                raise ClientError("ROOM_INVALID", "房间不存在")
+            return room
+
+        with mock.patch.object(consumers, "fetch_room_or_error", fetch):
+            return async_to_sync(consumers.get_room_or_error)(room_id)
+
+    def test_cached_until_saved(self):
+        self.assertEqual(self.get(self.room.pk).title, "lobby")
+        self.get(self.room.pk)
+        self.assertEqual(self.fetches, 1)
+
+        self.room.title = "hall"
+        self.room.save()
+        self.assertEqual(self.get(self.room.pk).title, "hall")
+        self.assertEqual(self.fetches, 2)
+
+    def test_deleted_room_is_evicted(self):
+        self.get(self.room.pk)
+        room_id = self.room.pk
+        self.room.delete()
+        with self.assertRaises(ClientError):
+            self.get(room_id)
+
+    @override_settings(PUBLIC_ROOM_CACHE_TIMEOUT=0)
+    def test_expired_entries_are_refetched(self):
+        self.get(self.room.pk)
+        self.get(self.room.pk)
+        self.assertEqual(self.fetches, 2)
+
+    @override_settings(PUBLIC_ROOM_CACHE_SIZE=1)
+    def test_cache_is_bounded(self):
+        other = PublicChatroom.objects.create(title="other")
+        self.get(self.room.pk)
+        self.get(other.pk)
+        self.assertEqual(list(consumers._rooms), [str(other.pk)])
@@ -0,0 +1,150 @@
+"""
+基准测试共用的工具：命令行入口、数据库、统计、结果比较
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from account.models import Account  # noqa: E402
+
+
+def run_benchmark(description, add_arguments, run, argv=None, versions=None):
+    """
+    基准测试脚本的入口：解析参数（--output / --baseline / --threshold 加上 add_arguments(parser) 添加的参数），
+    执行 run(args) 得到结果，写成JSON并输出到stderr；与 --baseline 比较，变慢超过阈值时返回1。
+    versions: 写入结果 meta 中的依赖版本
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", required=True, help="write the JSON results to this file")
+    parser.add_argument("--baseline", help="compare against a previous JSON result")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown reported as a regression (default 0.2)")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    report = {"meta": environment(args, **(versions or {})), "results": results}
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for name, metrics in sorted(results.items()):
+        print(f"{name}: {json.dumps(metrics, sort_keys=True)}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline["results"], results, args.threshold)
+        for line in regressions:
+            print("REGRESSION " + line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def reset_database():
+    name = settings.DATABASES["default"]["NAME"]
+    connection.close()
+    if os.path.exists(name):
+        os.remove(name)
+    call_command("migrate", verbosity=0)
+
+
+def create_users(prefix, count):
+    """
+    批量创建用户，不经过密码哈希（不需要登录）
+    """
+    password = make_password(None)
+    Account.objects.bulk_create(
+        [Account(email=f"{prefix}{i}@benchmark.local", username=f"{prefix}{i}", password=password)
+         for i in range(count)],
+        batch_size=500,
+    )
+    return list(Account.objects.filter(username__startswith=prefix).order_by("id"))
+
+
+def summarize(durations):
+    """
+    耗时（秒）的统计，单位毫秒
+    """
+    ms = sorted(d * 1000 for d in durations)
+    return {
+        "n": len(ms),
+        "mean": statistics.mean(ms),
+        "p50": percentile(ms, 0.50),
+        "p95": percentile(ms, 0.95),
+        "max": ms[-1],
+    }
+
+
+def percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def compare(baseline, results, threshold):
+    """
+    *_per_second 越大越好，*_ms 的 p50/p95 越小越好；返回变差超过 threshold 的指标
+    """
+    regressions = []
+    current = flatten(results)
+    for key, old in sorted(flatten(baseline).items()):
+        new = current.get(key)
+        if new is None or not old:
+            continue
+        if "_per_second" in key:
+            change = (old - new) / old
+        elif "_ms." in key and key.rsplit(".", 1)[-1] in ("p50", "p95"):
+            change = (new - old) / old
+        else:
+            continue
+        if change > threshold:
+            regressions.append(f"{key}: {old:.3f} -> {new:.3f} ({change:+.0%})")
+    return regressions
+
+
+def flatten(data, prefix=""):
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def environment(args, **versions):
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=settings.BASE_DIR,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True,
+        ).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        "created": timezone.now().isoformat(),
+        "git_revision": revision,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "django": django.get_version(),
+        "sqlite": sqlite3.sqlite_version,
+        **versions,
+        "arguments": {k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+    }
@@ -0,0 +1,286 @@
+"""
+WebSocket consumer 基准测试
+
+通过 channels.testing.WebsocketCommunicator 直接驱动 PublicChatConsumer 和 ChatConsumer，
+使用 InMemoryChannelLayer 和 SQLite（见 benchmarks.settings），测量：
+
+- send 的广播吞吐量：公共聊天室 1 / 100 / 1000 个成员，私聊 2 个成员
+- join / leave 的耗时（leave 通过断开连接触发，与浏览器关闭页面相同）
+- 房间已有 1万 / 10万 / 100万 条消息时获取一页聊天记录的耗时（最新一页和中间的一页）
+
+结果写成JSON，可以与之前的结果比较，变慢超过阈值时退出码为1：
+
+    python -m benchmarks.consumers --output before.json
+    python -m benchmarks.consumers --output after.json --baseline before.json
+
+每次运行都会重建基准测试数据库（BENCHMARK_DB，默认在系统临时目录）。
+"""
+import asyncio
+import datetime
+import sys
+import time
+
+# benchmarks.common 导入时完成 django.setup()，之后才能导入模型和consumer
+from benchmarks.common import create_users, reset_database, run_benchmark, summarize
+
+import channels  # noqa: E402
+from channels.db import database_sync_to_async  # noqa: E402
+from channels.testing import WebsocketCommunicator  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from account.models import Account  # noqa: E402
+from chat.consumers import ChatConsumer, private_message_buffer  # noqa: E402
+from chat.models import ChatroomMessage  # noqa: E402
+from chat.utils import find_or_create_private_chat  # noqa: E402
+from friend.models import FriendList  # noqa: E402
+from public_chat.consumers import PublicChatConsumer, public_message_buffer  # noqa: E402
+from public_chat.models import PublicChatroom, PublicChatroomMessage  # noqa: E402
+
+# 单条消息的最长等待时间（秒），1000个成员时一次广播要排队处理很久
+RECEIVE_TIMEOUT = 60
+FILL_BATCH_SIZE = 10000
+
+
+def main(argv=None):
+    return run_benchmark("Benchmark the chat WebSocket consumers.", add_arguments, run_all, argv,
+                         versions={"channels": channels.__version__})
+
+
+def add_arguments(parser):
+    parser.add_argument("--members", type=int, nargs="+", default=[1, 100, 1000],
+                        help="public room sizes for the fan-out benchmark")
+    parser.add_argument("--messages", type=int, default=50, help="messages sent per fan-out run")
+    parser.add_argument("--history-sizes", type=int, nargs="*", default=[10000, 100000, 1000000],
+                        help="stored messages per room for the history benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="history page fetches per measurement")
+
+
+def run_all(args):
+    reset_database()
+    return asyncio.get_event_loop().run_until_complete(run(args))
+
+
+async def run(args):
+    results = {}
+    for members in args.members:
+        results[f"public_chat.fanout.members_{members}"] = await bench_public_fanout(members, args.messages)
+    results["chat.fanout.members_2"] = await bench_private_fanout(args.messages)
+    # 填充历史消息之前先写完缓冲中的消息，统计的消息数才准确
+    await public_message_buffer.flush()
+    await private_message_buffer.flush()
+    if args.history_sizes:
+        results.update(await bench_public_history(sorted(args.history_sizes), args.repeat))
+        results.update(await bench_private_history(sorted(args.history_sizes), args.repeat))
+    return results
+
+
+async def bench_public_fanout(members, messages):
+    room, users = await create_public_room(f"benchmark fan-out {members}", f"fan{members}_", members)
+
+    sockets, join = [], []
+    for user in users:
+        communicator = await open_socket(PublicChatConsumer, f"/public_chat/{room.id}/", user)
+        start = time.perf_counter()
+        await communicator.send_json_to({"command": "join", "room_id": room.id})
+        await receive_until(communicator, lambda m: "join" in m)
+        join.append(time.perf_counter() - start)
+        sockets.append(communicator)
+
+    send_per_second, frames_per_second = await measure_fanout(sockets, room.id, messages, f"public {members} ")
+    leave = await close_sockets(sockets)
+    return {
+        "members": members,
+        "messages": messages,
+        "send_per_second": send_per_second,
+        "frames_per_second": frames_per_second,
+        "join_ms": summarize(join),
+        "leave_ms": summarize(leave),
+    }
+
+
+async def bench_private_fanout(messages):
+    user1, user2, room = await create_private_room("fanout")
+
+    sockets, join = [], []
+    for user in (user1, user2):
+        communicator = await open_socket(ChatConsumer, f"/chat/{room.id}/", user)
+        start = time.perf_counter()
+        await communicator.send_json_to({"command": "join", "room_id": room.id})
+        await receive_until(communicator, lambda m: "join" in m)
+        join.append(time.perf_counter() - start)
+        sockets.append(communicator)
+
+    send_per_second, frames_per_second = await measure_fanout(sockets, room.id, messages, "private ")
+    leave = await close_sockets(sockets)
+    return {
+        "members": 2,
+        "messages": messages,
+        "send_per_second": send_per_second,
+        "frames_per_second": frames_per_second,
+        "join_ms": summarize(join),
+        "leave_ms": summarize(leave),
+    }
+
+
+async def measure_fanout(sockets, room_id, messages, tag):
+    """
+    第一个连接发送 messages 条消息，直到所有连接都收到全部消息为止
+    返回 (每秒发送的消息数, 每秒送达的帧数)
+    """
+    start = time.perf_counter()
+    for i in range(messages):
+        await sockets[0].send_json_to({"command": "send", "room_id": room_id, "message": f"{tag}{i}"})
+    for communicator in sockets:
+        for _ in range(messages):
+            await receive_until(communicator, lambda m: str(m.get("message", "")).startswith(tag))
+    elapsed = time.perf_counter() - start
+    return messages / elapsed, messages * len(sockets) / elapsed
+
+
+async def bench_public_history(sizes, repeat):
+    room, users = await create_public_room("benchmark history", "history_", 10)
+    communicator = await open_socket(PublicChatConsumer, f"/public_chat/{room.id}/", users[0])
+    await communicator.send_json_to({"command": "join", "room_id": room.id})
+    await receive_until(communicator, lambda m: "join" in m)
+
+    results = {}
+    stored = 0
+    for size in sizes:
+        stored = await fill_messages(PublicChatroomMessage, room, users, stored, size)
+        results[f"public_chat.history.messages_{size}"] = await measure_history(
+            communicator, PublicChatroomMessage, room, repeat)
+    await communicator.disconnect()
+    return results
+
+
+async def bench_private_history(sizes, repeat):
+    user1, user2, room = await create_private_room("history")
+    communicator = await open_socket(ChatConsumer, f"/chat/{room.id}/", user1)
+    await communicator.send_json_to({"command": "join", "room_id": room.id})
+    await receive_until(communicator, lambda m: "join" in m)
+
+    results = {}
+    stored = 0
+    for size in sizes:
+        stored = await fill_messages(ChatroomMessage, room, [user1, user2], stored, size)
+        results[f"chat.history.messages_{size}"] = await measure_history(communicator, ChatroomMessage, room, repeat)
+    await communicator.disconnect()
+    return results
+
+
+async def measure_history(communicator, model, room, repeat):
+    """
+    最新一页（没有游标）和位于房间中间的一页，各请求 repeat 次
+    """
+    stored, middle = await count_messages(model, room)
+    newest, middle_page = [], []
+    for _ in range(repeat):
+        newest.append(await fetch_history(communicator, room.id, None))
+        middle_page.append(await fetch_history(communicator, room.id, str(middle)))
+    return {
+        "stored_messages": stored,
+        "newest_page_ms": summarize(newest),
+        "middle_page_ms": summarize(middle_page),
+    }
+
+
+async def fetch_history(communicator, room_id, before_msg_id):
+    start = time.perf_counter()
+    await communicator.send_json_to({
+        "command": "get_room_chat_history",
+        "room_id": room_id,
+        "before_msg_id": before_msg_id,
+    })
+    payload = await receive_until(communicator, lambda m: "messages_payload" in m)
+    elapsed = time.perf_counter() - start
+    if not payload["messages"]:
+        raise RuntimeError("history benchmark received an empty page")
+    await receive_until(communicator, lambda m: m.get("display_progress_bar") is False)
+    return elapsed
+
+
+async def open_socket(consumer, path, user):
+    communicator = WebsocketCommunicator(consumer, path)
+    communicator.scope["user"] = user
+    connected, _ = await communicator.connect()
+    if not connected:
+        raise RuntimeError(f"{consumer.__name__} refused the connection")
+    return communicator
+
+
+async def receive_until(communicator, predicate):
+    """
+    丢弃不相关的帧（在线人数、进入聊天等），返回第一个满足条件的帧
+    """
+    while True:
+        message = await communicator.receive_json_from(timeout=RECEIVE_TIMEOUT)
+        if "error" in message:
+            raise RuntimeError(f"consumer returned an error: {message}")
+        if predicate(message):
+            return message
+
+
+async def close_sockets(sockets):
+    durations = []
+    for communicator in sockets:
+        start = time.perf_counter()
+        await communicator.disconnect()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+@database_sync_to_async
+def create_public_room(title, prefix, members):
+    """
+    公共聊天室和 members 个用户。
+    基准测试数据的准备都在线程中执行，不阻塞事件循环中的consumer
+    """
+    return PublicChatroom.objects.create(title=title), create_users(prefix, members)
+
+
+@database_sync_to_async
+def create_private_room(prefix):
+    """
+    两个好友和他们的私聊。
+    在线程中执行：添加好友时会通过 async_to_sync 推送通知，不能在事件循环所在的线程中调用
+    """
+    # create_user 会触发 post_save 创建 FriendList
+    user1 = Account.objects.create_user(f"{prefix}_a@benchmark.local", f"{prefix}_a", "password")
+    user2 = Account.objects.create_user(f"{prefix}_b@benchmark.local", f"{prefix}_b", "password")
+    FriendList.objects.get(user=user1).add_friend(user2)
+    FriendList.objects.get(user=user2).add_friend(user1)
+    return user1, user2, find_or_create_private_chat(user1, user2)
+
+
+@database_sync_to_async
+def count_messages(model, room):
+    """
+    返回 (房间的消息数, 位于房间中间的消息id)
+    """
+    ids = model.objects.filter(room=room).order_by("id").values_list("id", flat=True)
+    stored = ids.count()
+    return stored, ids[stored // 2]
+
+
+@database_sync_to_async
+def fill_messages(model, room, users, stored, target):
+    """
+    把房间的消息补充到 target 条，时间戳按秒递增，返回当前消息数
+    """
+    start_time = timezone.now() - datetime.timedelta(days=30)
+    for batch_start in range(stored, target, FILL_BATCH_SIZE):
+        batch_end = min(batch_start + FILL_BATCH_SIZE, target)
+        model.objects.bulk_create([
+            model(
+                room=room,
+                user=users[i % len(users)],
+                content=f"history message {i}",
+                timestamp=start_time + datetime.timedelta(seconds=i),
+            )
+            for i in range(batch_start, batch_end)
+        ])
+    return max(stored, target)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+好友推荐（friend.recommendations）基准测试
+
+- 10万 / 100万 用户的随机社交图（按社区聚集，平均好友数 --degree）：
+  构建CSR邻接表的速度，批量计算前K个推荐的速度（用户数太多时只计算前 --sample 个用户，按速度推算全量耗时）
+- 数据库中 --db-users 个用户：全量重建（读取邻接表 + 计算 + 写入）的速度，
+  增加一个好友后增量更新（refresh_after_change）的耗时
+
+结果格式与 benchmarks.consumers 相同，可以用 --baseline 比较：
+
+    python -m benchmarks.friends --output before.json
+    python -m benchmarks.friends --output after.json --baseline before.json
+"""
+import sys
+import time
+
+import numpy as np
+
+# benchmarks.common 导入时完成 django.setup()，之后才能导入模型
+from benchmarks.common import create_users, reset_database, run_benchmark, summarize
+
+from friend.models import FriendList  # noqa: E402
+from friend.recommendations import (  # noqa: E402
+    FriendGraph, WRITE_BATCH_SIZE, get_suggestion_count, rebuild_suggestions, refresh_after_change,
+)
+
+# 随机图中每个社区的人数，以及好友在同一社区内的比例
+COMMUNITY_SIZE = 200
+LOCAL_RATIO = 0.8
+
+
+def main(argv=None):
+    return run_benchmark("Benchmark the friend suggestion engine.", add_arguments, run, argv,
+                         versions={"numpy": np.__version__})
+
+
+def add_arguments(parser):
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100000, 1000000],
+                        help="users in the in-memory graph benchmark")
+    parser.add_argument("--degree", type=int, default=20, help="average friends per user")
+    parser.add_argument("--sample", type=int, default=100000,
+                        help="users whose suggestions are computed per size (the rest is extrapolated)")
+    parser.add_argument("--db-users", type=int, default=10000, help="users stored in the database benchmark")
+    parser.add_argument("--refreshes", type=int, default=50, help="incremental refreshes to measure")
+    parser.add_argument("--seed", type=int, default=1)
+
+
+def run(args):
+    rng = np.random.default_rng(args.seed)
+    k = get_suggestion_count()
+    results = {}
+    for size in args.sizes:
+        results[f"friend.suggestions.users_{size}"] = bench_graph(rng, size, args.degree, args.sample, k)
+    if args.db_users:
+        reset_database()
+        results[f"friend.suggestions.db_users_{args.db_users}"] = bench_database(
+            rng, args.db_users, args.degree, args.refreshes)
+    return results
+
+
+def bench_graph(rng, users, degree, sample, k):
+    sources, targets = random_friendships(rng, users, degree)
+
+    start = time.perf_counter()
+    graph = FriendGraph.from_edges(sources + 1, targets + 1)
+    build = time.perf_counter() - start
+
+    rows = min(sample, len(graph.user_ids))
+    durations, suggestions = [], 0
+    for batch_start, batch_stop in graph.batches():
+        if batch_start >= rows:
+            break
+        start = time.perf_counter()
+        users_batch, _, _ = graph.top_suggestions(np.arange(batch_start, min(batch_stop, rows)), k)
+        durations.append(time.perf_counter() - start)
+        suggestions += len(users_batch)
+    users_per_second = rows / sum(durations)
+
+    return {
+        "users": users,
+        "edges": len(sources),
+        "csr_mb": (graph.indptr.nbytes + graph.indices.nbytes + graph.user_ids.nbytes) / 2 ** 20,
+        "build_edges_per_second": len(sources) / build,
+        "computed_users": rows,
+        "suggestions": suggestions,
+        "batch_ms": summarize(durations),
+        "users_per_second": users_per_second,
+        "estimated_full_seconds": len(graph.user_ids) / users_per_second,
+    }
+
+
+def bench_database(rng, users, degree, refreshes):
+    accounts = create_users("friend_", users)
+    FriendList.objects.bulk_create([FriendList(user=account) for account in accounts], batch_size=WRITE_BATCH_SIZE)
+    friend_lists = dict(FriendList.objects.values_list("user_id", "id"))
+    user_ids = np.array([account.id for account in accounts], dtype=np.int64)
+
+    sources, targets = random_friendships(rng, users, degree)
+    through = FriendList.friends.through
+    through.objects.bulk_create([
+        through(friendlist_id=friend_lists[int(user_ids[a])], account_id=int(user_ids[b]))
+        for a, b in zip(sources, targets)
+    ], batch_size=WRITE_BATCH_SIZE)
+
+    start = time.perf_counter()
+    rebuild_suggestions()
+    rebuild = time.perf_counter() - start
+
+    # 新增好友关系（双向）之后的两次增量更新，与 FriendList.add_friend 相同
+    durations = []
+    for a, b in rng.integers(0, users, size=(refreshes, 2)):
+        if a == b:
+            continue
+        user, friend = int(user_ids[a]), int(user_ids[b])
+        through.objects.get_or_create(friendlist_id=friend_lists[user], account_id=friend)
+        through.objects.get_or_create(friendlist_id=friend_lists[friend], account_id=user)
+        start = time.perf_counter()
+        refresh_after_change(user, friend)
+        refresh_after_change(friend, user)
+        durations.append(time.perf_counter() - start)
+
+    return {
+        "users": users,
+        "edges": len(sources),
+        "rebuild_users_per_second": users / rebuild,
+        "refresh_ms": summarize(durations),
+    }
+
+
+def random_friendships(rng, users, degree):
+    """
+    平均 degree 个好友的随机无向图（大部分好友在同一个社区内），返回双向的 (行号, 行号) 数组
+    """
+    count = users * degree // 2
+    a = rng.integers(0, users, count)
+    local = rng.random(count) < LOCAL_RATIO
+    neighbour = np.minimum(a // COMMUNITY_SIZE * COMMUNITY_SIZE + rng.integers(0, COMMUNITY_SIZE, count), users - 1)
+    b = np.where(local, neighbour, rng.integers(0, users, count))
+    a, b = a[a != b], b[a != b]
+    pairs = np.unique(np.minimum(a, b) * users + np.maximum(a, b))
+    a, b = pairs // users, pairs % users
+    return np.concatenate([a, b]), np.concatenate([b, a])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
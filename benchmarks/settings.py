@@ -0,0 +1,31 @@
+"""
+基准测试使用的配置：SQLite + InMemoryChannelLayer + 内存presence，不依赖PostgreSQL和Redis
+"""
+import tempfile
+
+from Chat.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        # 必须是文件：database_sync_to_async 在线程池中执行，内存数据库无法跨线程共享
+        'NAME': os.environ.get('BENCHMARK_DB', os.path.join(tempfile.gettempdir(), 'chat_benchmark.sqlite3')),
+    }
+}
+
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        # 默认每个channel只能排队100条，超过的group_send会被直接丢弃
+        'CONFIG': {'capacity': 100000},
+    },
+}
+
+PRESENCE = {
+    'BACKEND': 'public_chat.presence.InMemoryPresenceBackend',
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+for _logger in LOGGING['loggers'].values():
+    _logger['level'] = 'WARNING'
@@ -0,0 +1,233 @@
+"use strict";
+
+var Shim = require("./shim");
+var Dict = require("./_dict");
+var List = require("./_list");
+var GenericCollection = require("./generic-collection");
+var GenericSet = require("./generic-set");
+var TreeLog = require("./tree-log");
+
+var object_has = Object.prototype.hasOwnProperty;
+
+module.exports = FastSet;
+
+function FastSet(values, equals, hash, getDefault) {
+    if (!(this instanceof FastSet)) {
+        return new FastSet(values, equals, hash, getDefault);
+    }
+    equals = equals || Object.equals;
+    hash = hash || Object.hash;
+    getDefault = getDefault || Function.noop;
+    this.contentEquals = equals;
+    this.contentHash = hash;
+    this.getDefault = getDefault;
+    var self = this;
+    this.buckets = new this.Buckets(null, function getDefaultBucket() {
+        return new self.Bucket();
+    });
+    this.length = 0;
+    this.addEach(values);
+}
+
+FastSet.FastSet = FastSet; // hack so require("fast-set").FastSet will work in MontageJS
+
+Object.addEach(FastSet.prototype, GenericCollection.prototype);
+Object.addEach(FastSet.prototype, GenericSet.prototype);
+FastSet.from = GenericCollection.from;
+
+FastSet.prototype.Buckets = Dict;
+FastSet.prototype.Bucket = List;
+
+FastSet.prototype.constructClone = function (values) {
+    return new this.constructor(
+        values,
+        this.contentEquals,
+        this.contentHash,
+        this.getDefault
+    );
+};
+
+FastSet.prototype.has = function (value) {
+    var hash = this.contentHash(value);
+    return this.buckets.get(hash).has(value);
+};
+
+FastSet.prototype.get = function (value, equals) {
+    if (equals) {
+        throw new Error("FastSet#get does not support second argument: equals");
+    }
+    var hash = this.contentHash(value);
+    var buckets = this.buckets;
+    if (buckets.has(hash)) {
+        return buckets.get(hash).get(value);
+    } else {
+        return this.getDefault(value);
+    }
+};
+
+FastSet.prototype["delete"] = function (value, equals) {
+    if (equals) {
+        throw new Error("FastSet#delete does not support second argument: equals");
+    }
+    var hash = this.contentHash(value);
+    var buckets = this.buckets;
+    if (buckets.has(hash)) {
+        var bucket = buckets.get(hash);
+        if (bucket["delete"](value)) {
+            this.length--;
+            if (bucket.length === 0) {
+                buckets["delete"](hash);
+            }
+            return true;
+        }
+    }
+    return false;
+};
+
+FastSet.prototype.clear = function () {
+    this.buckets.clear();
+    this.length = 0;
+};
+
+FastSet.prototype.add = function (value) {
+    var hash = this.contentHash(value);
+    var buckets = this.buckets;
+    if (!buckets.has(hash)) {
+        buckets.set(hash, new this.Bucket(null, this.contentEquals));
+    }
+    if (!buckets.get(hash).has(value)) {
+        buckets.get(hash).add(value);
+        this.length++;
+        return true;
+    }
+    return false;
+};
+
+FastSet.prototype.reduce = function (callback, basis /*, thisp*/) {
+    var thisp = arguments[2];
+    var buckets = this.buckets;
+    var index = 0;
+    return buckets.reduce(function (basis, bucket) {
+        return bucket.reduce(function (basis, value) {
+            return callback.call(thisp, basis, value, index++, this);
+        }, basis, this);
+    }, basis, this);
+};
+
+FastSet.prototype.one = function () {
+    if (this.length > 0) {
+        return this.buckets.one().one();
+    }
+};
+
+FastSet.prototype.iterate = function () {
+    return this.buckets.valuesArray().flatten().iterate();
+};
+
+FastSet.prototype.log = function (charmap, logNode, callback, thisp) {
+    charmap = charmap || TreeLog.unicodeSharp;
+    logNode = logNode || this.logNode;
+    if (!callback) {
+        callback = console.log;
+        thisp = console;
+    }
+    callback = callback.bind(thisp);
+
+    var buckets = this.buckets, bucketsSize = buckets.size,
+        mapIter = buckets.keys(), hash, index = 0,
+        branch, leader, bucket;
+
+    while (hash = mapIter.next().value) {
+        if (index === bucketsSize - 1) {
+            branch = charmap.fromAbove;
+            leader = ' ';
+        } else if (index === 0) {
+            branch = charmap.branchDown;
+            leader = charmap.strafe;
+        } else {
+            branch = charmap.fromBoth;
+            leader = charmap.strafe;
+        }
+        bucket = buckets.get(hash);
+        callback.call(thisp, branch + charmap.through + charmap.branchDown + ' ' + hash);
+        bucket.forEach(function (value, node) {
+            var branch, below, written;
+            if (node === bucket.head.prev) {
+                branch = charmap.fromAbove;
+                below = ' ';
+            } else {
+                branch = charmap.fromBoth;
+                below = charmap.strafe;
+            }
+            logNode(
+                node,
+                function (line) {
+                    if (!written) {
+                        callback.call(thisp, leader + ' ' + branch + charmap.through + charmap.through + line);
+                        written = true;
+                    } else {
+                        callback.call(thisp, leader + ' ' + below + '  ' + line);
+                    }
+                },
+                function (line) {
+                    callback.call(thisp, leader + ' ' + charmap.strafe + '  ' + line);
+                }
+            );
+        });
+        index++;
+    }
+
+    //var hashes = buckets.keysArray();
+    // hashes.forEach(function (hash, index) {
+    //     var branch;
+    //     var leader;
+    //     if (index === hashes.length - 1) {
+    //         branch = charmap.fromAbove;
+    //         leader = ' ';
+    //     } else if (index === 0) {
+    //         branch = charmap.branchDown;
+    //         leader = charmap.strafe;
+    //     } else {
+    //         branch = charmap.fromBoth;
+    //         leader = charmap.strafe;
+    //     }
+    //     var bucket = buckets.get(hash);
+    //     callback.call(thisp, branch + charmap.through + charmap.branchDown + ' ' + hash);
+    //     bucket.forEach(function (value, node) {
+    //         var branch, below;
+    //         if (node === bucket.head.prev) {
+    //             branch = charmap.fromAbove;
+    //             below = ' ';
+    //         } else {
+    //             branch = charmap.fromBoth;
+    //             below = charmap.strafe;
+    //         }
+    //         var written;
+    //         logNode(
+    //             node,
+    //             function (line) {
+    //                 if (!written) {
+    //                     callback.call(thisp, leader + ' ' + branch + charmap.through + charmap.through + line);
+    //                     written = true;
+    //                 } else {
+    //                     callback.call(thisp, leader + ' ' + below + '  ' + line);
+    //                 }
+    //             },
+    //             function (line) {
+    //                 callback.call(thisp, leader + ' ' + charmap.strafe + '  ' + line);
+    //             }
+    //         );
+    //     });
+    // });
+};
+
+FastSet.prototype.logNode = function (node, write) {
+    var value = node.value;
+    if (Object(value) === value) {
+        JSON.stringify(value, null, 4).split("\n").forEach(function (line) {
+            write(" " + line);
+        });
+    } else {
+        write(" " + value);
+    }
+};
@@ -0,0 +1,394 @@
+"use strict";
+
+module.exports = List;
+
+var Shim = require("./shim");
+var GenericCollection = require("./generic-collection");
+var GenericOrder = require("./generic-order");
+
+function List(values, equals, getDefault) {
+    return List._init(List, this, values, equals, getDefault);
+}
+
+List._init = function (constructor, object, values, equals, getDefault) {
+    if (!(object instanceof constructor)) {
+        return new constructor(values, equals, getDefault);
+    }
+    var head = object.head = new object.Node();
+    head.next = head;
+    head.prev = head;
+    object.contentEquals = equals || Object.equals;
+    object.getDefault = getDefault || Function.noop;
+    object.length = 0;
+    object.addEach(values);
+}
+
+List.List = List; // hack so require("list").List will work in MontageJS
+
+Object.addEach(List.prototype, GenericCollection.prototype);
+Object.addEach(List.prototype, GenericOrder.prototype);
+
+List.from = GenericCollection.from;
+
+List.prototype.constructClone = function (values) {
+    return new this.constructor(values, this.contentEquals, this.getDefault);
+};
+
+List.prototype.find = function (value, equals, index) {
+    equals = equals || this.contentEquals;
+    var head = this.head;
+    var at = this.scan(index, head.next);
+    while (at !== head) {
+        if (equals(at.value, value)) {
+            return at;
+        }
+        at = at.next;
+    }
+};
+
+List.prototype.findLast = function (value, equals, index) {
+    equals = equals || this.contentEquals;
+    var head = this.head;
+    var at = this.scan(index, head.prev);
+    while (at !== head) {
+        if (equals(at.value, value)) {
+            return at;
+        }
+        at = at.prev;
+    }
+};
+
+List.prototype.has = function (value, equals) {
+    return !!this.find(value, equals);
+};
+
+List.prototype.get = function (value, equals) {
+    var found = this.find(value, equals);
+    if (found) {
+        return found.value;
+    }
+    return this.getDefault(value);
+};
+
+// LIFO (delete removes the most recently added equivalent value)
+List.prototype["delete"] = function (value, equals) {
+    var found = this.findLast(value, equals);
+    if (found) {
+        found["delete"]();
+        this.length--;
+        return true;
+    }
+    return false;
+};
+
+List.prototype.deleteAll = function (value, equals) {
+    equals = equals || this.contentEquals;
+    var head = this.head;
+    var at = head.next;
+    var count = 0;
+    while (at !== head) {
+        if (equals(value, at.value)) {
+            at["delete"]();
+            count++;
+        }
+        at = at.next;
+    }
+    this.length -= count;
+    return count;
+};
+
+List.prototype.clear = function () {
+    this.head.next = this.head.prev = this.head;
+    this.length = 0;
+};
+
+List.prototype.add = function (value) {
+    var node = new this.Node(value)
+    return this._addNode(node);
+};
+
+List.prototype._addNode = function (node) {
+    this.head.addBefore(node);
+    this.length++;
+    return true;
+};
+
+List.prototype.push = function () {
+    var head = this.head;
+    for (var i = 0; i < arguments.length; i++) {
+        var value = arguments[i];
+        var node = new this.Node(value);
+        head.addBefore(node);
+    }
+    this.length += arguments.length;
+};
+
+List.prototype.unshift = function () {
+    var at = this.head;
+    for (var i = 0; i < arguments.length; i++) {
+        var value = arguments[i];
+        var node = new this.Node(value);
+        at.addAfter(node);
+        at = node;
+    }
+    this.length += arguments.length;
+};
+
+List.prototype._shouldPop = function () {
+    var value;
+    var head = this.head;
+    if (head.prev !== head) {
+        value = head.prev.value;
+    }
+    return value;
+}
+
+List.prototype.pop = function (_before, _after) {
+    var value;
+    var head = this.head;
+    if (head.prev !== head) {
+        value = head.prev.value;
+        var index = this.length - 1;
+        var popDispatchValueArray = _before ? _before.call(this,value,index) : void 0;
+        head.prev['delete']();
+        this.length--;
+        _after ? _after.call(this,value,index, popDispatchValueArray) : void 0;
+    }
+    return value;
+};
+
+List.prototype.shift = function (_before, _after) {
+    var value;
+    var head = this.head;
+    if (head.prev !== head) {
+        value = head.next.value;
+        var dispatchValueArray = _before ? _before.call(this,value,0) : void 0;
+        head.next['delete']();
+        this.length--;
+        _after ? _after.call(this,value,0,dispatchValueArray) : void 0;
+    }
+    return value;
+};
+
+List.prototype.peek = function () {
+    if (this.head !== this.head.next) {
+        return this.head.next.value;
+    }
+};
+
+List.prototype.poke = function (value) {
+    if (this.head !== this.head.next) {
+        this.head.next.value = value;
+    } else {
+        this.push(value);
+    }
+};
+
+List.prototype.one = function () {
+    return this.peek();
+};
+
+// TODO
+// List.prototype.indexOf = function (value) {
+// };
+
+// TODO
+// List.prototype.lastIndexOf = function (value) {
+// };
+
+// an internal utility for coercing index offsets to nodes
+List.prototype.scan = function (at, fallback) {
+    var head = this.head;
+    if (typeof at === "number") {
+        var count = at;
+        if (count >= 0) {
+            at = head.next;
+            while (count) {
+                count--;
+                at = at.next;
+                if (at == head) {
+                    break;
+                }
+            }
+        } else {
+            at = head;
+            while (count < 0) {
+                count++;
+                at = at.prev;
+                if (at == head) {
+                    break;
+                }
+            }
+        }
+        return at;
+    } else {
+        return at || fallback;
+    }
+};
+
+// at and end may both be positive or negative numbers (in which cases they
+// correspond to numeric indicies, or nodes)
+List.prototype.slice = function (at, end) {
+    var sliced = [];
+    var head = this.head;
+    at = this.scan(at, head.next);
+    end = this.scan(end, head);
+
+    while (at !== end && at !== head) {
+        sliced.push(at.value);
+        at = at.next;
+    }
+
+    return sliced;
+};
+
+List.prototype.splice = function (at, length /*...plus*/) {
+    return this.swap(at, length, Array.prototype.slice.call(arguments, 2));
+};
+
+List.prototype.swap = function (start, length, plus, _before, _after) {
+    var initial = start;
+    // start will be head if start is null or -1 (meaning from the end), but
+    // will be head.next if start is 0 (meaning from the beginning)
+    start = this.scan(start, this.head);
+    if (length == null) {
+        length = Infinity;
+    }
+    plus = Array.from(plus);
+
+    // collect the minus array
+    var minus = [];
+    var at = start;
+    while (length-- && length >= 0 && at !== this.head) {
+        minus.push(at.value);
+        at = at.next;
+    }
+
+    // before range change
+    var index, startNode;
+    index = _before ? _before.call(this, start, plus, minus) : void 0;
+
+    // delete minus
+    var at = start;
+    for (var i = 0, at = start; i < minus.length; i++, at = at.next) {
+        at["delete"]();
+    }
+    // add plus
+    if (initial == null && at === this.head) {
+        at = this.head.next;
+    }
+    for (var i = 0; i < plus.length; i++) {
+        var node = new this.Node(plus[i]);
+        at.addBefore(node);
+    }
+    // adjust length
+    this.length += plus.length - minus.length;
+
+    _after ? _after.call(this, start, plus, minus) : void 0;
+
+    return minus;
+};
+
+List.prototype.reverse = function () {
+    var at = this.head;
+    do {
+        var temp = at.next;
+        at.next = at.prev;
+        at.prev = temp;
+        at = at.next;
+    } while (at !== this.head);
+    return this;
+};
+
+List.prototype.sort = function () {
+    this.swap(0, this.length, this.sorted.apply(this, arguments));
+};
+
+// TODO account for missing basis argument
+List.prototype.reduce = function (callback, basis /*, thisp*/) {
+    var thisp = arguments[2];
+    var head = this.head;
+    var at = head.next;
+    while (at !== head) {
+        basis = callback.call(thisp, basis, at.value, at, this);
+        at = at.next;
+    }
+    return basis;
+};
+
+List.prototype.reduceRight = function (callback, basis /*, thisp*/) {
+    var thisp = arguments[2];
+    var head = this.head;
+    var at = head.prev;
+    while (at !== head) {
+        basis = callback.call(thisp, basis, at.value, at, this);
+        at = at.prev;
+    }
+    return basis;
+};
+
+List.prototype.updateIndexes = function (node, index) {
+    while (node !== this.head) {
+        node.index = index++;
+        node = node.next;
+    }
+};
+
+
+List.prototype.iterate = function () {
+    return new ListIterator(this.head);
+};
+
+function ListIterator(head) {
+    this.head = head;
+    this.at = head.next;
+};
+
+ListIterator.prototype.__iterationObject = null;
+Object.defineProperty(ListIterator.prototype,"_iterationObject", {
+    get: function() {
+        return this.__iterationObject || (this.__iterationObject = { done: false, value:null});
+    }
+});
+
+
+ListIterator.prototype.next = function () {
+    if (this.at === this.head) {
+        this._iterationObject.done = true;
+        this._iterationObject.value = void 0;
+    } else {
+        var value = this.at.value;
+        this.at = this.at.next;
+        this._iterationObject.value = value;
+    }
+    return this._iterationObject;
+};
+
+List.prototype.Node = Node;
+
+function Node(value) {
+    this.value = value;
+    this.prev = null;
+    this.next = null;
+};
+
+Node.prototype["delete"] = function () {
+    this.prev.next = this.next;
+    this.next.prev = this.prev;
+};
+
+Node.prototype.addBefore = function (node) {
+    var prev = this.prev;
+    this.prev = node;
+    node.prev = prev;
+    prev.next = node;
+    node.next = this;
+};
+
+Node.prototype.addAfter = function (node) {
+    var next = this.next;
+    this.next = node;
+    node.next = next;
+    next.prev = node;
+    node.prev = this;
+};
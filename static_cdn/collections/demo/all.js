@@ -1,8 +0,0 @@
-require("./list-demo");
-require("./fast-map-demo");
-require("./fast-set-demo");
-require("./map-demo");
-require("./set-demo");
-require("./sorted-map-demo");
-require("./sorted-set-demo");
-require("./iterator-demo");
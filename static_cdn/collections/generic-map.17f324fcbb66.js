@@ -0,0 +1,211 @@
+"use strict";
+
+var Object = require("./shim-object");
+var Iterator = require("./iterator");
+
+module.exports = GenericMap;
+function GenericMap() {
+    throw new Error("Can't construct. GenericMap is a mixin.");
+}
+
+// all of these methods depend on the constructor providing a `store` set
+
+GenericMap.prototype.isMap = true;
+
+GenericMap.prototype.addEach = function (values) {
+    var i;
+    if (values && Object(values) === values) {
+        if (typeof values.forEach === "function") {
+            // copy map-alikes
+            if (values.isMap === true) {
+                values.forEach(function (value, key) {
+                    this.set(key, value);
+                }, this);
+            // iterate key value pairs of other iterables
+            } else {
+                values.forEach(function (pair) {
+                    this.set(pair[0], pair[1]);
+                }, this);
+            }
+        } else if (typeof values.length === "number") {
+            // Array-like objects that do not implement forEach, ergo,
+            // Arguments
+            for (i = 0; i < values.length; i++) {
+                this.add(values[i], i);
+            }
+        } else {
+            // copy other objects as map-alikes
+            Object.keys(values).forEach(function (key) {
+                this.set(key, values[key]);
+            }, this);
+        }
+    } else if (values && typeof values.length === "number") {
+        // String
+        for (i = 0; i < values.length; i++) {
+            this.add(values[i], i);
+        }
+    }
+    return this;
+};
+
+GenericMap.prototype.get = function (key, defaultValue) {
+    var item = this.store.get(new this.Item(key));
+    if (item) {
+        return item.value;
+    } else if (arguments.length > 1) {
+        console.log("Use of a second argument as default value is deprecated to match standards");
+        return defaultValue;
+    } else {
+        return this.getDefault(key);
+    }
+};
+
+GenericMap.prototype.set = function (key, value) {
+    var item = new this.Item(key, value);
+    var found = this.store.get(item);
+    var grew = false;
+    if (found) { // update
+        if (this.dispatchesMapChanges) {
+            this.dispatchBeforeMapChange(key, found.value);
+        }
+        found.value = value;
+        if (this.dispatchesMapChanges) {
+            this.dispatchMapChange(key, value);
+        }
+    } else { // create
+        if (this.dispatchesMapChanges) {
+            this.dispatchBeforeMapChange(key, undefined);
+        }
+        if (this.store.add(item)) {
+            this.length++;
+            grew = true;
+        }
+        if (this.dispatchesMapChanges) {
+            this.dispatchMapChange(key, value);
+        }
+    }
+    return this;
+};
+
+GenericMap.prototype.add = function (value, key) {
+    return this.set(key, value);
+};
+
+GenericMap.prototype.has = function (key) {
+    return this.store.has(new this.Item(key));
+};
+
+GenericMap.prototype['delete'] = function (key) {
+    var item = new this.Item(key);
+    if (this.store.has(item)) {
+        var from = this.store.get(item).value;
+        if (this.dispatchesMapChanges) {
+            this.dispatchBeforeMapChange(key, from);
+        }
+        this.store["delete"](item);
+        this.length--;
+        if (this.dispatchesMapChanges) {
+            this.dispatchMapChange(key, undefined);
+        }
+        return true;
+    }
+    return false;
+};
+
+GenericMap.prototype.clear = function () {
+    var keys, key;
+    if (this.dispatchesMapChanges) {
+        this.forEach(function (value, key) {
+            this.dispatchBeforeMapChange(key, value);
+        }, this);
+        keys = this.keysArray();
+    }
+    this.store.clear();
+    this.length = 0;
+    if (this.dispatchesMapChanges) {
+        for(var i=0;(key = keys[i]);i++) {
+            this.dispatchMapChange(key);
+        }
+        // keys.forEach(function (key) {
+        //     this.dispatchMapChange(key);
+        // }, this);
+    }
+};
+
+GenericMap.prototype.reduce = function (callback, basis, thisp) {
+    return this.store.reduce(function (basis, item) {
+        return callback.call(thisp, basis, item.value, item.key, this);
+    }, basis, this);
+};
+
+GenericMap.prototype.reduceRight = function (callback, basis, thisp) {
+    return this.store.reduceRight(function (basis, item) {
+        return callback.call(thisp, basis, item.value, item.key, this);
+    }, basis, this);
+};
+
+GenericMap.prototype.keysArray = function () {
+    return this.map(function (value, key) {
+        return key;
+    });
+};
+GenericMap.prototype.keys = function () {
+    return new Iterator(this.keysArray(), true);
+};
+
+GenericMap.prototype.valuesArray = function () {
+    return this.map(Function.identity);
+};
+GenericMap.prototype.values = function () {
+    return new Iterator(this.valuesArray(), true);
+};
+
+GenericMap.prototype.entriesArray = function () {
+    return this.map(function (value, key) {
+        return [key, value];
+    });
+};
+GenericMap.prototype.entries = function () {
+    return new Iterator(this.entriesArray(), true);
+};
+
+// XXX deprecated
+GenericMap.prototype.items = function () {
+    return this.entriesArray();
+};
+
+GenericMap.prototype.equals = function (that, equals) {
+    equals = equals || Object.equals;
+    if (this === that) {
+        return true;
+    } else if (that && typeof that.every === "function") {
+        return that.length === this.length && that.every(function (value, key) {
+            return equals(this.get(key), value);
+        }, this);
+    } else {
+        var keys = Object.keys(that);
+        return keys.length === this.length && Object.keys(that).every(function (key) {
+            return equals(this.get(key), that[key]);
+        }, this);
+    }
+};
+
+GenericMap.prototype.toJSON = function () {
+    return this.entriesArray();
+};
+
+
+GenericMap.prototype.Item = Item;
+
+function Item(key, value) {
+    this.key = key;
+    this.value = value;
+}
+
+Item.prototype.equals = function (that) {
+    return Object.equals(this.key, that.key) && Object.equals(this.value, that.value);
+};
+
+Item.prototype.compare = function (that) {
+    return Object.compare(this.key, that.key);
+};
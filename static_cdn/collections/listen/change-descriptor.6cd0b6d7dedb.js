@@ -0,0 +1,141 @@
+/*
+    Copyright (c) 2016, Montage Studio Inc. All Rights Reserved.
+    3-Clause BSD License
+    https://github.com/montagejs/montage/blob/master/LICENSE.md
+*/
+
+var Map = require("../_map");
+
+var ObjectChangeDescriptor = module.exports.ObjectChangeDescriptor = function ObjectChangeDescriptor(name) {
+    this.name = name;
+    this.isActive = false;
+    this._willChangeListeners = null;
+    this._changeListeners = null;
+	return this;
+}
+
+Object.defineProperties(ObjectChangeDescriptor.prototype,{
+    name: {
+		value:null,
+		writable: true
+	},
+    isActive: {
+		value:false,
+		writable: true
+	},
+	_willChangeListeners: {
+		value:null,
+		writable: true
+	},
+	willChangeListeners: {
+		get: function() {
+			return this._willChangeListeners || (this._willChangeListeners = new this.willChangeListenersRecordConstructor(this.name));
+		}
+	},
+	_changeListeners: {
+		value:null,
+		writable: true
+	},
+    changeListeners: {
+		get: function() {
+			return this._changeListeners || (this._changeListeners = new this.changeListenersRecordConstructor(this.name));
+		}
+	},
+    changeListenersRecordConstructor: {
+        value: ChangeListenersRecord,
+        writable: true
+    },
+    willChangeListenersRecordConstructor: {
+        value: WillChangeListenersRecord,
+        writable: true
+    }
+
+});
+
+var ListenerGhost = module.exports.ListenerGhost = Object.create(null);
+var ChangeListenerSpecificHandlerMethodName = new Map();
+
+ module.exports.ChangeListenersRecord = ChangeListenersRecord;
+function ChangeListenersRecord(name) {
+    var specificHandlerMethodName = ChangeListenerSpecificHandlerMethodName.get(name);
+    if(!specificHandlerMethodName) {
+        specificHandlerMethodName = "handle";
+        specificHandlerMethodName += name;
+        specificHandlerMethodName += "Change";
+        ChangeListenerSpecificHandlerMethodName.set(name,specificHandlerMethodName);
+    }
+    this._current = null;
+    this._current = null;
+    this.specificHandlerMethodName = specificHandlerMethodName;
+    return this;
+}
+
+Object.defineProperties(ChangeListenersRecord.prototype,{
+    _current: {
+		value: null,
+		writable: true
+	},
+	current: {
+		get: function() {
+            // if(this._current) {
+            //     console.log(this.constructor.name," with ",this._current.length," listeners: ", this._current);
+            // }
+            return this._current;
+            //return this._current || (this._current = []);
+		},
+        set: function(value) {
+            this._current = value;
+        }
+	},
+    ListenerGhost: {
+        value:ListenerGhost,
+        writable: true
+    },
+    ghostCount: {
+        value:0,
+        writable: true
+    },
+    maxListenerGhostRatio: {
+        value:0.3,
+        writable: true
+    },
+    listenerGhostFilter: {
+        value: function listenerGhostFilter(value) {
+          return value !== this.ListenerGhost;
+      }
+    },
+    removeCurrentGostListenersIfNeeded: {
+        value: function() {
+            if(this._current && this.ghostCount/this._current.length>this.maxListenerGhostRatio) {
+                this.ghostCount = 0;
+                this._current = this._current.filter(this.listenerGhostFilter,this);
+            }
+            return this._current;
+        }
+    },
+    dispatchBeforeChange: {
+        value: false,
+        writable: true
+    },
+    genericHandlerMethodName: {
+		value: "handlePropertyChange",
+        writable: true
+	}
+});
+
+module.exports.WillChangeListenersRecord = WillChangeListenersRecord;
+var WillChangeListenerSpecificHandlerMethodName = new Map();
+function WillChangeListenersRecord(name) {
+    var specificHandlerMethodName = WillChangeListenerSpecificHandlerMethodName.get(name);
+    if(!specificHandlerMethodName) {
+        specificHandlerMethodName = "handle";
+        specificHandlerMethodName += name;
+        specificHandlerMethodName += "WillChange";
+        WillChangeListenerSpecificHandlerMethodName.set(name,specificHandlerMethodName);
+    }
+    this.specificHandlerMethodName = specificHandlerMethodName;
+	return this;
+}
+WillChangeListenersRecord.prototype = new ChangeListenersRecord();
+WillChangeListenersRecord.prototype.constructor = WillChangeListenersRecord;
+WillChangeListenersRecord.prototype.genericHandlerMethodName = "handlePropertyWillChange";
@@ -0,0 +1,16 @@
+"use strict";
+
+var Map = require("./_map");
+var PropertyChanges = require("./listen/property-changes");
+var MapChanges = require("./listen/map-changes");
+
+module.exports = Map;
+
+if((global.Map === void 0) || (typeof global.Set.prototype.values !== "function")) {
+    Object.addEach(Map.prototype, PropertyChanges.prototype);
+    Object.addEach(Map.prototype, MapChanges.prototype);
+}
+else {
+    Object.defineEach(Map.prototype, PropertyChanges.prototype, false, /*configurable*/true, /*enumerable*/ false, /*writable*/true);
+    Object.defineEach(Map.prototype, MapChanges.prototype, false, /*configurable*/true, /*enumerable*/ false, /*writable*/true);
+}
@@ -1,7 +0,0 @@
-
-module.exports = describeMultiMap;
-function describeMultiMap(MultiMap, values) {
-	it("should be constructable", function () {
-		var accountsMultiMap = new MultiMap()
-	});
-};
\ No newline at end of file
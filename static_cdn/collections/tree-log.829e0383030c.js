@@ -0,0 +1,40 @@
+"use strict";
+
+module.exports = TreeLog;
+
+function TreeLog() {
+}
+
+TreeLog.ascii = {
+    intersection: "+",
+    through: "-",
+    branchUp: "+",
+    branchDown: "+",
+    fromBelow: ".",
+    fromAbove: "'",
+    fromBoth: "+",
+    strafe: "|"
+};
+
+TreeLog.unicodeRound = {
+    intersection: "\u254b",
+    through: "\u2501",
+    branchUp: "\u253b",
+    branchDown: "\u2533",
+    fromBelow: "\u256d", // round corner
+    fromAbove: "\u2570", // round corner
+    fromBoth: "\u2523",
+    strafe: "\u2503"
+};
+
+TreeLog.unicodeSharp = {
+    intersection: "\u254b",
+    through: "\u2501",
+    branchUp: "\u253b",
+    branchDown: "\u2533",
+    fromBelow: "\u250f", // sharp corner
+    fromAbove: "\u2517", // sharp corner
+    fromBoth: "\u2523",
+    strafe: "\u2503"
+};
+
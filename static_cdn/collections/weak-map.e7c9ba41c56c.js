@@ -0,0 +1,2 @@
+
+module.exports = (typeof WeakMap !== 'undefined') ? WeakMap : require("weak-map");
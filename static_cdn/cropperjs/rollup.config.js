@@ -1,48 +0,0 @@
-const { babel } = require('@rollup/plugin-babel');
-const changeCase = require('change-case');
-const createBanner = require('create-banner');
-const pkg = require('./package');
-
-pkg.name = pkg.name.replace('js', '');
-
-const name = changeCase.pascalCase(pkg.name);
-const banner = createBanner({
-  data: {
-    name: `${name}.js`,
-    year: '2015-present',
-  },
-});
-
-module.exports = {
-  input: 'src/index.js',
-  output: [
-    {
-      banner,
-      name,
-      file: `dist/${pkg.name}.js`,
-      format: 'umd',
-    },
-    {
-      banner,
-      file: `dist/${pkg.name}.common.js`,
-      format: 'cjs',
-      exports: 'auto',
-    },
-    {
-      banner,
-      file: `dist/${pkg.name}.esm.js`,
-      format: 'esm',
-    },
-    {
-      banner,
-      name,
-      file: `docs/js/${pkg.name}.js`,
-      format: 'umd',
-    },
-  ],
-  plugins: [
-    babel({
-      babelHelpers: 'bundled',
-    }),
-  ],
-};
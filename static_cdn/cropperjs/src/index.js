@@ -1,3 +0,0 @@
-import Cropper from './js/cropper';
-
-export default Cropper;